@@ -15,7 +15,7 @@ class EventAdmin(admin.ModelAdmin):
     list_display = ['title', 'event_date', 'location', 'created_by', 'created_at']
     list_filter = ['event_date', 'created_at', 'created_by']
     search_fields = ['title', 'description', 'location']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['created_at', 'updated_at', 'rsvp_count']
     date_hierarchy = 'event_date'
 
 
@@ -24,7 +24,7 @@ class AnnouncementAdmin(admin.ModelAdmin):
     list_display = ['get_display_name', 'pinned', 'is_draft', 'created_at']
     list_filter = ['pinned', 'is_draft', 'created_at']
     search_fields = ['content']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['content_html', 'excerpt', 'created_at', 'updated_at']
     
     def get_display_name(self, obj):
         """Return display_text if available, otherwise truncated content."""
@@ -0,0 +1,144 @@
+"""
+iCalendar (RFC 5545) rendering of events for calendar subscriptions.
+
+``stream_calendar`` is a generator yielding one encoded VEVENT at a time, so
+a StreamingHttpResponse over ``queryset.iterator()`` never holds the whole
+feed in memory. Recurring events are one VEVENT with an RRULE; cancelled
+instances become EXDATEs and moved ones extra VEVENTs with a RECURRENCE-ID,
+read from the ``exceptions`` the event was prefetched with.
+"""
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+
+CRLF = '\r\n'
+# Hint to clients how often to re-poll (they revalidate with ETag anyway)
+REFRESH_INTERVAL = 'PT1H'
+
+# Columns read when rendering a VEVENT
+CALENDAR_COLUMNS = (
+    'id', 'title', 'description', 'location', 'start_at', 'end_at',
+    'meeting_link', 'slides_url', 'recording_url', 'updated_at',
+    'recurrence_rule',
+)
+# Columns read from an event's exception occurrences
+CALENDAR_EXCEPTION_COLUMNS = ('id', 'event_id', 'original_start_at', 'start_at', 'end_at', 'is_cancelled')
+
+
+def escape_text(value):
+    """Escape a TEXT property value."""
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line):
+    """Fold a content line to 75 octets, continuing with CRLF + space."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + CRLF
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a UTF-8 sequence
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+        limit = 74
+    return (CRLF + ' ').join(parts) + CRLF
+
+
+def format_datetime(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _time_property(name, value, recurring):
+    # Recurrence rules expand in the project time zone (api.recurrence), so
+    # recurring events are anchored to it for clients to expand them the same way
+    zone = timezone.get_current_timezone_name()
+    if not recurring or zone == 'UTC':
+        return f'{name}:{format_datetime(value)}'
+    return f"{name};TZID={zone}:{timezone.localtime(value).strftime('%Y%m%dT%H%M%S')}"
+
+
+def render_event(event, uid_domain):
+    """Return the folded VEVENT lines for ``event`` (and its moved instances) as one string."""
+    description = event.description or ''
+    links = [
+        ('Join', event.meeting_link),
+        ('Slides', event.slides_url),
+        ('Recording', event.recording_url),
+    ]
+    links = '\n'.join(f'{label}: {url}' for label, url in links if url)
+    if links:
+        description = f'{description}\n\n{links}' if description else links
+
+    recurring = bool(event.recurrence_rule)
+    exceptions = getattr(event, 'exceptions', ()) if recurring else ()
+    uid = f'UID:event-{event.id}@{uid_domain}'
+
+    def vevent(start_at, end_at, extra=()):
+        lines = [
+            'BEGIN:VEVENT',
+            uid,
+            f'DTSTAMP:{format_datetime(event.updated_at)}',
+            f'LAST-MODIFIED:{format_datetime(event.updated_at)}',
+            _time_property('DTSTART', start_at, recurring),
+            _time_property('DTEND', end_at, recurring),
+            *extra,
+            f'SUMMARY:{escape_text(event.title)}',
+        ]
+        if description:
+            lines.append(f'DESCRIPTION:{escape_text(description)}')
+        if event.location:
+            lines.append(f'LOCATION:{escape_text(event.location)}')
+        if event.meeting_link:
+            lines.append(f'URL:{event.meeting_link}')
+        lines.append('END:VEVENT')
+        return ''.join(fold_line(line) for line in lines)
+
+    rule = []
+    if recurring:
+        rule.append(f'RRULE:{event.recurrence_rule}')
+        rule.extend(
+            _time_property('EXDATE', occurrence.original_start_at, recurring)
+            for occurrence in exceptions if occurrence.is_cancelled
+        )
+    rendered = [vevent(event.start_at, event.end_at, rule)]
+    rendered.extend(
+        vevent(occurrence.start_at, occurrence.end_at, [
+            _time_property('RECURRENCE-ID', occurrence.original_start_at, recurring)
+        ])
+        for occurrence in exceptions if not occurrence.is_cancelled
+    )
+    return ''.join(rendered)
+
+
+def calendar_header(name=None):
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:-//{escape_text(settings.CALENDAR_NAME)}//Events//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape_text(name or settings.CALENDAR_NAME)}',
+        f'REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}',
+        f'X-PUBLISHED-TTL:{REFRESH_INTERVAL}',
+    ]
+    return ''.join(fold_line(line) for line in lines)
+
+
+def stream_calendar(events, uid_domain, name=None):
+    """Yield the calendar as encoded chunks: header, one chunk per event, footer."""
+    yield calendar_header(name).encode()
+    for event in events:
+        yield render_event(event, uid_domain).encode()
+    yield fold_line('END:VCALENDAR').encode()
@@ -0,0 +1,27 @@
+from .client import (
+    ClerkClient,
+    AsyncClerkClient,
+    CircuitBreaker,
+    ClerkUnavailable,
+    get_clerk_client,
+    get_async_clerk_client,
+)
+from .jwks import (
+    ClerkJWKSCache,
+    ClerkTokenVerifier,
+    ClerkTokenError,
+    build_token_verifier,
+)
+
+__all__ = [
+    'ClerkClient',
+    'AsyncClerkClient',
+    'CircuitBreaker',
+    'ClerkUnavailable',
+    'get_clerk_client',
+    'get_async_clerk_client',
+    'ClerkJWKSCache',
+    'ClerkTokenVerifier',
+    'ClerkTokenError',
+    'build_token_verifier',
+]
@@ -0,0 +1,418 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+CLERK_API_URL = 'https://api.clerk.com/v1'
+
+
+class ClerkUnavailable(Exception):
+    """Raised when Clerk cannot be reached or the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker over a sliding time window.
+
+    closed    -> calls flow; outcomes are recorded.
+    open      -> calls fail fast until ``open_seconds`` have passed.
+    half_open -> a single trial call decides between closed and open.
+
+    ``allow()`` hands each admitted call a ticket that it passes back to
+    ``record()`` and ``release()``; only the trial's own ticket can end the
+    half-open state, so calls admitted earlier cannot decide it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    # Ticket for calls admitted while closed
+    PASS = object()
+
+    def __init__(self, error_rate=0.5, min_calls=5, window_seconds=30, open_seconds=30):
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self.opened_at = None
+        self.transitions = 0
+        self._outcomes = deque()
+        self._trial = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return a ticket if a call may proceed, otherwise None."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return self.PASS
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.open_seconds:
+                    return None
+                self._transition(self.HALF_OPEN)
+            if self._trial is not None:
+                return None
+            self._trial = object()
+            return self._trial
+
+    def record(self, success, ticket):
+        """Record the outcome of a call that ``allow()`` let through with ``ticket``."""
+        with self._lock:
+            now = time.monotonic()
+            if ticket is not self.PASS:
+                if ticket is self._trial:
+                    self._trial = None
+                    self._outcomes.clear()
+                    if success:
+                        self._transition(self.CLOSED)
+                    else:
+                        self._open(now)
+                return
+            if self.state != self.CLOSED:
+                # Admitted before the breaker opened; the trial decides now
+                return
+
+            self._outcomes.append((now, success))
+            while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+                self._outcomes.popleft()
+
+            calls = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if calls >= self.min_calls and failures / calls >= self.error_rate:
+                self._outcomes.clear()
+                self._open(now)
+
+    def release(self, ticket):
+        """
+        End the trial ``ticket`` belongs to if it finished without
+        ``record()`` (the call raised something unexpected), so the next call
+        can be the trial. A no-op for any other ticket.
+        """
+        with self._lock:
+            if ticket is self._trial:
+                self._trial = None
+
+    def _open(self, now):
+        self.opened_at = now
+        self._transition(self.OPEN)
+
+    def _transition(self, state):
+        if state != self.state:
+            logger.warning("Clerk circuit breaker %s -> %s", self.state, state)
+            self.state = state
+            self.transitions += 1
+
+
+class _BaseClerkClient:
+    """Configuration, circuit breaker and metrics shared by the sync and async clients."""
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_url=CLERK_API_URL, secret_key=None, connect_timeout=2.0,
+                 read_timeout=3.0, retries=2, backoff=0.2, pool_size=10, breaker=None):
+        self.base_url = base_url.rstrip('/')
+        self.secret_key = secret_key
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.breaker = breaker or CircuitBreaker()
+
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._retries = 0
+        self._short_circuited = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latencies = deque(maxlen=512)
+
+    def _url(self, path_or_url):
+        return path_or_url if '://' in path_or_url else f"{self.base_url}/{path_or_url.lstrip('/')}"
+
+    def _auth_headers(self):
+        return {'Authorization': f'Bearer {self.secret_key}'} if self.secret_key else {}
+
+    def _check_breaker(self):
+        ticket = self.breaker.allow()
+        if ticket is None:
+            with self._stats_lock:
+                self._short_circuited += 1
+            raise ClerkUnavailable("Clerk circuit breaker is open")
+        return ticket
+
+    def _backoff_delay(self, attempt):
+        with self._stats_lock:
+            self._retries += 1
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def _observe(self, elapsed, error):
+        with self._stats_lock:
+            self._requests += 1
+            self._errors += int(error)
+            self._latency_total += elapsed
+            self._latency_max = max(self._latency_max, elapsed)
+            self._latencies.append(elapsed)
+        logger.debug("Clerk request took %.1fms (error=%s)", elapsed * 1000, error)
+
+    def metrics(self):
+        """Return latency, error and breaker-state metrics for this process."""
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+            return {
+                'requests': self._requests,
+                'errors': self._errors,
+                'retries': self._retries,
+                'short_circuited': self._short_circuited,
+                'latency_avg_ms': round(self._latency_total / self._requests * 1000, 2) if self._requests else 0.0,
+                'latency_p95_ms': round(p95 * 1000, 2),
+                'latency_max_ms': round(self._latency_max * 1000, 2),
+                'breaker_state': self.breaker.state,
+                'breaker_transitions': self.breaker.transitions,
+            }
+
+
+class ClerkClient(_BaseClerkClient):
+    """
+    Shared HTTP client for every outbound call to Clerk.
+
+    Uses one pooled keep-alive ``requests.Session`` per process, tight
+    connect/read timeouts, bounded retries with jittered backoff for
+    transient failures and a circuit breaker that fails fast while Clerk is
+    unhealthy.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self._auth_headers())
+
+    def get(self, path_or_url, **kwargs):
+        """GET a Clerk endpoint and return the response (any non-retryable status)."""
+        return self.request('GET', path_or_url, **kwargs)
+
+    def request(self, method, path_or_url, **kwargs):
+        """
+        Send a request through the breaker, retrying transient failures.
+        Raises ClerkUnavailable when the breaker is open or retries run out.
+        """
+        url = self._url(path_or_url)
+        kwargs.setdefault('timeout', (self.connect_timeout, self.read_timeout))
+        ticket = self._check_breaker()
+
+        try:
+            last_error = None
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    time.sleep(self._backoff_delay(attempt))
+
+                started = time.perf_counter()
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except requests.RequestException as e:
+                    self._observe(time.perf_counter() - started, error=True)
+                    last_error = e
+                    continue
+
+                self._observe(time.perf_counter() - started, error=response.status_code >= 500)
+                if response.status_code in self.RETRY_STATUSES:
+                    last_error = ClerkUnavailable(f"Clerk returned HTTP {response.status_code}")
+                    continue
+
+                self.breaker.record(success=True, ticket=ticket)
+                return response
+
+            self.breaker.record(success=False, ticket=ticket)
+            raise ClerkUnavailable(f"Clerk request failed: {last_error}") from last_error
+        finally:
+            # A no-op unless this was the half-open trial and it raised
+            # something other than a transport error
+            self.breaker.release(ticket)
+
+    def get_jwks(self, url=None):
+        """Fetch the instance JSON Web Key Set."""
+        if url:
+            response = self.request('GET', url, headers={'Authorization': None})
+        else:
+            response = self.get('jwks')
+        response.raise_for_status()
+        return response.json()
+
+    def get_user(self, user_id):
+        """Fetch a Clerk user object, or None if it does not exist."""
+        response = self.get(f'users/{user_id}')
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncClerkClient(_BaseClerkClient):
+    """
+    Async twin of ClerkClient built on a pooled ``httpx.AsyncClient``.
+    Used by the auth middleware when it runs under ASGI so JWKS refreshes and
+    profile fetches never block the event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.http = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+        )
+
+    async def get(self, path_or_url, **kwargs):
+        """GET a Clerk endpoint and return the response (any non-retryable status)."""
+        return await self.request('GET', path_or_url, **kwargs)
+
+    async def aclose(self):
+        """Close the connection pool."""
+        await self.http.aclose()
+
+    async def request(self, method, path_or_url, headers=None, **kwargs):
+        """Async equivalent of ClerkClient.request."""
+        url = self._url(path_or_url)
+        request_headers = self._auth_headers()
+        request_headers.update(headers or {})
+        request_headers = {k: v for k, v in request_headers.items() if v is not None}
+        ticket = self._check_breaker()
+
+        try:
+            last_error = None
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+
+                started = time.perf_counter()
+                try:
+                    response = await self.http.request(method, url, headers=request_headers, **kwargs)
+                except httpx.HTTPError as e:
+                    self._observe(time.perf_counter() - started, error=True)
+                    last_error = e
+                    continue
+
+                self._observe(time.perf_counter() - started, error=response.status_code >= 500)
+                if response.status_code in self.RETRY_STATUSES:
+                    last_error = ClerkUnavailable(f"Clerk returned HTTP {response.status_code}")
+                    continue
+
+                self.breaker.record(success=True, ticket=ticket)
+                return response
+
+            self.breaker.record(success=False, ticket=ticket)
+            raise ClerkUnavailable(f"Clerk request failed: {last_error}") from last_error
+        finally:
+            # A no-op unless this was the half-open trial and it raised
+            # something other than a transport error
+            self.breaker.release(ticket)
+
+    async def get_jwks(self, url=None):
+        """Fetch the instance JSON Web Key Set."""
+        if url:
+            response = await self.request('GET', url, headers={'Authorization': None})
+        else:
+            response = await self.get('jwks')
+        response.raise_for_status()
+        return response.json()
+
+    async def get_user(self, user_id):
+        """Fetch a Clerk user object, or None if it does not exist."""
+        response = await self.get(f'users/{user_id}')
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+_async_client = None
+_async_client_loop = None
+_closing = set()
+
+
+def get_clerk_client():
+    """Return this process's ClerkClient, creating it on first use (fork safe)."""
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                _client = ClerkClient(
+                    secret_key=settings.CLERK_SECRET_KEY,
+                    connect_timeout=settings.CLERK_HTTP_CONNECT_TIMEOUT,
+                    read_timeout=settings.CLERK_HTTP_READ_TIMEOUT,
+                    retries=settings.CLERK_HTTP_RETRIES,
+                    pool_size=settings.CLERK_HTTP_POOL_SIZE,
+                    breaker=CircuitBreaker(
+                        error_rate=settings.CLERK_BREAKER_ERROR_RATE,
+                        min_calls=settings.CLERK_BREAKER_MIN_CALLS,
+                        window_seconds=settings.CLERK_BREAKER_WINDOW_SECONDS,
+                        open_seconds=settings.CLERK_BREAKER_OPEN_SECONDS,
+                    ),
+                )
+                _client_pid = pid
+    return _client
+
+
+def get_async_clerk_client():
+    """
+    Return the AsyncClerkClient for the running event loop.
+    It shares the sync client's circuit breaker, so both see Clerk's health.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        if _async_client is not None:
+            _close_async_client(_async_client, _async_client_loop, loop)
+        sync_client = get_clerk_client()
+        _async_client = AsyncClerkClient(
+            secret_key=settings.CLERK_SECRET_KEY,
+            connect_timeout=settings.CLERK_HTTP_CONNECT_TIMEOUT,
+            read_timeout=settings.CLERK_HTTP_READ_TIMEOUT,
+            retries=settings.CLERK_HTTP_RETRIES,
+            pool_size=settings.CLERK_HTTP_POOL_SIZE,
+            breaker=sync_client.breaker,
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+def _close_async_client(client, client_loop, loop):
+    """
+    Close an AsyncClerkClient being replaced for a new event loop. Its pool
+    is closed on its own loop while that loop still runs; otherwise on the
+    current one, where only the sockets are left to release.
+    """
+    if client_loop.is_running() and not client_loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+        return
+
+    async def close():
+        try:
+            await client.aclose()
+        except Exception:
+            logger.debug("Error closing a replaced Clerk client", exc_info=True)
+
+    # Keep a reference until it finishes, or the task may be collected
+    task = loop.create_task(close())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
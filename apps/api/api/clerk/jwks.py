@@ -0,0 +1,217 @@
+import logging
+import threading
+import time
+
+import jwt
+from django.conf import settings
+
+from .client import get_clerk_client, get_async_clerk_client
+
+
+logger = logging.getLogger(__name__)
+
+
+class ClerkTokenError(Exception):
+    """Raised when a Clerk session token cannot be verified."""
+
+
+class ClerkJWKSCache:
+    """
+    Cache of Clerk's JSON Web Key Set.
+
+    Keys are fetched once and reused until ``max_age`` elapses. A token signed
+    with an unknown ``kid`` forces an early refresh (at most once every
+    ``min_refresh_interval`` seconds) so key rotation is picked up without
+    letting garbage tokens hammer the JWKS endpoint.
+    """
+
+    def __init__(self, fetch_jwks, max_age=3600, min_refresh_interval=30, afetch_jwks=None):
+        self._fetch_jwks = fetch_jwks
+        self._afetch_jwks = afetch_jwks
+        self.max_age = max_age
+        self.min_refresh_interval = min_refresh_interval
+        self._keys = {}
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def get_key(self, kid):
+        """Return the public key for ``kid``, refreshing the key set if needed."""
+        if self._needs_refresh(kid):
+            self.refresh()
+        return self._lookup(kid)
+
+    async def aget_key(self, kid):
+        """Async variant of get_key; refreshes through the async fetcher if one is set."""
+        if self._needs_refresh(kid):
+            if self._afetch_jwks is None:
+                self.refresh()
+            else:
+                self._load(await self._afetch_jwks_or_none())
+        return self._lookup(kid)
+
+    def _needs_refresh(self, kid):
+        now = time.monotonic()
+        if self._fetched_at is None or now - self._fetched_at >= self.max_age:
+            return True
+        return kid not in self._keys and now - self._fetched_at >= self.min_refresh_interval
+
+    def _lookup(self, kid):
+        key = self._keys.get(kid)
+        if key is None:
+            raise ClerkTokenError(f"Unknown signing key: {kid}")
+        return key
+
+    async def _afetch_jwks_or_none(self):
+        try:
+            return await self._afetch_jwks()
+        except Exception as e:
+            if not self._keys:
+                raise
+            logger.warning("JWKS refresh failed, keeping %d cached keys: %s", len(self._keys), e)
+            return None
+
+    def refresh(self):
+        """
+        Fetch the key set and replace the cached keys.
+        If the fetch fails but keys are already cached, the stale keys stay in
+        use so tokens keep verifying while Clerk is unavailable.
+        """
+        with self._lock:
+            try:
+                jwks = self._fetch_jwks()
+            except Exception as e:
+                if not self._keys:
+                    raise
+                logger.warning("JWKS refresh failed, keeping %d cached keys: %s", len(self._keys), e)
+                jwks = None
+        self._load(jwks)
+
+    def set_keys(self, jwks):
+        """Load a key set directly (e.g. from a local file), bypassing the fetcher."""
+        self._load(jwks)
+
+    def _load(self, jwks):
+        # A None key set means the refresh failed; keep the stale keys for now
+        if jwks is not None:
+            key_set = jwt.PyJWKSet.from_dict(jwks)
+            self._keys = {key.key_id: key.key for key in key_set.keys if key.key_id}
+            logger.info("Loaded %d Clerk signing keys", len(self._keys))
+        self._fetched_at = time.monotonic()
+
+
+class ClerkTokenVerifier:
+    """
+    Verify Clerk session JWTs locally.
+
+    Tokens are checked against either a static PEM public key (``jwt_key``,
+    Clerk's networkless verification) or the instance's JWKS. Once the keys
+    are cached, verification makes no network calls.
+    """
+
+    algorithms = ['RS256']
+
+    def __init__(self, jwks_cache=None, jwt_key=None, issuer=None,
+                 authorized_parties=None, leeway=5):
+        if jwks_cache is None and jwt_key is None:
+            raise ValueError("Either a JWKS cache or a static JWT key is required.")
+        self.jwks_cache = jwks_cache
+        self.jwt_key = jwt_key
+        self.issuer = issuer
+        self.authorized_parties = set(authorized_parties or [])
+        self.leeway = leeway
+
+    def verify(self, token):
+        """Return the verified claims of ``token`` or raise ClerkTokenError."""
+        header = self._header(token)
+        if self.jwt_key is not None:
+            key = self.jwt_key
+        else:
+            key = self.jwks_cache.get_key(header.get('kid'))
+        return self._decode(token, key)
+
+    async def averify(self, token):
+        """Async variant of verify; only a JWKS refresh ever awaits."""
+        header = self._header(token)
+        if self.jwt_key is not None:
+            key = self.jwt_key
+        else:
+            key = await self.jwks_cache.aget_key(header.get('kid'))
+        return self._decode(token, key)
+
+    def _header(self, token):
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as e:
+            raise ClerkTokenError(f"Malformed token: {e}") from e
+
+        if header.get('alg') not in self.algorithms:
+            raise ClerkTokenError(f"Unsupported algorithm: {header.get('alg')}")
+        return header
+
+    def _decode(self, token, key):
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=self.algorithms,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={
+                    'require': ['exp', 'iat', 'sub'],
+                    'verify_aud': False,
+                    'verify_iss': bool(self.issuer),
+                },
+            )
+        except jwt.PyJWTError as e:
+            raise ClerkTokenError(f"Invalid token: {e}") from e
+
+        azp = claims.get('azp')
+        if self.authorized_parties and azp and azp not in self.authorized_parties:
+            raise ClerkTokenError(f"Unauthorized party: {azp}")
+
+        return claims
+
+    @staticmethod
+    def user_data_from_claims(claims):
+        """Map Clerk session claims to the user data used by the middleware."""
+        first_name = claims.get('first_name') or ''
+        last_name = claims.get('last_name') or ''
+        return {
+            'user_id': claims['sub'],
+            'session_id': claims.get('sid'),
+            'email': claims.get('email') or claims.get('primary_email_address'),
+            'first_name': first_name,
+            'last_name': last_name,
+            'full_name': claims.get('full_name') or claims.get('name') or f"{first_name} {last_name}".strip(),
+            'expires_at': claims['exp'],
+        }
+
+
+def fetch_clerk_jwks():
+    """Fetch the instance JWKS from Clerk (or ``CLERK_JWKS_URL`` if configured)."""
+    return get_clerk_client().get_jwks(settings.CLERK_JWKS_URL)
+
+
+async def afetch_clerk_jwks():
+    """Async variant of fetch_clerk_jwks."""
+    return await get_async_clerk_client().get_jwks(settings.CLERK_JWKS_URL)
+
+
+def build_token_verifier():
+    """Build a token verifier from Django settings."""
+    jwt_key = settings.CLERK_JWT_KEY
+    jwks_cache = None
+    if not jwt_key:
+        jwks_cache = ClerkJWKSCache(
+            fetch_clerk_jwks,
+            max_age=settings.CLERK_JWKS_CACHE_SECONDS,
+            afetch_jwks=afetch_clerk_jwks,
+        )
+
+    return ClerkTokenVerifier(
+        jwks_cache=jwks_cache,
+        jwt_key=jwt_key,
+        issuer=settings.CLERK_ISSUER,
+        authorized_parties=settings.CLERK_AUTHORIZED_PARTIES,
+        leeway=settings.CLERK_JWT_LEEWAY_SECONDS,
+    )
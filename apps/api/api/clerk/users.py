@@ -0,0 +1,43 @@
+from .client import get_clerk_client, get_async_clerk_client
+
+
+def fetch_clerk_user_profile(user_id):
+    """
+    Fetch a user's profile from the Clerk Backend API.
+    Returns a profile dict, or None if the user does not exist.
+    """
+    user_data = get_clerk_client().get_user(user_id)
+    if user_data is None:
+        return None
+    return profile_from_clerk_user(user_data)
+
+
+async def afetch_clerk_user_profile(user_id):
+    """Async variant of fetch_clerk_user_profile."""
+    user_data = await get_async_clerk_client().get_user(user_id)
+    if user_data is None:
+        return None
+    return profile_from_clerk_user(user_data)
+
+
+def profile_from_clerk_user(user_data):
+    """Map a Clerk user object to the profile fields stored on User."""
+    first_name = user_data.get('first_name') or ''
+    last_name = user_data.get('last_name') or ''
+
+    email = None
+    primary_id = user_data.get('primary_email_address_id')
+    addresses = user_data.get('email_addresses') or []
+    for address in addresses:
+        if address.get('id') == primary_id:
+            email = address.get('email_address')
+            break
+    if email is None and addresses:
+        email = addresses[0].get('email_address')
+
+    return {
+        'email': email,
+        'first_name': first_name,
+        'last_name': last_name,
+        'full_name': f"{first_name} {last_name}".strip(),
+    }
@@ -0,0 +1,60 @@
+"""
+Conditional GET (ETag / Last-Modified / 304) for public read endpoints.
+
+A view is decorated with a *data version* function returning
+``(token, last_modified)`` for the table(s) behind it, computed from a couple
+of aggregate queries (e.g. ``max(updated_at)`` and ``count``). When the
+client's validators still match, the view is never called, so neither the
+list query nor serialization runs.
+"""
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def _validators(version):
+    token, last_modified = version
+    etag = quote_etag(hashlib.sha1(str(token).encode()).hexdigest()[:20])
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return etag, timestamp
+
+
+def _apply_validators(response, etag, timestamp):
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        # Cacheable, but always revalidated with the validators above
+        response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def conditional(data_version):
+    """Decorate a GET view (sync or async) with version-based conditional GET."""
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view(request, *args, **kwargs)
+                etag, timestamp = _validators(await sync_to_async(data_version)())
+                response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                return _apply_validators(response, etag, timestamp)
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            etag, timestamp = _validators(data_version())
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            return _apply_validators(response, etag, timestamp)
+        return wrapper
+    return decorator
@@ -0,0 +1,13 @@
+from .webhook import (
+    DiscordWebhookClient,
+    DiscordError,
+    DiscordRateLimited,
+    build_webhook_client,
+)
+
+__all__ = [
+    'DiscordWebhookClient',
+    'DiscordError',
+    'DiscordRateLimited',
+    'build_webhook_client',
+]
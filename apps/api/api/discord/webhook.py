@@ -0,0 +1,151 @@
+import logging
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+# Discord rejects message content longer than this
+MESSAGE_MAX_LENGTH = 2000
+
+
+class DiscordError(Exception):
+    """Raised when Discord rejects a webhook call or cannot be reached."""
+
+    def __init__(self, message, status=None, retryable=False):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+
+
+class DiscordRateLimited(DiscordError):
+    """Raised on HTTP 429; ``retry_after`` is how long Discord asked us to wait, in seconds."""
+
+    def __init__(self, retry_after, is_global=False):
+        super().__init__(f"Rate limited by Discord for {retry_after:.2f}s", status=429, retryable=True)
+        self.retry_after = retry_after
+        self.is_global = is_global
+
+
+class DiscordWebhookClient:
+    """
+    Client for one Discord webhook (``.../webhooks/<id>/<token>``).
+
+    Tracks the webhook's rate-limit bucket from the ``X-RateLimit-*`` headers
+    of every response and waits out an exhausted bucket before the next call,
+    so a drained batch does not run into 429s. A 429 is not retried here; it
+    raises DiscordRateLimited for the caller to reschedule. Any base URL
+    works, so a local stub server can stand in for Discord.
+    """
+
+    def __init__(self, webhook_url, connect_timeout=3.0, read_timeout=10.0, max_bucket_wait=30.0):
+        self.webhook_url = webhook_url.rstrip('/')
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_bucket_wait = max_bucket_wait
+        self._bucket_reset_at = 0.0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @staticmethod
+    def render(content):
+        """Message body for an announcement's content, cut to Discord's limit."""
+        if len(content) <= MESSAGE_MAX_LENGTH:
+            return content
+        return content[:MESSAGE_MAX_LENGTH - 3] + '...'
+
+    def create_message(self, content):
+        """Post a message and return its id."""
+        response = self._request('POST', self.webhook_url, params={'wait': 'true'}, json=self._payload(content))
+        return str(response.json()['id'])
+
+    def edit_message(self, message_id, content):
+        """Edit a message. Returns False if it no longer exists."""
+        response = self._request(
+            'PATCH', f'{self.webhook_url}/messages/{message_id}', json=self._payload(content), missing_ok=True
+        )
+        return response.status_code != 404
+
+    def delete_message(self, message_id):
+        """Delete a message. A message that is already gone counts as deleted."""
+        self._request('DELETE', f'{self.webhook_url}/messages/{message_id}', missing_ok=True)
+
+    def _payload(self, content):
+        # Announcements are plain posts; never let their text ping anyone
+        return {'content': self.render(content), 'allowed_mentions': {'parse': []}}
+
+    def _request(self, method, url, missing_ok=False, **kwargs):
+        self._wait_for_bucket()
+        kwargs.setdefault('timeout', (self.connect_timeout, self.read_timeout))
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            raise DiscordError(f"Discord request failed: {e}", retryable=True) from e
+
+        self._update_bucket(response)
+        status = response.status_code
+        if status == 429:
+            raise self._rate_limited(response)
+        if status == 404 and missing_ok:
+            return response
+        if status >= 500:
+            raise DiscordError(f"Discord returned HTTP {status}", status=status, retryable=True)
+        if status >= 400:
+            raise DiscordError(f"Discord returned HTTP {status}: {response.text[:200]}", status=status)
+        return response
+
+    def _wait_for_bucket(self):
+        delay = self._bucket_reset_at - time.monotonic()
+        if delay <= 0:
+            return
+        if delay > self.max_bucket_wait:
+            raise DiscordRateLimited(delay)
+        logger.debug("Discord rate-limit bucket exhausted; waiting %.2fs", delay)
+        time.sleep(delay)
+
+    def _update_bucket(self, response):
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        if remaining is None or reset_after is None:
+            return
+        try:
+            if int(remaining) <= 0:
+                self._bucket_reset_at = time.monotonic() + float(reset_after)
+        except ValueError:
+            pass
+
+    def _rate_limited(self, response):
+        retry_after = None
+        is_global = response.headers.get('X-RateLimit-Global', '').lower() == 'true'
+        try:
+            body = response.json()
+            retry_after = float(body['retry_after'])
+            is_global = is_global or bool(body.get('global'))
+        except (ValueError, KeyError, TypeError):
+            pass
+        if retry_after is None:
+            try:
+                retry_after = float(response.headers.get('Retry-After', '1'))
+            except ValueError:
+                retry_after = 1.0
+        self._bucket_reset_at = max(self._bucket_reset_at, time.monotonic() + retry_after)
+        logger.warning("Discord rate limited the webhook for %.2fs (global=%s)", retry_after, is_global)
+        return DiscordRateLimited(retry_after, is_global=is_global)
+
+
+def build_webhook_client(webhook_url=None):
+    """Build a webhook client from Django settings (None if no webhook is configured)."""
+    webhook_url = webhook_url or settings.DISCORD_WEBHOOK_URL
+    if not webhook_url:
+        return None
+    return DiscordWebhookClient(
+        webhook_url,
+        connect_timeout=settings.DISCORD_HTTP_CONNECT_TIMEOUT,
+        read_timeout=settings.DISCORD_HTTP_READ_TIMEOUT,
+    )
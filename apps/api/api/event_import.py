@@ -0,0 +1,90 @@
+"""
+Bulk event import from CSV or NDJSON.
+
+Both formats carry EventCreateSerializer's fields (title, description,
+location, start_at, end_at, meeting_link, slides_url, recording_url,
+recurrence_rule), one event per CSV record or NDJSON line. Rows are
+validated by a single EventCreateSerializer reused for every row, the way
+``many=True`` validates a list, but collecting each row's errors instead of
+rejecting the whole batch; valid rows are then inserted together by
+EventService.bulk_create_events.
+"""
+import csv
+import io
+import json
+
+from rest_framework import serializers
+
+from api.serializers import EventCreateSerializer
+
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+class EventImportError(ValueError):
+    """Raised for an import that cannot be read at all."""
+
+
+def detect_format(filename='', content_type=''):
+    """Guess the import format from a file name or content type (None if unknown)."""
+    filename, content_type = (filename or '').lower(), (content_type or '').lower()
+    if filename.endswith('.csv') or 'csv' in content_type:
+        return 'csv'
+    if filename.endswith(('.ndjson', '.jsonl')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'ndjson'
+    return None
+
+
+def parse_rows(content, fmt):
+    """
+    Return ``(row number, data)`` pairs, numbered from 1 (a CSV header is not
+    a row). Empty CSV cells count as not given; a line that is not a JSON
+    object has ``None`` as its data.
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise EventImportError(f"Unknown format '{fmt}'. Expected one of: {', '.join(IMPORT_FORMATS)}")
+    if isinstance(content, bytes):
+        try:
+            content = content.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise EventImportError("Import files must be UTF-8.")
+
+    if fmt == 'csv':
+        reader = csv.DictReader(io.StringIO(content))
+        if not reader.fieldnames:
+            return []
+        return [
+            (number, {key.strip(): value for key, value in record.items() if key and value not in (None, '')})
+            for number, record in enumerate(reader, start=1)
+        ]
+
+    rows = []
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            data = None
+        rows.append((len(rows) + 1, data if isinstance(data, dict) else None))
+    return rows
+
+
+def validate_rows(rows):
+    """
+    Validate ``(row number, data)`` pairs against EventCreateSerializer.
+    Returns ``(valid, errors)``: the validated data of every good row, and
+    ``{'row': n, 'errors': {...}}`` for every bad one.
+    """
+    serializer = EventCreateSerializer()
+    valid, errors = [], []
+    for number, data in rows:
+        if data is None:
+            errors.append({'row': number, 'errors': {'non_field_errors': ['Row is not a JSON object.']}})
+            continue
+        try:
+            valid.append(serializer.run_validation(data))
+        except serializers.ValidationError as e:
+            detail = e.detail if isinstance(e.detail, dict) else {'non_field_errors': e.detail}
+            errors.append({'row': number, 'errors': detail})
+    return valid, errors
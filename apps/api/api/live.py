@@ -0,0 +1,184 @@
+"""
+Live change notifications for ``/api/stream/`` (Server-Sent Events).
+
+The service layer calls ``notify`` as announcements, events and RSVPs
+change; once the transaction commits, the process-wide ``broadcaster``
+encodes the message once and hands it to every open stream. Messages are
+small notices (``{"id": 12}``, etc.); clients refetch what they need.
+
+The broadcaster keeps the last STREAM_BUFFER_SIZE messages, so a client
+reconnecting with ``Last-Event-ID`` (or ``?last_event_id=``) gets what it
+missed. Ids are ``<epoch>-<sequence>``, where the epoch is fixed per
+process; an id from another epoch, or one older than the buffer, gets a
+``reset`` message telling the client to refetch everything instead.
+
+Streams are only served under ASGI (ASYNC_PUBLIC_VIEWS); under WSGI the
+endpoint answers 503. Fan-out is in-process: a stream only sees changes made
+by the process serving it. Serve the API from the ASGI server (one event loop, where each
+open stream is a parked coroutine rather than a worker) and run writers in
+that same process for complete coverage; changes from other processes
+(management commands, a separate WSGI deployment) are not pushed.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+# ?topics= names -> prefixes of the message names they cover
+TOPICS = {
+    'announcements': 'announcement.',
+    'events': 'event.',
+    'rsvps': 'rsvp.',
+}
+
+
+class StreamMessage:
+    """One broadcast message, already encoded in SSE wire format."""
+
+    __slots__ = ('id', 'sequence', 'event', 'payload')
+
+    def __init__(self, id, sequence, event, data):
+        self.id = id
+        self.sequence = sequence
+        self.event = event
+        self.payload = f'id: {id}\nevent: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n'
+
+
+def parse_topics(value):
+    """Message-name prefixes for a ``?topics=`` value (None = everything)."""
+    if not value:
+        return None
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in TOPICS]
+    if unknown:
+        raise ValueError(f"Unknown topic(s): {', '.join(unknown)}. Expected any of: {', '.join(TOPICS)}")
+    return tuple(TOPICS[name] for name in names)
+
+
+class Subscription:
+    """
+    One open stream: an asyncio queue on the stream's event loop. Messages
+    may be published from any thread, so they are handed over with
+    ``call_soon_threadsafe``. A subscriber that falls more than
+    ``max_pending`` messages behind is closed (``None`` is queued) and
+    catches up from the buffer when it reconnects.
+    """
+
+    def __init__(self, loop, topics=None, max_pending=256):
+        self.loop = loop
+        self.topics = topics
+        self.max_pending = max_pending
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    def wants(self, message):
+        return self.topics is None or message.event.startswith(self.topics)
+
+    def deliver(self, message):
+        if self.closed or not self.wants(message):
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # The stream's event loop has shut down
+            self.closed = True
+
+    def _put(self, message):
+        if self.closed:
+            return
+        if self.queue.qsize() >= self.max_pending:
+            self.closed = True
+            message = None
+        self.queue.put_nowait(message)
+
+
+class Broadcaster:
+    """In-process fan-out of StreamMessages with a replay buffer."""
+
+    def __init__(self, buffer_size=1000, max_pending=256):
+        self.epoch = format(time.time_ns() // 1000, 'x')
+        self.max_pending = max_pending
+        self._sequence = 0
+        self._buffer = deque(maxlen=buffer_size)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    @property
+    def last_id(self):
+        return f'{self.epoch}-{self._sequence}'
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def publish(self, event, data):
+        """Encode and buffer a message, then hand it to every subscriber."""
+        with self._lock:
+            self._sequence += 1
+            message = StreamMessage(f'{self.epoch}-{self._sequence}', self._sequence, event, data)
+            self._buffer.append(message)
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.deliver(message)
+        return message
+
+    def subscribe(self, last_event_id=None, topics=None):
+        """
+        Register a stream on the running event loop. Returns
+        ``(subscription, replay, reset)``: the buffered messages after
+        ``last_event_id``, and whether the client must refetch everything
+        because they are no longer all available.
+        """
+        subscription = Subscription(asyncio.get_running_loop(), topics, self.max_pending)
+        with self._lock:
+            # Replay and registration happen under one lock, so nothing
+            # published in between is missed or sent twice
+            replay, reset = self._since(last_event_id)
+            self._subscribers.add(subscription)
+        return subscription, [message for message in replay if subscription.wants(message)], reset
+
+    def unsubscribe(self, subscription):
+        subscription.closed = True
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def _since(self, last_event_id):
+        if not last_event_id:
+            return [], False
+        epoch, _, sequence = last_event_id.partition('-')
+        try:
+            sequence = int(sequence)
+        except ValueError:
+            return [], True
+        if epoch != self.epoch or sequence > self._sequence:
+            return [], True
+        oldest = self._buffer[0].sequence if self._buffer else self._sequence + 1
+        if sequence < oldest - 1:
+            return [], True
+        return [message for message in self._buffer if message.sequence > sequence], False
+
+
+broadcaster = Broadcaster(
+    buffer_size=settings.STREAM_BUFFER_SIZE,
+    max_pending=settings.STREAM_MAX_PENDING,
+)
+
+
+def notify(event, data):
+    """Broadcast ``event`` once the current transaction commits (at once outside one)."""
+    def publish():
+        try:
+            broadcaster.publish(event, data)
+        except Exception:
+            logger.exception("Failed to broadcast %s", event)
+
+    transaction.on_commit(publish)
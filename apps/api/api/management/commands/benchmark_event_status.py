@@ -0,0 +1,74 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework import serializers
+
+from api.models import Event
+from api.serializers import EventSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare EventSerializer list serialization of in-memory events with '
+        'status computed per field (the old behaviour: one clock read per '
+        'status-derived field) against a status annotated once per query.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        offset = options['events'] // 2
+        events = [
+            Event(
+                id=i,
+                title=f'Event {i}',
+                location='Room 101',
+                start_at=now + timedelta(hours=i - offset),
+                end_at=now + timedelta(hours=i - offset + 2),
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(options['events'])
+        ]
+        for event in events:
+            event.rsvp_count = 0
+
+        modes = (
+            ('per-field status', serializers.ModelSerializer.to_representation, False),
+            ('annotated status', EventSerializer.to_representation, True),
+        )
+        self.stdout.write(f"{'mode':18} {'best s':>9} {'rows/s':>11} {'clock reads':>12}")
+        for label, to_representation, annotated in modes:
+            for event in events:
+                if annotated:
+                    event.computed_status = Event.status_at(event.start_at, event.end_at, now)
+                else:
+                    event.__dict__.pop('computed_status', None)
+
+            best, reads = self._run(events, to_representation, options['repeat'])
+            self.stdout.write(f"{label:18} {best:9.3f} {len(events) / best:11.0f} {reads:12d}")
+
+    def _run(self, events, to_representation, repeat):
+        real_now = timezone.now
+        reads = 0
+
+        def counting_now():
+            nonlocal reads
+            reads += 1
+            return real_now()
+
+        best = float('inf')
+        with mock.patch('api.models.event.timezone.now', counting_now), \
+                mock.patch.object(EventSerializer, 'to_representation', to_representation):
+            for _ in range(repeat):
+                reads = 0
+                started = time.perf_counter()
+                EventSerializer(events, many=True).data
+                best = min(best, time.perf_counter() - started)
+        return best, reads
@@ -0,0 +1,63 @@
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve
+
+from api.response_cache import invalidate_responses
+
+
+DEFAULT_URLS = (
+    '/api/events/',
+    '/api/events/?fields=id,title,start_at,end_at,location,status',
+    '/api/events/?fields=id,title,start_at,status&expand=created_by',
+    '/api/events/upcoming/',
+    '/api/events/upcoming/?fields=id,title,start_at,location',
+    '/api/announcements/',
+    '/api/announcements/?fields=id,display_text,pinned,created_at',
+    '/api/officers/',
+    '/api/officers/?fields=id,name,position,order_index',
+    '/api/officers/?fields=id,name,position,image_url',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure response size and uncached latency of read endpoints, by '
+        'default comparing full output against ?fields= / ?expand= variants.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', action='append', dest='urls',
+                            help='Endpoint path with query string (repeatable).')
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        self.stdout.write(f"{'endpoint':72} {'bytes':>9} {'median ms':>10} {'p95 ms':>8}")
+        for url in options['urls'] or DEFAULT_URLS:
+            try:
+                match = resolve(urlsplit(url).path)
+            except Resolver404:
+                raise CommandError(f'{url}: no such endpoint')
+
+            timings = []
+            for _ in range(options['repeat']):
+                # Measure the query and serialization, not a response cache hit
+                invalidate_responses('events', 'feed')
+                request = factory.get(url)
+                started = time.perf_counter()
+                response = match.func(request, *match.args, **match.kwargs)
+                if hasattr(response, 'render'):
+                    response.render()
+                timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f'{url}: HTTP {response.status_code} {response.content[:200]!r}')
+
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f"{url:72} {len(response.content):9d} {statistics.median(timings):10.2f} {p95:8.2f}"
+            )
@@ -0,0 +1,90 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from api.middleware.route_policies import (
+    SYSTEM,
+    PUBLIC_WRITE,
+    OFFICER_ONLY,
+    compile_route_policies,
+)
+
+
+SAMPLE_PATHS = [
+    ('GET', '/api/events/'),
+    ('GET', '/api/events/upcoming/'),
+    ('GET', '/api/events/42/'),
+    ('POST', '/api/events/42/rsvp/'),
+    ('GET', '/api/events/42/rsvps/'),
+    ('PATCH', '/api/events/42/update/'),
+    ('GET', '/api/announcements/'),
+    ('PATCH', '/api/announcements/7/pin/'),
+    ('GET', '/api/officers/'),
+    ('GET', '/api/users/me/'),
+    ('GET', '/api/rsvps/stats/'),
+    ('GET', '/health/'),
+    ('GET', '/admin/api/event/'),
+]
+
+
+def legacy_classify(method, path):
+    """The per-request list scan ClerkAuthMiddleware used before the policy table."""
+    if path.startswith('/health') or path.startswith('/admin/'):
+        return SYSTEM
+
+    public_read_paths = [
+        '/api/events',
+        '/api/announcements',
+        '/api/officers',
+    ]
+    officers_hub_paths = [
+        '/api/announcements',
+        '/api/events',
+        '/api/officers',
+    ]
+    is_public_read = any(path.startswith(p) for p in public_read_paths)
+    is_officers_hub = any(path.startswith(p) for p in officers_hub_paths)
+    is_rsvp = '/rsvp' in path
+    if (is_public_read and method == 'GET') or is_rsvp or is_officers_hub:
+        return PUBLIC_WRITE
+    return OFFICER_ONLY
+
+
+class Command(BaseCommand):
+    help = 'Microbenchmark the auth route classifier (compiled policy table vs legacy list scan).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200000)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        table = compile_route_policies()
+
+        def run_compiled():
+            for method, path in SAMPLE_PATHS:
+                table.classify(path)
+
+        def run_compiled_uncached():
+            for method, path in SAMPLE_PATHS:
+                table._cache.clear()
+                table.classify(path)
+
+        def run_legacy():
+            for method, path in SAMPLE_PATHS:
+                legacy_classify(method, path)
+
+        for method, path in SAMPLE_PATHS:
+            self.stdout.write(f'{method:6} {path:32} {table.classify(path)}')
+
+        rounds = max(iterations // len(SAMPLE_PATHS), 1)
+        lookups = rounds * len(SAMPLE_PATHS)
+        benchmarks = (
+            ('legacy list scan', run_legacy),
+            ('trie (cold)', run_compiled_uncached),
+            ('trie (memoized)', run_compiled),
+        )
+        for label, func in benchmarks:
+            elapsed = min(timeit.repeat(func, number=rounds, repeat=3))
+            self.stdout.write(
+                f'{label:18} {elapsed / lookups * 1e9:8.0f} ns/lookup  ({lookups} lookups)'
+            )
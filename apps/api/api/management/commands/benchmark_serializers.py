@@ -0,0 +1,94 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Announcement, Event, EventOccurrence, Officer, User
+from api.serializers import (
+    AnnouncementSerializer,
+    EventOccurrenceSerializer,
+    EventSerializer,
+    OfficerSerializer,
+    serialize_announcements,
+    serialize_events,
+    serialize_occurrences,
+    serialize_officers,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure list serialization throughput (rows/s) of the DRF serializers '
+        'against the fast read serializers on in-memory rows, and check that '
+        'both render byte-identical JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        now = timezone.now()
+        user = User(id=1, clerk_user_id='user_1', full_name='Ada Lovelace',
+                    email='ada@example.com', role='officer', is_officer=True, created_at=now)
+
+        events = []
+        for i in range(rows):
+            start_at = now + timedelta(hours=i - rows // 2)
+            event = Event(
+                id=i, title=f'Event {i}', description='Workshop', location='Room 101',
+                start_at=start_at, end_at=start_at + timedelta(hours=2), event_date=start_at,
+                created_by=user if i % 2 else None, created_at=now, updated_at=now,
+            )
+            event.computed_status = Event.status_at(event.start_at, event.end_at, now)
+            event.rsvp_count = i % 7
+            events.append(event)
+        occurrences = []
+        for i, event in enumerate(events):
+            occurrence = EventOccurrence(
+                id=i, event=event, original_start_at=event.start_at, start_at=event.start_at,
+                end_at=event.end_at, is_cancelled=i % 9 == 0, is_exception=i % 9 == 0, rsvp_count=i % 7,
+            )
+            occurrence.computed_status = event.computed_status
+            occurrences.append(occurrence)
+        announcements = [
+            Announcement(id=i, content=f'Announcement {i} ' * 10, pinned=i % 10 == 0,
+                         display_text='Pinned' if i % 10 == 0 else None, is_draft=False,
+                         created_at=now, updated_at=now)
+            for i in range(rows)
+        ]
+        officers = [
+            Officer(id=i, user=user if i % 2 else None, name=f'Officer {i}',
+                    position='Member', bio='Bio', order_index=i)
+            for i in range(rows)
+        ]
+
+        cases = (
+            ('events', events, EventSerializer, serialize_events),
+            ('occurrences', occurrences, EventOccurrenceSerializer, serialize_occurrences),
+            ('announcements', announcements, AnnouncementSerializer, serialize_announcements),
+            ('officers', officers, OfficerSerializer, serialize_officers),
+        )
+        render = JSONRenderer().render
+        self.stdout.write(f"{'resource':14} {'drf rows/s':>12} {'fast rows/s':>12} {'speedup':>8}")
+        for name, objects, serializer_class, serialize in cases:
+            if render(serializer_class(objects, many=True).data) != render(serialize(objects)):
+                raise CommandError(f'{name}: fast serializer output differs from {serializer_class.__name__}')
+
+            drf = self._best(lambda: serializer_class(objects, many=True).data, options['repeat'])
+            fast = self._best(lambda: serialize(objects), options['repeat'])
+            self.stdout.write(
+                f"{name:14} {len(objects) / drf:12.0f} {len(objects) / fast:12.0f} {drf / fast:7.1f}x"
+            )
+
+    @staticmethod
+    def _best(func, repeat):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        return best
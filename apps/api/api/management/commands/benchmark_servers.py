@@ -0,0 +1,80 @@
+import asyncio
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test the same endpoint on the gunicorn sync (WSGI) server and the '
+        'uvicorn (ASGI) server side by side. Start both first, e.g.\n'
+        '  gunicorn core.wsgi:application -w 3 -b 127.0.0.1:8000\n'
+        '  gunicorn core.asgi:application -k uvicorn.workers.UvicornWorker -w 1 -b 127.0.0.1:8001'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sync-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--async-url', default='http://127.0.0.1:8001')
+        parser.add_argument('--path', action='append', dest='paths',
+                            help='Endpoint to hit (repeatable). Defaults to the public list endpoints.')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--token', help='Bearer token for officer-only endpoints.')
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or ['/api/events/', '/api/announcements/', '/api/officers/']
+        headers = {'Authorization': f"Bearer {options['token']}"} if options['token'] else {}
+
+        self.stdout.write(
+            f"{'server':8} {'path':24} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+        )
+        for path in paths:
+            for label, base_url in (('wsgi', options['sync_url']), ('asgi', options['async_url'])):
+                result = asyncio.run(self._run(
+                    base_url + path, headers, options['requests'], options['concurrency']
+                ))
+                self.stdout.write(
+                    f"{label:8} {path:24} {result['rps']:9.1f} {result['p50']:9.1f} "
+                    f"{result['p95']:9.1f} {result['p99']:9.1f} {result['errors']:7d}"
+                )
+
+    async def _run(self, url, headers, total, concurrency):
+        latencies = []
+        errors = 0
+        queue = asyncio.Queue()
+        for _ in range(total):
+            queue.put_nowait(None)
+
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30, headers=headers) as client:
+            async def worker():
+                nonlocal errors
+                while True:
+                    try:
+                        queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    started = time.perf_counter()
+                    try:
+                        response = await client.get(url)
+                        if response.status_code >= 400:
+                            errors += 1
+                    except httpx.HTTPError:
+                        errors += 1
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        return {
+            'rps': total / elapsed,
+            'p50': quantiles[49],
+            'p95': quantiles[94],
+            'p99': quantiles[98],
+            'errors': errors,
+        }
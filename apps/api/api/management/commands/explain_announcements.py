@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from api.services import AnnouncementService
+from api.views.announcement_views import announcement_pagination
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the paginated announcement list queries (first and next '
+        'page, public and officers hub) and the schedule worker\'s due-work '
+        'claims, and check that each is served by its index. Exits non-zero '
+        'if one is not.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--plans', action='store_true', help='Print the full query plans.')
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        published = AnnouncementService.get_published_announcements()
+        everything = AnnouncementService.get_all_announcements()
+        # Any key works as a cursor; the plan is what matters
+        cursor = (True, datetime(2000, 1, 1, tzinfo=timezone.utc), 0)
+
+        page = announcement_pagination.apply
+        due = AnnouncementService.due_announcements
+        cases = (
+            ('public', page(published, None, limit), 'idx_announcements_published'),
+            ('public next page', page(published, cursor, limit), 'idx_announcements_published'),
+            ('public pinned', page(AnnouncementService.filter_announcements(published, pinned=True), None, limit),
+             'idx_announcements_published'),
+            ('admin', page(everything, None, limit), 'idx_announcements_admin'),
+            ('admin next page', page(everything, cursor, limit), 'idx_announcements_admin'),
+            ('publish due', due('publish_at')[:limit], 'idx_announcements_publish_due'),
+            ('expire due', due('expires_at')[:limit], 'idx_announcements_expire_due'),
+        )
+
+        failures = []
+        for label, queryset, index in cases:
+            plan = self._explain(queryset)
+            used = index in plan
+            if not used:
+                failures.append(label)
+            status = self.style.SUCCESS('ok') if used else self.style.ERROR('NOT USED')
+            self.stdout.write(f'{label:18} {index:30} {status}')
+            if options['plans']:
+                self.stdout.write(plan + '\n')
+
+        if failures:
+            raise CommandError(f"Index not used for: {', '.join(failures)}")
+
+    @staticmethod
+    def _explain(queryset):
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Small tables are cheaper to scan; ask whether the index *can* serve the query
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from api.services import OccurrenceService
+
+
+class Command(BaseCommand):
+    help = (
+        'Materialize occurrences of recurring events that have come within '
+        'EVENT_OCCURRENCE_HORIZON_DAYS. Run daily (e.g. from cron).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, action='append', dest='event_ids',
+                            help='Only regenerate this event ID (repeatable).')
+
+    def handle(self, *args, **options):
+        created, updated, removed = OccurrenceService.extend_horizon(event_ids=options['event_ids'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {created}, updated {updated}, removed {removed} occurrences.'
+        ))
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.discord import build_webhook_client
+from api.services import DiscordOutboxService
+
+
+class Command(BaseCommand):
+    help = (
+        'Drain the Discord outbox: post, edit and delete announcement messages '
+        'queued by AnnouncementService, honouring Discord rate limits. Runs as a '
+        'long-lived worker unless --once is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain what is due now, then exit.')
+        parser.add_argument('--batch-size', type=int, help='Rows per batch (default DISCORD_OUTBOX_BATCH_SIZE).')
+        parser.add_argument('--interval', type=float, default=2.0,
+                            help='Seconds to sleep when the outbox is empty.')
+        parser.add_argument('--webhook-url', help='Override DISCORD_WEBHOOK_URL (e.g. a local stub server).')
+
+    def handle(self, *args, **options):
+        client = build_webhook_client(options['webhook_url'])
+        if client is None:
+            raise CommandError('DISCORD_WEBHOOK_URL is not set.')
+
+        totals = {'sent': 0, 'coalesced': 0, 'retried': 0, 'failed': 0}
+        try:
+            while True:
+                result = DiscordOutboxService.drain(client, batch_size=options['batch_size'])
+                for key in totals:
+                    totals[key] += result[key]
+                handled = result['sent'] + result['coalesced'] + result['retried'] + result['failed']
+
+                if result['retry_after'] is not None:
+                    self.stdout.write(f"Rate limited; waiting {result['retry_after']:.2f}s")
+                    time.sleep(result['retry_after'])
+                elif not handled:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {totals['sent']}, coalesced {totals['coalesced']}, "
+            f"retrying {totals['retried']}, failed {totals['failed']}."
+        ))
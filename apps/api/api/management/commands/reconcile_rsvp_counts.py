@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from api.models import Event, EventOccurrence, EventRSVP, EventRSVPCounterShard
+from api.services.event_service import event_response_cache
+
+
+class Command(BaseCommand):
+    help = (
+        'Recount RSVPs per event, repair Event.rsvp_count and the per-occurrence '
+        'counts where they have drifted and fold any counter shards back into it.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, action='append', dest='event_ids',
+                            help='Only reconcile this event ID (repeatable).')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report drift without writing anything.')
+
+    def handle(self, *args, **options):
+        events = Event.objects.order_by('id')
+        if options['event_ids']:
+            events = events.filter(id__in=options['event_ids'])
+
+        checked = repaired = 0
+        for event_id in events.values_list('id', flat=True).iterator():
+            checked += 1
+            if self._reconcile(event_id, options['dry_run']):
+                repaired += 1
+
+        if repaired and not options['dry_run']:
+            event_response_cache.bump()
+        verb = 'would repair' if options['dry_run'] else 'repaired'
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} events, {verb} {repaired}.'))
+
+    def _reconcile(self, event_id, dry_run):
+        with transaction.atomic():
+            # Lock the counter row and its shards so concurrent RSVPs wait
+            # for the recount instead of being lost by it.
+            event = Event.objects.select_for_update().only('id', 'rsvp_count').get(id=event_id)
+            shards = list(EventRSVPCounterShard.objects.select_for_update().filter(event_id=event_id))
+            stored = event.rsvp_count + sum(shard.count for shard in shards)
+            actual = EventRSVP.objects.filter(event_id=event_id).count()
+
+            if stored != actual:
+                self.stdout.write(f'Event {event_id}: stored {stored}, actual {actual}')
+            occurrences_drifted = self._reconcile_occurrences(event_id, dry_run)
+            drifted = stored != actual or occurrences_drifted
+            if dry_run or (stored == actual and not shards):
+                return drifted
+
+            Event.objects.filter(id=event_id).update(rsvp_count=actual)
+            if shards:
+                EventRSVPCounterShard.objects.filter(event_id=event_id).delete()
+            return drifted
+
+    def _reconcile_occurrences(self, event_id, dry_run):
+        occurrences = list(
+            EventOccurrence.objects.select_for_update().filter(event_id=event_id).only('id', 'rsvp_count')
+        )
+        actual = dict(
+            EventRSVP.objects.filter(event_id=event_id, occurrence__isnull=False)
+            .order_by().values_list('occurrence_id').annotate(count=Count('id'))
+        )
+        drifted = [occurrence for occurrence in occurrences if occurrence.rsvp_count != actual.get(occurrence.id, 0)]
+        for occurrence in drifted:
+            self.stdout.write(
+                f'Event {event_id} occurrence {occurrence.id}: '
+                f'stored {occurrence.rsvp_count}, actual {actual.get(occurrence.id, 0)}'
+            )
+            occurrence.rsvp_count = actual.get(occurrence.id, 0)
+        if drifted and not dry_run:
+            EventOccurrence.objects.bulk_update(drifted, ['rsvp_count'])
+        return bool(drifted)
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import Announcement
+from api.rendering import render_content
+from api.response_cache import invalidate_responses
+
+
+class Command(BaseCommand):
+    help = (
+        'Backfill content_html and excerpt for announcements written before '
+        'they were rendered at write time, or re-render every announcement '
+        'with --all after a change to api.rendering.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Re-render every announcement, not just unrendered ones.')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Count what would change without writing.')
+
+    def handle(self, *args, **options):
+        announcements = Announcement.objects.order_by('id').only('id', 'content', 'content_html', 'excerpt')
+        if not options['all']:
+            announcements = announcements.filter(content_html='')
+
+        checked = changed = 0
+        batch = []
+        for announcement in announcements.iterator(chunk_size=options['batch_size']):
+            checked += 1
+            content_html, excerpt = render_content(announcement.content)
+            if (content_html, excerpt) == (announcement.content_html, announcement.excerpt):
+                continue
+            announcement.content_html, announcement.excerpt = content_html, excerpt
+            batch.append(announcement)
+            if len(batch) >= options['batch_size']:
+                changed += self._save(batch, options['dry_run'])
+                batch = []
+        changed += self._save(batch, options['dry_run'])
+
+        if changed and not options['dry_run']:
+            invalidate_responses('feed')
+        verb = 'would render' if options['dry_run'] else 'rendered'
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} announcements, {verb} {changed}.'))
+
+    @staticmethod
+    def _save(batch, dry_run):
+        if batch and not dry_run:
+            # The representation changed, so move updated_at too; otherwise
+            # clients holding an ETag would keep the unrendered version
+            now = timezone.now()
+            for announcement in batch:
+                announcement.updated_at = now
+            with transaction.atomic():
+                Announcement.objects.bulk_update(batch, ['content_html', 'excerpt', 'updated_at'])
+        return len(batch)
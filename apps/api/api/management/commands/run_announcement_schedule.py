@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.services import AnnouncementService
+
+
+class Command(BaseCommand):
+    help = (
+        'Publish announcements whose publish_at has come and return expired '
+        'ones to draft. Safe to run on several nodes at once (due rows are '
+        'claimed with SKIP LOCKED). Runs as a long-lived worker unless --once '
+        'is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Process what is due now, then exit.')
+        parser.add_argument('--batch-size', type=int,
+                            help='Announcements per transaction (default ANNOUNCEMENT_SCHEDULE_BATCH_SIZE).')
+        parser.add_argument('--interval', type=float, default=30.0,
+                            help='Seconds between checks for due announcements.')
+
+    def handle(self, *args, **options):
+        total_published = total_expired = 0
+        try:
+            while True:
+                published, expired = AnnouncementService.run_schedule(batch_size=options['batch_size'])
+                total_published += published
+                total_expired += expired
+                if published or expired:
+                    self.stdout.write(f'Published {published}, expired {expired}.')
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Published {total_published}, expired {total_expired} announcements.'
+        ))
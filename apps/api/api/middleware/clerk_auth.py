@@ -1,139 +1,437 @@
-import json
-import requests
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.conf import settings
+from django.core.cache import caches
 from django.http import JsonResponse
+from api.clerk import ClerkTokenVerifier, ClerkTokenError, ClerkUnavailable, build_token_verifier
+from api.clerk.users import fetch_clerk_user_profile, afetch_clerk_user_profile
+from api.middleware.route_policies import (
+    SYSTEM,
+    PUBLIC_READ,
+    PUBLIC_WRITE,
+    SAFE_METHODS,
+    compile_route_policies,
+)
 from api.models import User
 
 
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry expiry.
+
+    Entries live in a per-process OrderedDict. If ``backend`` (a Django cache)
+    is given, it is used as a shared second level so entries verified by one
+    gunicorn worker are reused by the others.
+    """
+
+    def __init__(self, name, maxsize=1024, ttl=300, backend=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.backend_hits = 0
+
+    def _backend_key(self, key):
+        return f'clerk:{self.name}:{key}'
+
+    def get(self, key):
+        """Return the cached value for ``key`` or None."""
+        value = self._get_local(key)
+        if value is not None:
+            return value
+        shared = self.backend.get(self._backend_key(key)) if self.backend is not None else None
+        return self._from_backend(key, shared)
+
+    async def aget(self, key):
+        """Async variant of get (the shared backend is awaited)."""
+        value = self._get_local(key)
+        if value is not None:
+            return value
+        shared = await self.backend.aget(self._backend_key(key)) if self.backend is not None else None
+        return self._from_backend(key, shared)
+
+    def set(self, key, value, ttl=None):
+        """Cache ``value`` for at most ``ttl`` seconds (capped at the cache TTL)."""
+        ttl = self._store_ttl(ttl)
+        if ttl <= 0:
+            return
+        self._store(key, value, ttl)
+        if self.backend is not None:
+            self.backend.set(self._backend_key(key), (value, time.time() + ttl), timeout=int(ttl) or 1)
+
+    async def aset(self, key, value, ttl=None):
+        """Async variant of set."""
+        ttl = self._store_ttl(ttl)
+        if ttl <= 0:
+            return
+        self._store(key, value, ttl)
+        if self.backend is not None:
+            await self.backend.aset(self._backend_key(key), (value, time.time() + ttl), timeout=int(ttl) or 1)
+
+    def _store_ttl(self, ttl):
+        return self.ttl if ttl is None else min(ttl, self.ttl)
+
+    def _get_local(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+        return None
+
+    def _from_backend(self, key, shared):
+        if shared is not None:
+            value, expires_at = shared
+            remaining = expires_at - time.time()
+            if remaining > 0:
+                self._store(key, value, remaining)
+                with self._lock:
+                    self.hits += 1
+                    self.backend_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def delete(self, key):
+        """Drop ``key`` from both cache levels."""
+        with self._lock:
+            self._data.pop(key, None)
+        if self.backend is not None:
+            self.backend.delete(self._backend_key(key))
+
+    def clear(self):
+        """Drop every local entry."""
+        with self._lock:
+            self._data.clear()
+
+    def _store(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        """Return hit/miss/eviction counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'backend_hits': self.backend_hits,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _shared_cache_backend():
+    alias = settings.CLERK_AUTH_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+# Verified sessions, keyed by a SHA-256 of the bearer token.
+session_cache = TTLCache(
+    'session',
+    maxsize=settings.CLERK_SESSION_CACHE_SIZE,
+    ttl=settings.CLERK_SESSION_CACHE_TTL,
+    backend=_shared_cache_backend(),
+)
+
+# Clerk user profiles, keyed by Clerk user_id.
+profile_cache = TTLCache(
+    'profile',
+    maxsize=settings.CLERK_PROFILE_CACHE_SIZE,
+    ttl=settings.CLERK_PROFILE_CACHE_TTL,
+    backend=_shared_cache_backend(),
+)
+
+
+# Officer User rows, keyed by clerk_user_id. Kept per process only (model
+# instances are not shared) with a short TTL; UserService invalidates entries
+# whenever it writes a user.
+user_cache = TTLCache(
+    'user',
+    maxsize=settings.CLERK_USER_CACHE_SIZE,
+    ttl=settings.CLERK_USER_CACHE_TTL,
+)
+
+
+def invalidate_cached_user(clerk_user_id):
+    """Drop a cached User so the next request reloads it from the database."""
+    user_cache.delete(clerk_user_id)
+
+
+def auth_cache_stats():
+    """Counters for the auth caches, e.g. for logging or a status endpoint."""
+    return {
+        'sessions': session_cache.stats(),
+        'profiles': profile_cache.stats(),
+        'users': user_cache.stats(),
+    }
+
+
 class ClerkAuthMiddleware:
     """
     Middleware to handle Clerk authentication for CS Club officers.
     
-    Extracts clerk_user_id from request headers and maps to User model.
+    Verifies the Clerk session JWT from the Authorization header locally
+    (no Clerk API round trip) and maps its subject to the User model.
     Automatically creates officer in DB if not already present.
+    
+    Sync and async capable: under ASGI it awaits the async Clerk client and
+    the async ORM instead of blocking the event loop.
     """
     
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.token_verifier = build_token_verifier()
+        self.route_policies = compile_route_policies()
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        # Skip auth for system endpoints (health checks)
-        system_paths = [
-            '/health',
-            '/health/',
-        ]
+        if self.async_mode:
+            return self.__acall__(request)
 
-        if request.path.startswith('/health') or request.path.startswith('/admin/'):
-            request.user = None
-            return self.get_response(request)
-        
-        # Skip auth for public web app endpoints (GET requests only)
-        public_read_paths = [
-            '/api/events',
-            '/api/announcements', 
-            '/api/officers',
-        ]
-        
-        # Skip auth for ALL officers-hub endpoints (Clerk handles auth at frontend)
-        officers_hub_paths = [
-            '/api/announcements',
-            '/api/events', 
-            '/api/officers',
-        ]
-        
-        # Check request type
-        is_public_read = any(request.path.startswith(path) for path in public_read_paths)
-        is_officers_hub = any(request.path.startswith(path) for path in officers_hub_paths)
-        is_rsvp = '/rsvp' in request.path
-        is_get_request = request.method == 'GET'
-        
-        # Allow access for:
-        # 1. GET requests to public endpoints (web app)
-        # 2. All RSVP operations (public)
-        # 3. ALL officers-hub operations (frontend Clerk auth handles access)
-        if (is_public_read and is_get_request) or is_rsvp or is_officers_hub:
+        if self._is_public(request):
             request.user = None
             return self.get_response(request)
 
-        # For any other endpoints, require authentication
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return JsonResponse({'error': 'Authorization header required'}, status=401)
+        token, error = self._bearer_token(request)
+        if error:
+            return error
 
-        token = auth_header.split(' ')[1]
-        
         try:
-            # Verify token with Clerk
-            user_data = self._verify_clerk_token(token)
+            # Verify token (cached per token until it expires)
+            user_data = self._get_session(token)
             if not user_data:
                 return JsonResponse({'error': 'Invalid token'}, status=401)
             
-            clerk_user_id = user_data.get('user_id')
-            email = user_data.get('email')
-            first_name = user_data.get('first_name', '')
-            last_name = user_data.get('last_name', '')
-            full_name = user_data.get('full_name') or f"{first_name} {last_name}".strip()
-            
-            # Get or create user
-            user, created = User.objects.get_or_create(
-                clerk_user_id=clerk_user_id,
-                defaults={
-                    'email': email or '',
-                    'full_name': full_name or email or 'Unknown User',
-                    'role': 'Officer',
-                    'is_officer': True,
-                }
-            )
-            
-            # Block access if not an officer
-            if not user.is_officer:
-                return JsonResponse({'error': 'Access denied - officers only'}, status=403)
-            
-            # Attach user to request
-            request.user = user
-            
+            # Get or create user (cached, so steady state costs no queries)
+            user = self._get_user(user_data)
+        except ClerkUnavailable:
+            return JsonResponse({'error': 'Authentication service unavailable'}, status=503)
         except Exception as e:
             return JsonResponse({'error': 'Authentication failed'}, status=401)
 
-        return self.get_response(request)
+        error = self._attach_user(request, user)
+        return error or self.get_response(request)
+
+    async def __acall__(self, request):
+        """Async path used under ASGI; token checks never block the event loop."""
+        if self._is_public(request):
+            request.user = None
+            return await self.get_response(request)
+
+        token, error = self._bearer_token(request)
+        if error:
+            return error
+
+        try:
+            user_data = await self._aget_session(token)
+            if not user_data:
+                return JsonResponse({'error': 'Invalid token'}, status=401)
+
+            user = await self._aget_user(user_data)
+        except ClerkUnavailable:
+            return JsonResponse({'error': 'Authentication service unavailable'}, status=503)
+        except Exception as e:
+            return JsonResponse({'error': 'Authentication failed'}, status=401)
+
+        error = self._attach_user(request, user)
+        return error or await self.get_response(request)
+
+    def _is_public(self, request):
+        # Skip auth for system endpoints, public routes and safe methods on
+        # public-read routes (policies are declared in the urlconfs)
+        policy = self.route_policies.classify(request.path_info)
+        return policy in (SYSTEM, PUBLIC_WRITE) or (policy == PUBLIC_READ and request.method in SAFE_METHODS)
+
+    def _bearer_token(self, request):
+        # Officer-only endpoints (and writes to public-read ones) require authentication
+        auth_header = request.headers.get('Authorization')
+        if not auth_header or not auth_header.startswith('Bearer '):
+            return None, JsonResponse({'error': 'Authorization header required'}, status=401)
+        return auth_header.split(' ')[1], None
+
+    def _attach_user(self, request, user):
+        # Block access if not an officer
+        if not user.is_officer:
+            return JsonResponse({'error': 'Access denied - officers only'}, status=403)
+        
+        # Attach user to request
+        request.user = user
+        return None
+
+    def _get_session(self, token):
+        """Return verified user data for ``token``, using the session cache."""
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        user_data = session_cache.get(cache_key)
+        if user_data is not None:
+            return user_data
+
+        user_data = self._verify_clerk_token(token)
+        if user_data:
+            session_cache.set(cache_key, user_data, ttl=user_data['expires_at'] - time.time())
+        return user_data
+
+    async def _aget_session(self, token):
+        """Async variant of _get_session."""
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        user_data = await session_cache.aget(cache_key)
+        if user_data is not None:
+            return user_data
+
+        user_data = await self._averify_clerk_token(token)
+        if user_data:
+            await session_cache.aset(cache_key, user_data, ttl=user_data['expires_at'] - time.time())
+        return user_data
+
+    def _get_user(self, user_data):
+        """Return the User for verified ``user_data``, creating it on first sight."""
+        clerk_user_id = user_data['user_id']
+        user = user_cache.get(clerk_user_id)
+        if user is None:
+            user = User.objects.filter(clerk_user_id=clerk_user_id).first()
+            if user is None:
+                profile = self._get_profile(user_data)
+                user, created = User.objects.get_or_create(
+                    clerk_user_id=clerk_user_id,
+                    defaults=self._user_defaults(profile),
+                )
+            user_cache.set(clerk_user_id, user)
+
+        # Each request gets its own instance so views can modify it safely
+        return copy.copy(user)
+
+    async def _aget_user(self, user_data):
+        """Async variant of _get_user using the async ORM."""
+        clerk_user_id = user_data['user_id']
+        user = user_cache.get(clerk_user_id)
+        if user is None:
+            user = await User.objects.filter(clerk_user_id=clerk_user_id).afirst()
+            if user is None:
+                profile = await self._aget_profile(user_data)
+                user, created = await User.objects.aget_or_create(
+                    clerk_user_id=clerk_user_id,
+                    defaults=self._user_defaults(profile),
+                )
+            user_cache.set(clerk_user_id, user)
+
+        return copy.copy(user)
+
+    @staticmethod
+    def _user_defaults(profile):
+        email = profile.get('email')
+        first_name = profile.get('first_name', '')
+        last_name = profile.get('last_name', '')
+        full_name = profile.get('full_name') or f"{first_name} {last_name}".strip()
+        return {
+            'email': email or '',
+            'full_name': full_name or email or 'Unknown User',
+            'role': 'Officer',
+            'is_officer': True,
+        }
+
+    def _get_profile(self, user_data):
+        """
+        Return the profile used to create a new User.
+        Token claims are used when they carry an email; otherwise the Clerk
+        profile is fetched once and cached by user_id.
+        """
+        if user_data.get('email'):
+            return user_data
+
+        clerk_user_id = user_data['user_id']
+        profile = profile_cache.get(clerk_user_id)
+        if profile is not None:
+            return profile
+
+        try:
+            profile = fetch_clerk_user_profile(clerk_user_id)
+        except Exception as e:
+            logger.warning("Failed to fetch Clerk profile for %s: %s", clerk_user_id, e)
+            return user_data
+
+        if profile is None:
+            return user_data
+        profile_cache.set(clerk_user_id, profile)
+        return profile
+
+    async def _aget_profile(self, user_data):
+        """Async variant of _get_profile."""
+        if user_data.get('email'):
+            return user_data
+
+        clerk_user_id = user_data['user_id']
+        profile = await profile_cache.aget(clerk_user_id)
+        if profile is not None:
+            return profile
+
+        try:
+            profile = await afetch_clerk_user_profile(clerk_user_id)
+        except Exception as e:
+            logger.warning("Failed to fetch Clerk profile for %s: %s", clerk_user_id, e)
+            return user_data
+
+        if profile is None:
+            return user_data
+        await profile_cache.aset(clerk_user_id, profile)
+        return profile
 
     def _verify_clerk_token(self, token):
         """
-        Verify JWT token with Clerk's API.
-        Returns user data if valid, None if invalid.
+        Verify a Clerk session JWT locally against the cached signing keys.
+        Returns user data read from the token claims if valid, None if invalid.
         """
         try:
-            # Use Clerk's session verification endpoint
-            url = f"https://api.clerk.dev/v1/sessions/verify"
-            headers = {
-                'Authorization': f'Bearer {settings.CLERK_SECRET_KEY}',
-                'Content-Type': 'application/json',
-            }
-            
-            # Send token for verification
-            response = requests.post(url, headers=headers, json={'token': token}, timeout=10)
-            
-            if response.status_code == 200:
-                session_data = response.json()
-                user_id = session_data.get('user_id')
-                
-                if user_id:
-                    # Get user details from Clerk
-                    user_url = f"https://api.clerk.dev/v1/users/{user_id}"
-                    user_response = requests.get(user_url, headers=headers, timeout=10)
-                    
-                    if user_response.status_code == 200:
-                        user_data = user_response.json()
-                        return {
-                            'user_id': user_id,
-                            'email': user_data.get('email_addresses', [{}])[0].get('email_address'),
-                            'first_name': user_data.get('first_name'),
-                            'last_name': user_data.get('last_name'),
-                            'full_name': f"{user_data.get('first_name', '')} {user_data.get('last_name', '')}".strip(),
-                        }
-            
+            claims = self.token_verifier.verify(token)
+            return ClerkTokenVerifier.user_data_from_claims(claims)
+        except ClerkTokenError as e:
+            logger.info("Clerk token rejected: %s", e)
             return None
-            
+        except ClerkUnavailable:
+            raise
         except Exception as e:
-            print(f"Clerk token verification failed: {e}")
-            return None 
\ No newline at end of file
+            logger.warning("Clerk token verification failed: %s", e)
+            return None
+
+    async def _averify_clerk_token(self, token):
+        """Async variant of _verify_clerk_token."""
+        try:
+            claims = await self.token_verifier.averify(token)
+            return ClerkTokenVerifier.user_data_from_claims(claims)
+        except ClerkTokenError as e:
+            logger.info("Clerk token rejected: %s", e)
+            return None
+        except ClerkUnavailable:
+            raise
+        except Exception as e:
+            logger.warning("Clerk token verification failed: %s", e)
+            return None
@@ -0,0 +1,130 @@
+"""
+Auth policies for URL routes.
+
+Each urlconf module declares an ``auth_policies`` dict next to its
+``urlpatterns``, mapping a URL name (or an include's namespace) to one of
+the policies below. ``compile_route_policies`` walks the resolver once at
+startup and builds a segment trie, so classifying a request path costs one
+dict lookup per path segment.
+"""
+from django.urls import get_resolver
+
+
+# No authentication at all (health checks, Django admin).
+SYSTEM = 'system'
+# Anyone may read (GET/HEAD/OPTIONS); other methods require an officer.
+PUBLIC_READ = 'public-read'
+# Anyone may call with any method (e.g. RSVPs).
+PUBLIC_WRITE = 'public-write'
+# Requires a verified officer token.
+OFFICER_ONLY = 'officer-only'
+
+POLICIES = (SYSTEM, PUBLIC_READ, PUBLIC_WRITE, OFFICER_ONLY)
+
+SAFE_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+_WILDCARD = '*'
+_REGEX_CHARS = set('()[]?*+\\{}|')
+
+
+class _Node:
+    __slots__ = ('children', 'wildcard', 'policy', 'subtree_policy')
+
+    def __init__(self):
+        self.children = {}
+        self.wildcard = None
+        self.policy = None
+        self.subtree_policy = None
+
+    def child(self, segment):
+        if segment == _WILDCARD:
+            if self.wildcard is None:
+                self.wildcard = _Node()
+            return self.wildcard
+        return self.children.setdefault(segment, _Node())
+
+
+class RoutePolicyTable:
+    """Prefix trie of path segments mapping request paths to auth policies.
+
+    Recently classified paths are memoized in a bounded dict, so repeat
+    paths cost a single dict lookup.
+    """
+
+    def __init__(self, default=OFFICER_ONLY, cache_size=4096):
+        self.default = default
+        self.root = _Node()
+        self.cache_size = cache_size
+        self._cache = {}
+
+    def add(self, segments, policy, subtree=False):
+        """Register ``policy`` for a route (or, with ``subtree``, everything under it)."""
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown auth policy '{policy}' for /{'/'.join(segments)}")
+        self._cache.clear()
+        node = self.root
+        for segment in segments:
+            node = node.child(segment)
+        if subtree:
+            node.subtree_policy = policy
+        else:
+            node.policy = policy
+
+    def classify(self, path):
+        """Return the auth policy for a request path."""
+        policy = self._cache.get(path)
+        if policy is None:
+            segments = [segment for segment in path.split('/') if segment]
+            policy = self._lookup(self.root, segments, 0) or self.default
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[path] = policy
+        return policy
+
+    def _lookup(self, node, segments, index):
+        # Literal segments win over converters; fall back to the nearest
+        # enclosing subtree policy when nothing deeper matches.
+        if index == len(segments):
+            policy = node.policy
+        else:
+            policy = None
+            child = node.children.get(segments[index])
+            if child is not None:
+                policy = self._lookup(child, segments, index + 1)
+            if policy is None and node.wildcard is not None:
+                policy = self._lookup(node.wildcard, segments, index + 1)
+        return policy if policy is not None else node.subtree_policy
+
+
+def _route_segments(pattern):
+    route = str(pattern).lstrip('^').rstrip('$')
+    segments = []
+    for segment in route.split('/'):
+        if not segment:
+            continue
+        if '<' in segment or _REGEX_CHARS & set(segment):
+            segments.append(_WILDCARD)
+        else:
+            segments.append(segment)
+    return segments
+
+
+def _walk(url_patterns, policies, prefix, table):
+    for entry in url_patterns:
+        segments = prefix + _route_segments(entry.pattern)
+        if hasattr(entry, 'url_patterns'):
+            namespace_policy = policies.get(entry.namespace) if entry.namespace else None
+            if namespace_policy:
+                table.add(segments, namespace_policy, subtree=True)
+            child_policies = getattr(entry.urlconf_module, 'auth_policies', {})
+            _walk(entry.url_patterns, child_policies, segments, table)
+        elif entry.name in policies:
+            table.add(segments, policies[entry.name])
+
+
+def compile_route_policies(urlconf=None, default=OFFICER_ONLY):
+    """Build a RoutePolicyTable from the ``auth_policies`` declared in the urlconf."""
+    resolver = get_resolver(urlconf)
+    table = RoutePolicyTable(default=default)
+    _walk(resolver.url_patterns, getattr(resolver.urlconf_module, 'auth_policies', {}), [], table)
+    return table
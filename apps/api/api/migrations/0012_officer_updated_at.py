@@ -0,0 +1,20 @@
+# Generated manually to add updated_at to Officer (used for ETag / Last-Modified)
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_remove_officer_linkedin_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='officer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
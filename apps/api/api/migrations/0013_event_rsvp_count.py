@@ -0,0 +1,48 @@
+# Generated manually to denormalize RSVP counts onto Event (with optional counter shards)
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def backfill_rsvp_counts(apps, schema_editor):
+    Event = apps.get_model('api', 'Event')
+    EventRSVP = apps.get_model('api', 'EventRSVP')
+    counts = EventRSVP.objects.filter(
+        event=models.OuterRef('pk')
+    ).values('event').annotate(total=models.Count('id')).values('total')
+    Event.objects.update(
+        rsvp_count=Coalesce(models.Subquery(counts), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_officer_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='rsvp_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rsvp_counts, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='EventRSVPCounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveSmallIntegerField()),
+                ('count', models.IntegerField(default=0)),
+                ('event', models.ForeignKey(db_column='event_id', on_delete=django.db.models.deletion.CASCADE, related_name='rsvp_counter_shards', to='api.event')),
+            ],
+            options={
+                'db_table': 'event_rsvp_counter_shards',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='eventrsvpcountershard',
+            constraint=models.UniqueConstraint(fields=('event', 'shard'), name='unique_event_rsvp_counter_shard'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated manually to add full-text search vectors and trigram indexes (PostgreSQL only)
+
+from django.db import migrations
+
+
+# Weighted tsvector per table: A = title-like, B = secondary, C = body text.
+# Kept in step with SearchService.RESOURCES.
+SEARCH_VECTORS = {
+    'events': (
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')"
+    ),
+    'announcements': (
+        "setweight(to_tsvector('english'::regconfig, coalesce(display_text, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(content, '')), 'B')"
+    ),
+    'officers': (
+        "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(position, '')), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(bio, '')), 'C')"
+    ),
+}
+
+# Title-like column per table, trigram-indexed for typo-tolerant autocomplete
+TRIGRAM_COLUMNS = {
+    'events': 'title',
+    'announcements': 'display_text',
+    'officers': 'name',
+}
+
+
+def add_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        # SearchService falls back to icontains matching elsewhere
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, vector in SEARCH_VECTORS.items():
+        # A stored generated column is maintained by Postgres on every write
+        schema_editor.execute(
+            f'ALTER TABLE {table} ADD COLUMN search_vector tsvector '
+            f'GENERATED ALWAYS AS ({vector}) STORED'
+        )
+        schema_editor.execute(
+            f'CREATE INDEX idx_{table}_search_vector ON {table} USING GIN (search_vector)'
+        )
+    for table, column in TRIGRAM_COLUMNS.items():
+        schema_editor.execute(
+            f'CREATE INDEX idx_{table}_{column}_trgm ON {table} USING GIN ({column} gin_trgm_ops)'
+        )
+
+
+def remove_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in TRIGRAM_COLUMNS.items():
+        schema_editor.execute(f'DROP INDEX IF EXISTS idx_{table}_{column}_trgm')
+    for table in SEARCH_VECTORS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS idx_{table}_search_vector')
+        schema_editor.execute(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_event_rsvp_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vectors, remove_search_vectors),
+    ]
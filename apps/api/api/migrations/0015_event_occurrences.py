@@ -0,0 +1,98 @@
+# Generated manually to add recurrence rules and the materialized event occurrences table
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def backfill_occurrences(apps, schema_editor):
+    """
+    Every existing event is one-off: give each its single occurrence and move
+    its RSVPs (and their count) onto it.
+    """
+    Event = apps.get_model('api', 'Event')
+    EventOccurrence = apps.get_model('api', 'EventOccurrence')
+    EventRSVP = apps.get_model('api', 'EventRSVP')
+    events = Event.objects.values_list('id', 'start_at', 'end_at')
+    EventOccurrence.objects.bulk_create(
+        (
+            EventOccurrence(event_id=event_id, original_start_at=start_at, start_at=start_at, end_at=end_at)
+            for event_id, start_at, end_at in events.iterator()
+        ),
+        batch_size=500,
+    )
+    EventRSVP.objects.update(occurrence_id=Subquery(
+        EventOccurrence.objects.filter(event_id=OuterRef('event_id')).values('id')[:1]
+    ))
+    EventOccurrence.objects.update(rsvp_count=Coalesce(Subquery(
+        EventRSVP.objects.filter(occurrence_id=OuterRef('pk'))
+        .order_by().values('occurrence_id').annotate(count=Count('id')).values('count')
+    ), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_rule',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='EventOccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_start_at', models.DateTimeField()),
+                ('start_at', models.DateTimeField()),
+                ('end_at', models.DateTimeField()),
+                ('is_cancelled', models.BooleanField(default=False)),
+                ('is_exception', models.BooleanField(default=False)),
+                ('rsvp_count', models.PositiveIntegerField(default=0)),
+                ('event', models.ForeignKey(db_column='event_id', on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='api.event')),
+            ],
+            options={
+                'db_table': 'event_occurrences',
+                'ordering': ['start_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='eventoccurrence',
+            index=models.Index(fields=['start_at'], name='idx_occurrences_start_at'),
+        ),
+        migrations.AddIndex(
+            model_name='eventoccurrence',
+            index=models.Index(fields=['end_at'], name='idx_occurrences_end_at'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventoccurrence',
+            constraint=models.UniqueConstraint(fields=('event', 'original_start_at'), name='unique_event_occurrence'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventoccurrence',
+            constraint=models.CheckConstraint(check=models.Q(('end_at__gt', models.F('start_at'))), name='chk_occurrence_time_order'),
+        ),
+        migrations.AddField(
+            model_name='eventrsvp',
+            name='occurrence',
+            field=models.ForeignKey(blank=True, db_column='occurrence_id', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='rsvps', to='api.eventoccurrence'),
+        ),
+        # One RSVP per email per occurrence (per event for RSVPs without one)
+        migrations.RemoveConstraint(
+            model_name='eventrsvp',
+            name='unique_event_email_rsvp',
+        ),
+        migrations.AddConstraint(
+            model_name='eventrsvp',
+            constraint=models.UniqueConstraint(condition=models.Q(('occurrence__isnull', True)), fields=('event', 'email'), name='unique_event_email_rsvp'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventrsvp',
+            constraint=models.UniqueConstraint(condition=models.Q(('occurrence__isnull', False)), fields=('occurrence', 'email'), name='unique_occurrence_email_rsvp'),
+        ),
+        migrations.RunPython(backfill_occurrences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated manually to add GiST-indexed time ranges for overlap queries (PostgreSQL only)
+
+from django.db import migrations
+
+
+# Tables queried with api.time_ranges. Every event, one-off or recurring,
+# has its instances in event_occurrences, so range queries go there.
+TIME_RANGE_TABLES = {
+    'event_occurrences': 'idx_occurrences_time_range',
+}
+
+
+def add_time_ranges(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        # api.time_ranges compares start_at/end_at elsewhere
+        return
+    for table, index in TIME_RANGE_TABLES.items():
+        # Half-open, so back-to-back bookings do not overlap
+        schema_editor.execute(
+            f"ALTER TABLE {table} ADD COLUMN time_range tstzrange "
+            f"GENERATED ALWAYS AS (tstzrange(start_at, end_at, '[)')) STORED"
+        )
+        schema_editor.execute(f'CREATE INDEX {index} ON {table} USING GIST (time_range)')
+
+
+def remove_time_ranges(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, index in TIME_RANGE_TABLES.items():
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index}')
+        schema_editor.execute(f'ALTER TABLE {table} DROP COLUMN IF EXISTS time_range')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_event_occurrences'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_time_ranges, remove_time_ranges),
+    ]
@@ -0,0 +1,21 @@
+# Generated manually to index the paginated announcement list orderings
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_time_ranges'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('is_draft', False)), fields=['-pinned', '-created_at', '-id'], name='idx_announcements_published'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['-pinned', '-created_at', '-id'], name='idx_announcements_admin'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated manually to add the Discord publishing outbox
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_announcement_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscordOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('announcement_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('publish', 'Publish'), ('edit', 'Edit'), ('delete', 'Delete')], max_length=10)),
+                ('message_id', models.CharField(blank=True, max_length=64, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'discord_outbox',
+                'ordering': ['available_at', 'id'],
+                'indexes': [
+                    models.Index(condition=models.Q(('status', 'pending')), fields=['available_at', 'id'], name='idx_discord_outbox_pending'),
+                    models.Index(fields=['announcement_id', 'status'], name='idx_discord_outbox_ann'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated manually to store rendered announcement content (backfilled by render_announcements)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_discord_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='content_html',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated manually to add scheduled publishing and expiry of announcements
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_announcement_content_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='publish_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('is_draft', False), ('publish_at__isnull', False)), fields=['publish_at'], name='idx_announcements_publish_due'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('expires_at__isnull', False), ('is_draft', False)), fields=['expires_at'], name='idx_announcements_expire_due'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated manually to lease Discord outbox rows while they are sent
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_announcement_schedule'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='discordoutbox',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('in_flight', 'In flight'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.RemoveIndex(
+            model_name='discordoutbox',
+            name='idx_discord_outbox_pending',
+        ),
+        migrations.AddIndex(
+            model_name='discordoutbox',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'in_flight'])), fields=['available_at', 'id'], name='idx_discord_outbox_pending'),
+        ),
+    ]
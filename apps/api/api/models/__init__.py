@@ -1,13 +1,18 @@
 from .user import User
 from .event import Event
+from .event_occurrence import EventOccurrence
 from .announcement import Announcement
+from .discord_outbox import DiscordOutbox
 from .officer import Officer
-from .event_rsvp import EventRSVP
+from .event_rsvp import EventRSVP, EventRSVPCounterShard
 
 __all__ = [
     'User',
     'Event', 
+    'EventOccurrence',
     'Announcement',
+    'DiscordOutbox',
     'Officer',
     'EventRSVP',
+    'EventRSVPCounterShard',
 ] 
\ No newline at end of file
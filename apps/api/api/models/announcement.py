@@ -1,26 +1,91 @@
 from django.db import models
+from django.db.models.functions import Length
 from django.utils import timezone
 
 
+class AnnouncementQuerySet(models.QuerySet):
+    def published(self, now=None):
+        """
+        Announcements the public can see at ``now``: not drafts, past their
+        ``publish_at`` and not yet at their ``expires_at``. The timestamp
+        checks are residual filters on idx_announcements_published; only
+        scheduled rows and expired rows the worker has not reached yet fail
+        them.
+        """
+        now = now or timezone.now()
+        return self.filter(
+            models.Q(publish_at__isnull=True) | models.Q(publish_at__lte=now),
+            models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=now),
+            is_draft=False,
+        )
+
+    def with_content_length(self):
+        """
+        Annotate ``content_length`` (characters of ``content``), computed by
+        the database so a list can report it without loading the text.
+        """
+        return self.annotate(content_length=Length('content'))
+
+
 class Announcement(models.Model):
     """
     Announcement model for CS Club announcements.
     """
     content = models.TextField()
+    # Rendered from content by AnnouncementService (see api.rendering)
+    content_html = models.TextField(blank=True, default='')
+    excerpt = models.CharField(max_length=200, blank=True, default='')
     display_text = models.CharField(max_length=200, blank=True, null=True)  # Only for pinned announcements
     pinned = models.BooleanField(default=False)
     is_draft = models.BooleanField(default=True)
     discord_message_id = models.CharField(max_length=64, blank=True, null=True)
+    # A non-draft with publish_at in the future is scheduled: hidden until
+    # then, when the run_announcement_schedule worker announces it and clears
+    # publish_at. At expires_at the worker returns it to draft.
+    publish_at = models.DateTimeField(blank=True, null=True)
+    expires_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'announcements'
         ordering = ['-pinned', '-created_at']  # Pinned first, then newest
+        # Serve the paginated list order (see announcement_views) straight
+        # from an index: published rows for the public list, all for admin
+        indexes = [
+            models.Index(
+                fields=['-pinned', '-created_at', '-id'],
+                condition=models.Q(is_draft=False),
+                name='idx_announcements_published'
+            ),
+            models.Index(fields=['-pinned', '-created_at', '-id'], name='idx_announcements_admin'),
+            # The schedule worker's due-work queues; rows leave them once handled
+            models.Index(
+                fields=['publish_at'],
+                condition=models.Q(is_draft=False, publish_at__isnull=False),
+                name='idx_announcements_publish_due'
+            ),
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(is_draft=False, expires_at__isnull=False),
+                name='idx_announcements_expire_due'
+            ),
+        ]
+
+    objects = AnnouncementQuerySet.as_manager()
 
     def __str__(self):
         return self.display_text or f"Announcement {self.id}"
     
+    def is_live(self, now=None):
+        """Whether the public can see this announcement at ``now``."""
+        now = now or timezone.now()
+        return (
+            not self.is_draft
+            and (self.publish_at is None or self.publish_at <= now)
+            and (self.expires_at is None or self.expires_at > now)
+        )
+    
     @property
     def summary(self):
         """Return truncated content for display."""
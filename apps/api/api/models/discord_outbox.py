@@ -0,0 +1,66 @@
+from django.db import models
+from django.utils import timezone
+
+
+class DiscordOutbox(models.Model):
+    """
+    A pending change to an announcement's Discord message.
+
+    Rows are written in the same transaction as the announcement change (see
+    DiscordOutboxService) and drained by the publish_discord worker, so no
+    Discord call ever runs on the request path. ``announcement_id`` is a
+    plain column rather than a foreign key so a delete can outlive the
+    announcement it removes; ``message_id`` is captured when the delete is
+    queued for the same reason.
+
+    A worker leases the rows it is sending (``in_flight`` until
+    ``available_at``) and sends them outside any transaction; rows whose
+    lease runs out, because the worker died, are picked up again.
+    """
+    ACTION_PUBLISH = 'publish'
+    ACTION_EDIT = 'edit'
+    ACTION_DELETE = 'delete'
+    ACTION_CHOICES = [
+        (ACTION_PUBLISH, 'Publish'),
+        (ACTION_EDIT, 'Edit'),
+        (ACTION_DELETE, 'Delete'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_IN_FLIGHT = 'in_flight'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_IN_FLIGHT, 'In flight'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    announcement_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    message_id = models.CharField(max_length=64, blank=True, null=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    # Not picked up before this; pushed back for edit coalescing, rate
+    # limits and retries, and the lease expiry while a worker holds the row
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'discord_outbox'
+        ordering = ['available_at', 'id']
+        indexes = [
+            # The worker's queue scan only ever reads pending and leased rows
+            models.Index(
+                fields=['available_at', 'id'],
+                condition=models.Q(status__in=['pending', 'in_flight']),
+                name='idx_discord_outbox_pending'
+            ),
+            models.Index(fields=['announcement_id', 'status'], name='idx_discord_outbox_ann'),
+        ]
+
+    def __str__(self):
+        return f"{self.action} announcement {self.announcement_id} ({self.status})"
@@ -1,9 +1,76 @@
+from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from .user import User
 
 
+# Fields an officer may edit in each status
+# (a recurrence rule only ever regenerates future occurrences, so it stays editable)
+EDITABLE_FIELDS_BY_STATUS = {
+    'upcoming': ('title', 'description', 'location', 'start_at', 'end_at',
+                 'meeting_link', 'slides_url', 'recording_url', 'recurrence_rule'),
+    'ongoing': ('meeting_link', 'recurrence_rule'),
+    'past': ('slides_url', 'recording_url', 'recurrence_rule'),
+}
+
+
+def status_case(now):
+    """SQL status of a row's own ``start_at``/``end_at`` at ``now`` (see Event.status_at)."""
+    return models.Case(
+        models.When(start_at__gt=now, then=models.Value('upcoming')),
+        models.When(end_at__gt=now, then=models.Value('ongoing')),
+        default=models.Value('past'),
+        output_field=models.CharField(),
+    )
+
+
+# A recurrence_rule that is set (normalize_rule stores blanks as NULL)
+RECURRING = models.Q(recurrence_rule__isnull=False) & ~models.Q(recurrence_rule='')
+
+
+class EventQuerySet(models.QuerySet):
+    def with_status(self, now=None):
+        """
+        Annotate ``computed_status`` in SQL against a single ``now``, so every
+        row (and every status-derived field) agrees on the same clock reading.
+        A recurring event takes its status from its next instance that has not
+        ended and is not cancelled (past once there is none), so a series stays
+        upcoming between meetings rather than following its first instance.
+        """
+        from .event_occurrence import EventOccurrence
+        now = now or timezone.now()
+        current = EventOccurrence.objects.filter(
+            event=models.OuterRef('pk'), is_cancelled=False, end_at__gt=now
+        ).order_by('start_at').values('start_at')[:1]
+        return self.annotate(
+            current_start_at=models.Case(
+                models.When(RECURRING, then=models.Subquery(current)),
+                default=models.F('start_at'),
+            ),
+        ).annotate(computed_status=models.Case(
+            models.When(RECURRING & models.Q(current_start_at__isnull=True), then=models.Value('past')),
+            models.When(RECURRING & models.Q(current_start_at__gt=now), then=models.Value('upcoming')),
+            models.When(RECURRING, then=models.Value('ongoing')),
+            default=status_case(now),
+            output_field=models.CharField(),
+        ))
+
+    def with_rsvp_counts(self):
+        """
+        Add RSVPs still held in counter shards (settings.RSVP_COUNTER_SHARDS)
+        on top of the folded ``rsvp_count``. A no-op when sharding is off.
+        """
+        if not settings.RSVP_COUNTER_SHARDS:
+            return self
+        from .event_rsvp import EventRSVPCounterShard
+        pending = EventRSVPCounterShard.objects.filter(
+            event=models.OuterRef('pk')
+        ).values('event').annotate(total=models.Sum('count')).values('total')
+        return self.annotate(pending_rsvps=Coalesce(models.Subquery(pending), 0))
+
+
 class Event(models.Model):
     """
     Event model for CS Club events with time-based status logic.
@@ -21,6 +88,10 @@ class Event(models.Model):
     slides_url = models.TextField(blank=True, null=True)
     recording_url = models.TextField(blank=True, null=True)
     
+    # RFC 5545 RRULE (api/recurrence.py); start_at/end_at are the first
+    # instance. Instances are materialized as EventOccurrence rows.
+    recurrence_rule = models.TextField(blank=True, null=True)
+    
     # Keep legacy field for backward compatibility
     event_date = models.DateTimeField(null=True, blank=True)
     
@@ -33,6 +104,11 @@ class Event(models.Model):
     )
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    
+    # Maintained by RSVPService; repaired by `manage.py reconcile_rsvp_counts`
+    rsvp_count = models.PositiveIntegerField(default=0)
+
+    objects = EventQuerySet.as_manager()
 
     class Meta:
         db_table = 'events'
@@ -58,21 +134,43 @@ class Event(models.Model):
         # Keep event_date in sync for backward compatibility
         if self.start_at:
             self.event_date = self.start_at
+        # An annotated status may no longer match the new times
+        self.__dict__.pop('computed_status', None)
         super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title
     
-    @property
-    def status(self):
-        """Compute event status based on current time."""
-        now = timezone.now()
-        if now < self.start_at:
+    @staticmethod
+    def status_at(start_at, end_at, now):
+        """Status of an event with the given times at ``now``."""
+        if now < start_at:
             return 'upcoming'
-        elif self.start_at <= now < self.end_at:
+        elif now < end_at:
             return 'ongoing'
         else:
             return 'past'
+
+    @property
+    def status(self):
+        """
+        Event status: the ``computed_status`` annotation when the row came from
+        ``Event.objects.with_status()``, otherwise computed against the clock
+        (for a recurring event, from its current instance as there).
+        """
+        computed = self.__dict__.get('computed_status')
+        if computed is not None:
+            return computed
+        now = timezone.now()
+        if self.pk and self.recurrence_rule:
+            current = self.occurrences.filter(is_cancelled=False, end_at__gt=now).order_by('start_at').first()
+            return self.status_at(current.start_at, current.end_at, now) if current else 'past'
+        return self.status_at(self.start_at, self.end_at, now)
+    
+    @property
+    def rsvp_total(self):
+        """RSVP count including any not yet folded in from counter shards."""
+        return self.rsvp_count + (self.__dict__.get('pending_rsvps') or 0)
     
     @property
     def is_upcoming(self):
@@ -96,11 +194,4 @@ class Event(models.Model):
     
     def get_editable_fields(self):
         """Return list of fields that can be edited based on current status."""
-        status = self.status
-        if status == 'upcoming':
-            return ['title', 'description', 'location', 'start_at', 'end_at', 
-                   'meeting_link', 'slides_url', 'recording_url']
-        elif status == 'ongoing':
-            return ['meeting_link']
-        else:  # past
-            return ['slides_url', 'recording_url'] 
\ No newline at end of file
+        return list(EDITABLE_FIELDS_BY_STATUS[self.status])
\ No newline at end of file
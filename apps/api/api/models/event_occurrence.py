@@ -0,0 +1,71 @@
+from django.db import models
+from django.utils import timezone
+from .event import Event, status_case
+
+
+class EventOccurrenceQuerySet(models.QuerySet):
+    def with_status(self, now=None):
+        """Annotate each instance's own ``computed_status`` at ``now`` (see EventQuerySet.with_status)."""
+        return self.annotate(computed_status=status_case(now or timezone.now()))
+
+
+class EventOccurrence(models.Model):
+    """
+    One materialized instance of an event, indexed by time.
+
+    One-off events have a single occurrence; recurring events have one per
+    instance of their rule up to EVENT_OCCURRENCE_HORIZON_DAYS ahead, kept in
+    step by OccurrenceService.sync_occurrences. ``original_start_at`` is the
+    instance's slot in the rule (its RECURRENCE-ID) and never changes; a
+    moved instance keeps it and is flagged ``is_exception`` so regeneration
+    leaves its times alone.
+    """
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='occurrences',
+        db_column='event_id'
+    )
+    original_start_at = models.DateTimeField()
+    start_at = models.DateTimeField()
+    end_at = models.DateTimeField()
+    is_cancelled = models.BooleanField(default=False)
+    is_exception = models.BooleanField(default=False)
+    # Maintained by RSVPService like Event.rsvp_count
+    rsvp_count = models.PositiveIntegerField(default=0)
+
+    objects = EventOccurrenceQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'event_occurrences'
+        ordering = ['start_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['event', 'original_start_at'],
+                name='unique_event_occurrence'
+            ),
+            models.CheckConstraint(
+                check=models.Q(end_at__gt=models.F('start_at')),
+                name='chk_occurrence_time_order'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['start_at'], name='idx_occurrences_start_at'),
+            models.Index(fields=['end_at'], name='idx_occurrences_end_at'),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} @ {self.start_at:%Y-%m-%d %H:%M}"
+
+    @property
+    def status(self):
+        """Status of this instance (see Event.status)."""
+        computed = self.__dict__.get('computed_status')
+        if computed is not None:
+            return computed
+        return Event.status_at(self.start_at, self.end_at, timezone.now())
+
+    @property
+    def can_rsvp(self):
+        """RSVPs are open until the instance starts, unless it was cancelled."""
+        return self.status == 'upcoming' and not self.is_cancelled
@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils import timezone
 from .event import Event
+from .event_occurrence import EventOccurrence
 
 
 class EventRSVP(models.Model):
@@ -14,6 +15,16 @@ class EventRSVP(models.Model):
         related_name='rsvps',
         db_column='event_id'
     )
+    # The instance being attended (a one-off event's single occurrence);
+    # null only for RSVPs that predate occurrences
+    occurrence = models.ForeignKey(
+        EventOccurrence,
+        on_delete=models.CASCADE,
+        related_name='rsvps',
+        null=True,
+        blank=True,
+        db_column='occurrence_id'
+    )
     name = models.CharField(max_length=150, blank=True, null=True)
     email = models.EmailField(max_length=150)
     comment = models.TextField(blank=True, null=True)
@@ -25,10 +36,47 @@ class EventRSVP(models.Model):
         constraints = [
             models.UniqueConstraint(
                 fields=['event', 'email'], 
+                condition=models.Q(occurrence__isnull=True),
                 name='unique_event_email_rsvp'
-            )
+            ),
+            models.UniqueConstraint(
+                fields=['occurrence', 'email'],
+                condition=models.Q(occurrence__isnull=False),
+                name='unique_occurrence_email_rsvp'
+            ),
         ]
 
     def __str__(self):
         name_display = self.name or "Anonymous"
-        return f"{name_display} - {self.event.title}" 
\ No newline at end of file
+        return f"{name_display} - {self.event.title}"
+
+
+class EventRSVPCounterShard(models.Model):
+    """
+    Sharded RSVP counter deltas for an event.
+
+    With settings.RSVP_COUNTER_SHARDS > 0, RSVPs increment a random shard
+    instead of the single Event row, so a burst of RSVPs for one popular
+    event doesn't serialize on that row's lock. Reads add the shard sum to
+    ``Event.rsvp_count``; ``reconcile_rsvp_counts`` folds shards back in.
+    """
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='rsvp_counter_shards',
+        db_column='event_id'
+    )
+    shard = models.PositiveSmallIntegerField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'event_rsvp_counter_shards'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['event', 'shard'],
+                name='unique_event_rsvp_counter_shard'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.event_id}#{self.shard}: {self.count}"
@@ -27,6 +27,7 @@ class Officer(models.Model):
     bio = models.TextField(blank=True, null=True)
     image_url = models.TextField(blank=True, null=True, help_text="Image URL or base64 data")  # Changed to TextField
     order_index = models.IntegerField(default=0, help_text="Used to control ordering on frontend")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'officers'
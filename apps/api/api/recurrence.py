@@ -0,0 +1,76 @@
+"""
+RFC 5545 recurrence rules for events.
+
+An event's ``recurrence_rule`` is a single RRULE value (e.g.
+``FREQ=WEEKLY;BYDAY=TU;COUNT=12``); the event's own start_at/end_at are the
+first instance and the duration of every instance. Rules are expanded in the
+project time zone so a weekly 6pm meeting stays at 6pm across DST changes.
+Exceptions (cancelled or moved instances) live on EventOccurrence rows, not
+in the rule.
+"""
+import re
+from datetime import timezone as dt_timezone
+
+from dateutil.rrule import rrule, rrulestr
+from django.utils import timezone
+
+
+# Sub-daily frequencies would flood the occurrences table
+_TOO_FREQUENT = re.compile(r'FREQ=(HOURLY|MINUTELY|SECONDLY)', re.IGNORECASE)
+
+
+class RecurrenceError(ValueError):
+    """Raised for recurrence rules that cannot be used."""
+
+
+def whole_seconds(value):
+    """
+    ``value`` without its microseconds. dateutil drops them from DTSTART, so
+    instance start times (and occurrence keys) are compared at this precision.
+    """
+    return value.replace(microsecond=0)
+
+
+def normalize_rule(value):
+    """Strip an optional ``RRULE:`` prefix and surrounding whitespace."""
+    value = (value or '').strip()
+    if value.upper().startswith('RRULE:'):
+        value = value[len('RRULE:'):]
+    return value or None
+
+
+def parse_rule(value, start_at):
+    """Return a dateutil rrule for ``value`` anchored at ``start_at``."""
+    value = normalize_rule(value)
+    if not value:
+        raise RecurrenceError("Recurrence rule is empty.")
+    if '\n' in value or 'DTSTART' in value.upper():
+        raise RecurrenceError(
+            "Give a single RRULE; the event start time is its DTSTART and "
+            "exceptions are managed per occurrence."
+        )
+    if _TOO_FREQUENT.search(value):
+        raise RecurrenceError("Events may recur at most daily.")
+    dtstart = timezone.localtime(whole_seconds(start_at))
+    try:
+        rule = rrulestr(value, dtstart=dtstart)
+    except (ValueError, TypeError) as e:
+        raise RecurrenceError(f"Invalid recurrence rule: {e}")
+    if not isinstance(rule, rrule):
+        raise RecurrenceError("Give a single RRULE.")
+    return rule
+
+
+def expand(value, start_at, until, limit):
+    """
+    Start times (UTC) of the rule's instances from ``start_at`` up to
+    ``until``, at most ``limit`` of them.
+    """
+    rule = parse_rule(value, start_at)
+    starts = []
+    # Truncated like DTSTART, or a sub-second start_at would skip the first instance
+    for start in rule.xafter(timezone.localtime(whole_seconds(start_at)), count=limit, inc=True):
+        if start > until:
+            break
+        starts.append(start.astimezone(dt_timezone.utc))
+    return starts
@@ -0,0 +1,77 @@
+"""
+Markdown rendering for announcement content.
+
+Announcements are rendered once, when AnnouncementService writes them, and
+the sanitized HTML and a plain-text excerpt are stored next to the source
+(``content_html`` / ``excerpt``), so list endpoints serve them as columns
+instead of every client parsing Markdown on every page view. Newlines are
+line breaks, as in the editors' preview.
+
+The HTML is cleaned with nh3 against an allowlist of the tags Markdown
+produces, so raw HTML in the source cannot inject scripts, handlers or
+styles; links only keep http(s) and mailto URLs.
+"""
+import html
+import re
+
+import markdown
+import nh3
+
+
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists', 'nl2br']
+
+ALLOWED_TAGS = {
+    'p', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'strong', 'em', 'b', 'i', 'del', 's', 'code', 'pre', 'blockquote',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'a', 'img', 'abbr', 'sup', 'sub',
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'img': {'src', 'alt', 'title'},
+    'abbr': {'title'},
+    'th': {'align'},
+    'td': {'align'},
+    'ol': {'start'},
+}
+ALLOWED_URL_SCHEMES = {'http', 'https', 'mailto'}
+
+# Same cut as the announcement cards' snippets and Announcement.summary
+EXCERPT_LENGTH = 150
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def render_markdown(text):
+    """Render Markdown ``text`` to sanitized HTML."""
+    if not text:
+        return ''
+    rendered = markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS, output_format='html')
+    return nh3.clean(
+        rendered,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=ALLOWED_URL_SCHEMES,
+        link_rel='noopener noreferrer nofollow',
+    )
+
+
+def html_excerpt(content_html, max_length=EXCERPT_LENGTH):
+    """Plain-text excerpt of rendered HTML, cut at a word boundary where one is close."""
+    # Keep block boundaries as spaces before the tags go
+    text = re.sub(r'<(br|/p|/li|/h\d|/td|/th|/blockquote|/pre)\b[^>]*>', ' ', content_html)
+    text = html.unescape(nh3.clean(text, tags=set()))
+    text = _WHITESPACE.sub(' ', text).strip()
+    if len(text) <= max_length:
+        return text
+    text = text[:max_length].strip()
+    last_space = text.rfind(' ')
+    if last_space > max_length * 0.8:
+        text = text[:last_space]
+    return text + '...'
+
+
+def render_content(text):
+    """Return ``(content_html, excerpt)`` for Markdown ``text``."""
+    content_html = render_markdown(text)
+    return content_html, html_excerpt(content_html)
@@ -0,0 +1,260 @@
+"""
+Cached responses for public read endpoints.
+
+Each ResponseCache namespace keeps a generation counter in the Django cache.
+Cached responses are keyed by generation, so bumping the counter (from the
+service layer, after commit) invalidates every response in the namespace at
+once without having to enumerate keys. Misses are regenerated single-flight:
+one request takes a short lock and builds the response while concurrent
+misses wait briefly for it instead of all hitting the database.
+
+Streaming responses are passed through unbuffered and copied into the cache
+as they are sent, unless they exceed RESPONSE_CACHE_MAX_STREAM_BYTES.
+"""
+import asyncio
+import logging
+import math
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth replaying from the cache
+CACHED_HEADERS = ('Content-Type', 'Content-Disposition', 'X-Next-Cursor', 'Link')
+
+
+class ResponseCache:
+    """
+    Generation-invalidated, single-flight cache of rendered GET responses.
+
+    ``ttl`` is a callable returning the number of seconds a freshly built
+    response may be served for (e.g. until the next event status boundary);
+    it is capped by RESPONSE_CACHE_MAX_TTL, or RESPONSE_CACHE_LOCAL_MAX_TTL
+    when the cache is process-local and other workers cannot see bumps.
+
+    ``version`` is the namespace's data-version function (see
+    api.conditional); ``data_version`` serves its result from the cache per
+    generation, under the same TTL, so a conditional GET or a cache hit does
+    not re-run its aggregate queries.
+    """
+
+    def __init__(self, namespace, ttl=None, alias=None, dependents=(), version=None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.version = version
+        self.alias = alias
+        # Namespaces whose responses embed this one's data (bumped together)
+        self.dependents = tuple(dependents)
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias or settings.RESPONSE_CACHE_ALIAS]
+
+    @property
+    def max_ttl(self):
+        if isinstance(self.cache, LocMemCache):
+            return settings.RESPONSE_CACHE_LOCAL_MAX_TTL
+        return settings.RESPONSE_CACHE_MAX_TTL
+
+    def _generation_key(self, namespace=None):
+        return f'response:{namespace or self.namespace}:generation'
+
+    def generation(self):
+        key = self._generation_key()
+        generation = self.cache.get(key)
+        if generation is None:
+            self.cache.add(key, 1, timeout=None)
+            generation = self.cache.get(key, 1)
+        return generation
+
+    async def ageneration(self):
+        key = self._generation_key()
+        generation = await self.cache.aget(key)
+        if generation is None:
+            await self.cache.aadd(key, 1, timeout=None)
+            generation = await self.cache.aget(key, 1)
+        return generation
+
+    def bump(self):
+        """Invalidate every cached response in this namespace and its dependents."""
+        for namespace in (self.namespace, *self.dependents):
+            key = self._generation_key(namespace)
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.set(key, 2, timeout=None)
+
+    def data_version(self):
+        """``version()``, cached until the next bump or the TTL runs out."""
+        key = f'response:{self.namespace}:{self.generation()}:version'
+        version = self.cache.get(key)
+        if version is None:
+            # As for responses, the timeout is taken before the version is built
+            timeout = self._timeout()
+            version = self.version()
+            self.cache.set(key, version, timeout)
+        return version
+
+    def request_key(self, request, generation):
+        query = urlencode(sorted(request.GET.lists()), doseq=True)
+        return f'response:{self.namespace}:{generation}:{request.path}?{query}'
+
+    def _timeout(self):
+        ttl = self.ttl() if self.ttl else self.max_ttl
+        return max(1, min(math.ceil(ttl), self.max_ttl))
+
+    @staticmethod
+    def _headers(response):
+        return {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+
+    @staticmethod
+    def _freeze(response):
+        if hasattr(response, 'render'):
+            response.render()
+        return response.content, ResponseCache._headers(response)
+
+    @staticmethod
+    def _thaw(entry):
+        content, headers = entry
+        response = HttpResponse(content)
+        for name, value in headers.items():
+            response[name] = value
+        response['X-Cache'] = 'HIT'
+        return response
+
+    def _store(self, key, response, timeout):
+        if response.status_code == 200:
+            self.cache.set(key, self._freeze(response), timeout)
+        return response
+
+    def cached(self, view):
+        """Decorate a public GET view (sync or async) with this cache."""
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method != 'GET':
+                    return await view(request, *args, **kwargs)
+                key = self.request_key(request, await self.ageneration())
+                entry = await self.cache.aget(key)
+                if entry is not None:
+                    self.hits += 1
+                    return self._thaw(entry)
+
+                lock_key = f'{key}:lock'
+                locked = await self.cache.aadd(lock_key, 1, settings.RESPONSE_CACHE_LOCK_SECONDS)
+                if not locked:
+                    entry = await self._await_entry(key)
+                    if entry is not None:
+                        return self._thaw(entry)
+                self.misses += 1
+                try:
+                    # Taken before the view renders, so a status boundary
+                    # passing mid-render cannot extend the entry past it
+                    timeout = await sync_to_async(self._timeout)()
+                    response = await view(request, *args, **kwargs)
+                    if response.status_code == 200:
+                        await self.cache.aset(key, self._freeze(response), timeout)
+                    return response
+                finally:
+                    if locked:
+                        await self.cache.adelete(lock_key)
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(request, *args, **kwargs)
+            key = self.request_key(request, self.generation())
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.hits += 1
+                return self._thaw(entry)
+
+            lock_key = f'{key}:lock'
+            locked = self.cache.add(lock_key, 1, settings.RESPONSE_CACHE_LOCK_SECONDS)
+            if not locked:
+                entry = self._wait_for_entry(key)
+                if entry is not None:
+                    return self._thaw(entry)
+            self.misses += 1
+            try:
+                # Taken before the view renders, so a status boundary
+                # passing mid-render cannot extend the entry past it
+                timeout = self._timeout()
+                response = view(request, *args, **kwargs)
+                if response.streaming and response.status_code == 200:
+                    # The stream releases the lock once it has been sent
+                    response.streaming_content = self._tee(
+                        key, response.streaming_content, self._headers(response), timeout,
+                        lock_key if locked else None
+                    )
+                    locked = False
+                    return response
+                return self._store(key, response, timeout)
+            finally:
+                if locked:
+                    self.cache.delete(lock_key)
+        return wrapper
+
+    def _tee(self, key, chunks, headers, timeout, lock_key):
+        buffered, size = [], 0
+        try:
+            for chunk in chunks:
+                if buffered is not None:
+                    size += len(chunk)
+                    if size > settings.RESPONSE_CACHE_MAX_STREAM_BYTES:
+                        buffered = None
+                    else:
+                        buffered.append(chunk)
+                yield chunk
+            if buffered is not None:
+                self.cache.set(key, (b''.join(buffered), headers), timeout)
+        finally:
+            if lock_key:
+                self.cache.delete(lock_key)
+
+    def _wait_for_entry(self, key):
+        # Another request is rebuilding this entry; poll for it rather than
+        # running the same query. On timeout the caller builds it itself.
+        self.waits += 1
+        deadline = time.monotonic() + settings.RESPONSE_CACHE_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(0.02)
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+        logger.info("Response cache %s: gave up waiting for %s", self.namespace, key)
+        return None
+
+    async def _await_entry(self, key):
+        self.waits += 1
+        deadline = time.monotonic() + settings.RESPONSE_CACHE_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+            entry = await self.cache.aget(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+        logger.info("Response cache %s: gave up waiting for %s", self.namespace, key)
+        return None
+
+    def stats(self):
+        return {'namespace': self.namespace, 'hits': self.hits, 'misses': self.misses, 'waits': self.waits}
+
+
+def invalidate_responses(*namespaces):
+    """Bump the given namespaces by name (no ResponseCache instance needed)."""
+    for namespace in namespaces:
+        ResponseCache(namespace).bump()
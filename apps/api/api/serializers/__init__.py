@@ -8,6 +8,10 @@ from .event_serializer import (
     EventCreateSerializer,
     EventUpdateSerializer
 )
+from .event_occurrence_serializer import (
+    EventOccurrenceSerializer,
+    OccurrenceUpdateSerializer
+)
 from .announcement_serializer import (
     AnnouncementSerializer,
     AnnouncementCreateSerializer,
@@ -26,6 +30,15 @@ from .rsvp_serializer import (
     RSVPUpdateSerializer,
     RSVPStatsSerializer
 )
+from .read_serializers import (
+    serialize_events,
+    serialize_occurrences,
+    serialize_announcements,
+    serialize_officers,
+    EVENT_FIELDSET,
+    ANNOUNCEMENT_FIELDSET,
+    OFFICER_FIELDSET
+)
 
 __all__ = [
     # User serializers
@@ -36,6 +49,8 @@ __all__ = [
     'EventSerializer',
     'EventCreateSerializer',
     'EventUpdateSerializer',
+    'EventOccurrenceSerializer',
+    'OccurrenceUpdateSerializer',
     # Announcement serializers
     'AnnouncementSerializer',
     'AnnouncementCreateSerializer',
@@ -50,4 +65,12 @@ __all__ = [
     'RSVPCreateSerializer',
     'RSVPUpdateSerializer',
     'RSVPStatsSerializer',
+    # Fast read-only list serialization
+    'serialize_events',
+    'serialize_occurrences',
+    'serialize_announcements',
+    'serialize_officers',
+    'EVENT_FIELDSET',
+    'ANNOUNCEMENT_FIELDSET',
+    'OFFICER_FIELDSET',
 ] 
\ No newline at end of file
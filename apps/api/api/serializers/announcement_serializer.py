@@ -1,7 +1,22 @@
+from django.utils import timezone
 from rest_framework import serializers
 from api.models import Announcement
 
 
+def validate_schedule(data, instance=None):
+    """Check ``publish_at`` / ``expires_at`` against each other and the clock."""
+    if 'expires_at' not in data and 'publish_at' not in data:
+        return data
+    publish_at = data.get('publish_at', instance.publish_at if instance else None)
+    expires_at = data.get('expires_at', instance.expires_at if instance else None)
+    if expires_at:
+        if 'expires_at' in data and expires_at <= timezone.now():
+            raise serializers.ValidationError({'expires_at': 'Expiry time must be in the future.'})
+        if publish_at and expires_at <= publish_at:
+            raise serializers.ValidationError({'expires_at': 'Expiry time must be after the publish time.'})
+    return data
+
+
 class AnnouncementSerializer(serializers.ModelSerializer):
     """Serializer for Announcement model."""
     
@@ -10,14 +25,18 @@ class AnnouncementSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'content',
+            'content_html',
+            'excerpt',
             'display_text',
             'pinned',
             'is_draft',
             'discord_message_id',
+            'publish_at',
+            'expires_at',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'content_html', 'excerpt', 'created_at', 'updated_at']
     
     def validate_content(self, value):
         """Validate content length."""
@@ -37,7 +56,7 @@ class AnnouncementSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({
                 'display_text': 'Display text is required for pinned announcements.'
             })
-        return data
+        return validate_schedule(data, self.instance)
 
 
 class AnnouncementCreateSerializer(serializers.ModelSerializer):
@@ -45,7 +64,7 @@ class AnnouncementCreateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Announcement
-        fields = ['content', 'display_text', 'pinned', 'is_draft']
+        fields = ['content', 'display_text', 'pinned', 'is_draft', 'publish_at', 'expires_at']
     
     def validate_content(self, value):
         """Validate content length."""
@@ -65,7 +84,7 @@ class AnnouncementCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({
                 'display_text': 'Display text is required for pinned announcements.'
             })
-        return data
+        return validate_schedule(data)
 
 
 class AnnouncementUpdateSerializer(serializers.ModelSerializer):
@@ -73,7 +92,7 @@ class AnnouncementUpdateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Announcement
-        fields = ['content', 'display_text', 'pinned', 'is_draft']
+        fields = ['content', 'display_text', 'pinned', 'is_draft', 'publish_at', 'expires_at']
     
     def validate_content(self, value):
         """Validate content length."""
@@ -97,4 +116,4 @@ class AnnouncementUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({
                 'display_text': 'Display text is required for pinned announcements.'
             })
-        return data 
\ No newline at end of file
+        return validate_schedule(data, instance)
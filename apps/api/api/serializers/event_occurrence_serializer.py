@@ -0,0 +1,48 @@
+from rest_framework import serializers
+from api.models import EventOccurrence
+
+
+class EventOccurrenceSerializer(serializers.ModelSerializer):
+    """Serializer for one occurrence of an event, with the event's details."""
+
+    title = serializers.CharField(source='event.title', read_only=True)
+    description = serializers.CharField(source='event.description', read_only=True)
+    location = serializers.CharField(source='event.location', read_only=True)
+    meeting_link = serializers.URLField(source='event.meeting_link', read_only=True)
+    status = serializers.ReadOnlyField()
+    is_upcoming = serializers.SerializerMethodField()
+    is_ongoing = serializers.SerializerMethodField()
+    is_past = serializers.SerializerMethodField()
+    can_rsvp = serializers.ReadOnlyField()
+
+    class Meta:
+        model = EventOccurrence
+        fields = [
+            'id', 'event', 'title', 'description', 'location', 'meeting_link',
+            'start_at', 'end_at', 'original_start_at', 'status', 'is_upcoming',
+            'is_ongoing', 'is_past', 'can_rsvp', 'is_cancelled', 'is_exception',
+            'rsvp_count',
+        ]
+        read_only_fields = fields
+
+    def get_is_upcoming(self, obj):
+        return obj.status == 'upcoming'
+
+    def get_is_ongoing(self, obj):
+        return obj.status == 'ongoing'
+
+    def get_is_past(self, obj):
+        return obj.status == 'past'
+
+
+class OccurrenceUpdateSerializer(serializers.ModelSerializer):
+    """Serializer for moving, cancelling or restoring one occurrence."""
+
+    class Meta:
+        model = EventOccurrence
+        fields = ['start_at', 'end_at', 'is_cancelled']
+        extra_kwargs = {
+            'start_at': {'required': False},
+            'end_at': {'required': False},
+            'is_cancelled': {'required': False},
+        }
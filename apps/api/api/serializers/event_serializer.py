@@ -2,9 +2,25 @@ from rest_framework import serializers
 from django.utils import timezone
 from django.core.exceptions import ValidationError as DjangoValidationError
 from api.models import Event
+from api.recurrence import RecurrenceError, normalize_rule, parse_rule
 from .user_serializer import PublicUserSerializer
 
 
+def validate_recurrence(data, instance=None):
+    """Normalize ``recurrence_rule`` in ``data`` and check it against the event's start time."""
+    if 'recurrence_rule' not in data:
+        return data
+    rule = normalize_rule(data['recurrence_rule'])
+    data['recurrence_rule'] = rule
+    start_at = data.get('start_at', instance.start_at if instance else None)
+    if rule and start_at:
+        try:
+            parse_rule(rule, start_at)
+        except RecurrenceError as e:
+            raise serializers.ValidationError({'recurrence_rule': str(e)})
+    return data
+
+
 class EventSerializer(serializers.ModelSerializer):
     """Enhanced serializer for Event model with new fields and computed status."""
     
@@ -14,7 +30,7 @@ class EventSerializer(serializers.ModelSerializer):
     is_ongoing = serializers.ReadOnlyField()
     is_past = serializers.ReadOnlyField()
     can_rsvp = serializers.ReadOnlyField()
-    rsvp_count = serializers.IntegerField(read_only=True, required=False)
+    rsvp_count = serializers.IntegerField(source='rsvp_total', read_only=True)
     editable_fields = serializers.ReadOnlyField(source='get_editable_fields')
     
     class Meta:
@@ -25,12 +41,25 @@ class EventSerializer(serializers.ModelSerializer):
             'slides_url', 'recording_url', 'created_by',
             'created_at', 'updated_at', 'status', 'is_upcoming',
             'is_ongoing', 'is_past', 'can_rsvp', 'rsvp_count', 
-            'editable_fields',
+            'editable_fields', 'recurrence_rule',
             # Legacy field for backward compatibility
             'event_date'
         ]
         read_only_fields = ['id', 'created_by', 'created_at', 'updated_at', 'event_date']
     
+    def to_representation(self, instance):
+        """
+        Rows from ``Event.objects.with_status()`` carry their status already.
+        Otherwise read the clock once so status, flags and editable fields agree.
+        """
+        if 'computed_status' in instance.__dict__:
+            return super().to_representation(instance)
+        instance.computed_status = instance.status
+        try:
+            return super().to_representation(instance)
+        finally:
+            del instance.computed_status
+    
     def validate(self, data):
         """Validate event data."""
         # Only validate time fields if they are present (for updates)
@@ -52,7 +81,7 @@ class EventCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = ['title', 'description', 'location', 'start_at', 'end_at',
-                 'meeting_link', 'slides_url', 'recording_url']
+                 'meeting_link', 'slides_url', 'recording_url', 'recurrence_rule']
     
     def validate(self, data):
         """Validate event data."""
@@ -62,7 +91,7 @@ class EventCreateSerializer(serializers.ModelSerializer):
         if data['end_at'] <= data['start_at']:
             raise serializers.ValidationError("Event end time must be after start time.")
         
-        return data
+        return validate_recurrence(data)
     
     def validate_title(self, value):
         """Validate title length and content."""
@@ -77,7 +106,7 @@ class EventUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = ['title', 'description', 'location', 'start_at', 'end_at',
-                 'meeting_link', 'slides_url', 'recording_url']
+                 'meeting_link', 'slides_url', 'recording_url', 'recurrence_rule']
         extra_kwargs = {
             'title': {'required': False},
             'description': {'required': False},
@@ -87,6 +116,7 @@ class EventUpdateSerializer(serializers.ModelSerializer):
             'meeting_link': {'required': False},
             'slides_url': {'required': False},
             'recording_url': {'required': False},
+            'recurrence_rule': {'required': False},
         }
     
     def validate_title(self, value):
@@ -113,4 +143,4 @@ class EventUpdateSerializer(serializers.ModelSerializer):
         if start_at and end_at and end_at <= start_at:
             raise serializers.ValidationError("Event end time must be after start time.")
         
-        return data
\ No newline at end of file
+        return validate_recurrence(data, self.instance)
\ No newline at end of file
@@ -0,0 +1,322 @@
+"""
+Fast read-only serialization for the hot list endpoints.
+
+DRF builds field objects and walks them per row; for large lists that
+dominates CPU once the query itself is fast. The functions here produce
+exactly the same data (and therefore byte-identical JSON) as
+EventSerializer, AnnouncementSerializer and OfficerSerializer, using
+precompiled attribute getters. The DRF serializers remain the write and
+validation path and the reference for the output format.
+
+Each function also takes an optional FieldSelection (``?fields=`` /
+``?expand=``), in which case only the selected keys are built, reading only
+the columns the matching Fieldset projects with only().
+"""
+from operator import attrgetter
+
+from django.utils import timezone
+
+from api.fieldsets import Fieldset
+from api.models.event import EDITABLE_FIELDS_BY_STATUS
+
+
+def _datetime_formatter():
+    """Return a formatter matching DRF's ISO 8601 DateTimeField output."""
+    tz = timezone.get_current_timezone()
+
+    def format_datetime(value):
+        if not value:
+            return None
+        if timezone.is_aware(value):
+            value = value.astimezone(tz)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    return format_datetime
+
+
+_event_columns = attrgetter(
+    'id', 'title', 'description', 'location', 'start_at', 'end_at',
+    'meeting_link', 'slides_url', 'recording_url', 'created_by',
+    'created_at', 'updated_at', 'status', 'rsvp_total', 'recurrence_rule',
+    'event_date',
+)
+_announcement_columns = attrgetter(
+    'id', 'content', 'content_html', 'excerpt', 'display_text', 'pinned', 'is_draft',
+    'discord_message_id', 'publish_at', 'expires_at', 'created_at', 'updated_at',
+)
+_occurrence_columns = attrgetter(
+    'id', 'event', 'start_at', 'end_at', 'original_start_at', 'status',
+    'is_cancelled', 'is_exception', 'rsvp_count',
+)
+_officer_columns = attrgetter(
+    'id', 'user', 'name', 'position', 'bio', 'image_url', 'order_index',
+)
+_EDITABLE_FIELDS = {status: list(fields) for status, fields in EDITABLE_FIELDS_BY_STATUS.items()}
+
+_PUBLIC_USER_COLUMNS = ('id', 'full_name', 'role')
+
+# Output fields (in output order) -> model columns they read
+EVENT_FIELDSET = Fieldset(
+    {
+        'id': ('id',),
+        'title': ('title',),
+        'description': ('description',),
+        'location': ('location',),
+        'start_at': ('start_at',),
+        'end_at': ('end_at',),
+        'meeting_link': ('meeting_link',),
+        'slides_url': ('slides_url',),
+        'recording_url': ('recording_url',),
+        'created_by': ('created_by',),
+        'created_at': ('created_at',),
+        'updated_at': ('updated_at',),
+        # Derived from the computed_status annotation
+        'status': (),
+        'is_upcoming': (),
+        'is_ongoing': (),
+        'is_past': (),
+        'can_rsvp': (),
+        'rsvp_count': ('rsvp_count',),
+        'editable_fields': (),
+        'recurrence_rule': ('recurrence_rule',),
+        'event_date': ('event_date',),
+    },
+    expansions={'created_by': tuple(f'created_by__{column}' for column in _PUBLIC_USER_COLUMNS)},
+)
+ANNOUNCEMENT_FIELDSET = Fieldset(
+    {
+        'id': ('id',),
+        'content': ('content',),
+        'content_html': ('content_html',),
+        'excerpt': ('excerpt',),
+        # Computed by the database (AnnouncementQuerySet.with_content_length)
+        'content_length': (),
+        'display_text': ('display_text',),
+        'pinned': ('pinned',),
+        'is_draft': ('is_draft',),
+        'discord_message_id': ('discord_message_id',),
+        'publish_at': ('publish_at',),
+        'expires_at': ('expires_at',),
+        'created_at': ('created_at',),
+        'updated_at': ('updated_at',),
+    },
+    # List cards: the stored excerpt and the body's length, never the body
+    # itself, which only GET /announcements/<id>/ returns
+    views={
+        'compact': (
+            'id', 'excerpt', 'content_length', 'display_text', 'pinned', 'is_draft',
+            'publish_at', 'expires_at', 'created_at', 'updated_at',
+        ),
+    },
+)
+OFFICER_FIELDSET = Fieldset(
+    {
+        'id': ('id',),
+        'user': ('user',),
+        'name': ('name',),
+        'full_name': ('user__full_name',),
+        'user_email': ('user__email',),
+        'position': ('position',),
+        'bio': ('bio',),
+        'image_url': ('image_url',),
+        'order_index': ('order_index',),
+    },
+    expansions={'user': tuple(f'user__{column}' for column in _PUBLIC_USER_COLUMNS)},
+)
+
+
+def _public_user(user):
+    if user is None:
+        return None
+    return {'id': user.id, 'full_name': user.full_name, 'role': user.role}
+
+
+def _select(rows, getters, selection):
+    getters = [(name, getters[name]) for name in selection.fields]
+    return [{name: get(row) for name, get in getters} for row in rows]
+
+
+def _status_getter(status):
+    return lambda event: event.status == status
+
+
+def _event_getters(fmt, expand):
+    if 'created_by' in expand:
+        created_by = lambda event: _public_user(event.created_by)
+    else:
+        created_by = attrgetter('created_by_id')
+    getters = {
+        name: attrgetter(name)
+        for name in ('id', 'title', 'description', 'location', 'meeting_link',
+                     'slides_url', 'recording_url', 'status', 'recurrence_rule')
+    }
+    for name in ('start_at', 'end_at', 'created_at', 'updated_at', 'event_date'):
+        getters[name] = lambda event, get=attrgetter(name): fmt(get(event))
+    getters.update({
+        'created_by': created_by,
+        'is_upcoming': _status_getter('upcoming'),
+        'is_ongoing': _status_getter('ongoing'),
+        'is_past': _status_getter('past'),
+        'can_rsvp': _status_getter('upcoming'),
+        'rsvp_count': attrgetter('rsvp_total'),
+        'editable_fields': lambda event: list(_EDITABLE_FIELDS[event.status]),
+    })
+    return getters
+
+
+def _announcement_getters(fmt):
+    getters = {
+        name: attrgetter(name)
+        for name in ('id', 'content', 'content_html', 'excerpt', 'display_text', 'pinned', 'is_draft',
+                     'discord_message_id')
+    }
+    for name in ('publish_at', 'expires_at', 'created_at', 'updated_at'):
+        getters[name] = lambda announcement, get=attrgetter(name): fmt(get(announcement))
+    # Lists annotate it; a single announcement has its content loaded anyway
+    getters['content_length'] = lambda announcement: (
+        announcement.content_length if hasattr(announcement, 'content_length') else len(announcement.content)
+    )
+    return getters
+
+
+def _officer_getters(expand):
+    getters = {
+        name: attrgetter(name)
+        for name in ('id', 'name', 'position', 'bio', 'image_url', 'order_index')
+    }
+    if 'user' in expand:
+        getters['user'] = lambda officer: _public_user(officer.user)
+    else:
+        getters['user'] = attrgetter('user_id')
+    getters['full_name'] = lambda officer: officer.user.full_name if officer.user_id else None
+    getters['user_email'] = lambda officer: officer.user.email if officer.user_id else None
+    return getters
+
+
+def serialize_events(events, selection=None):
+    """Equivalent of ``EventSerializer(events, many=True).data``."""
+    fmt = _datetime_formatter()
+    if selection is not None:
+        return _select(events, _event_getters(fmt, selection.expand), selection)
+    data = []
+    for event in events:
+        (pk, title, description, location, start_at, end_at, meeting_link,
+         slides_url, recording_url, created_by, created_at, updated_at,
+         status, rsvp_total, recurrence_rule, event_date) = _event_columns(event)
+        data.append({
+            'id': pk,
+            'title': title,
+            'description': description,
+            'location': location,
+            'start_at': fmt(start_at),
+            'end_at': fmt(end_at),
+            'meeting_link': meeting_link,
+            'slides_url': slides_url,
+            'recording_url': recording_url,
+            'created_by': _public_user(created_by),
+            'created_at': fmt(created_at),
+            'updated_at': fmt(updated_at),
+            'status': status,
+            'is_upcoming': status == 'upcoming',
+            'is_ongoing': status == 'ongoing',
+            'is_past': status == 'past',
+            'can_rsvp': status == 'upcoming',
+            'rsvp_count': rsvp_total,
+            'editable_fields': list(_EDITABLE_FIELDS[status]),
+            'recurrence_rule': recurrence_rule,
+            'event_date': fmt(event_date),
+        })
+    return data
+
+
+def serialize_occurrences(occurrences):
+    """Equivalent of ``EventOccurrenceSerializer(occurrences, many=True).data``."""
+    fmt = _datetime_formatter()
+    data = []
+    for occurrence in occurrences:
+        (pk, event, start_at, end_at, original_start_at, status, is_cancelled,
+         is_exception, rsvp_count) = _occurrence_columns(occurrence)
+        data.append({
+            'id': pk,
+            'event': event.id,
+            'title': event.title,
+            'description': event.description,
+            'location': event.location,
+            'meeting_link': event.meeting_link,
+            'start_at': fmt(start_at),
+            'end_at': fmt(end_at),
+            'original_start_at': fmt(original_start_at),
+            'status': status,
+            'is_upcoming': status == 'upcoming',
+            'is_ongoing': status == 'ongoing',
+            'is_past': status == 'past',
+            'can_rsvp': status == 'upcoming' and not is_cancelled,
+            'is_cancelled': is_cancelled,
+            'is_exception': is_exception,
+            'rsvp_count': rsvp_count,
+        })
+    return data
+
+
+def serialize_announcements(announcements, selection=None):
+    """Equivalent of ``AnnouncementSerializer(announcements, many=True).data``."""
+    fmt = _datetime_formatter()
+    if selection is not None:
+        return _select(announcements, _announcement_getters(fmt), selection)
+    data = []
+    for announcement in announcements:
+        (pk, content, content_html, excerpt, display_text, pinned, is_draft, discord_message_id,
+         publish_at, expires_at, created_at, updated_at) = _announcement_columns(announcement)
+        data.append({
+            'id': pk,
+            'content': content,
+            'content_html': content_html,
+            'excerpt': excerpt,
+            'display_text': display_text,
+            'pinned': pinned,
+            'is_draft': is_draft,
+            'discord_message_id': discord_message_id,
+            'publish_at': fmt(publish_at),
+            'expires_at': fmt(expires_at),
+            'created_at': fmt(created_at),
+            'updated_at': fmt(updated_at),
+        })
+    return data
+
+
+def serialize_officers(officers, selection=None):
+    """Equivalent of ``OfficerSerializer(officers, many=True).data``."""
+    if selection is not None:
+        return _select(officers, _officer_getters(selection.expand), selection)
+    data = []
+    for officer in officers:
+        pk, user, name, position, bio, image_url, order_index = _officer_columns(officer)
+        if user is not None:
+            data.append({
+                'id': pk,
+                'user': _public_user(user),
+                'name': name,
+                'full_name': user.full_name,
+                'user_email': user.email,
+                'position': position,
+                'bio': bio,
+                'image_url': image_url,
+                'order_index': order_index,
+            })
+        else:
+            # OfficerSerializer skips the user.* fields and re-adds them last
+            data.append({
+                'id': pk,
+                'user': None,
+                'name': name,
+                'position': position,
+                'bio': bio,
+                'image_url': image_url,
+                'order_index': order_index,
+                'full_name': None,
+                'user_email': None,
+            })
+    return data
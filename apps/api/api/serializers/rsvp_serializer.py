@@ -13,6 +13,7 @@ class RSVPSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'event',
+            'occurrence',
             'event_title',
             'event_date',
             'name',
@@ -20,7 +21,7 @@ class RSVPSerializer(serializers.ModelSerializer):
             'comment',
             'created_at'
         ]
-        read_only_fields = ['id', 'event', 'event_title', 'event_date', 'created_at']
+        read_only_fields = ['id', 'event', 'occurrence', 'event_title', 'event_date', 'created_at']
     
     def validate_email(self, value):
         """Validate email format."""
@@ -40,7 +41,7 @@ class RSVPCreateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = EventRSVP
-        fields = ['name', 'email', 'comment']
+        fields = ['name', 'email', 'comment', 'occurrence']
     
     def validate_email(self, value):
         """Validate email format."""
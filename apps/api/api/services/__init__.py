@@ -1,13 +1,21 @@
 from .user_service import UserService
 from .event_service import EventService
 from .announcement_service import AnnouncementService
+from .discord_outbox_service import DiscordOutboxService
 from .officer_service import OfficerService
 from .rsvp_service import RSVPService
+from .feed_service import FeedService
+from .search_service import SearchService
+from .occurrence_service import OccurrenceService
 
 __all__ = [
     'UserService',
     'EventService',
     'AnnouncementService',
+    'DiscordOutboxService',
     'OfficerService',
     'RSVPService',
+    'FeedService',
+    'SearchService',
+    'OccurrenceService',
 ] 
\ No newline at end of file
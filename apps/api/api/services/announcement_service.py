@@ -1,5 +1,12 @@
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, Max, Min
+from django.utils import timezone
 from api.models import Announcement
+from api.live import notify
+from api.rendering import render_content
+from api.response_cache import invalidate_responses
+from .discord_outbox_service import DiscordOutboxService
 
 
 class AnnouncementService:
@@ -11,9 +18,18 @@ class AnnouncementService:
         return Announcement.objects.all()
 
     @staticmethod
-    def get_published_announcements():
-        """Get only published announcements for public consumption."""
-        return Announcement.objects.filter(is_draft=False).order_by('-pinned', '-created_at')
+    def get_published_announcements(now=None):
+        """Get only published announcements for public consumption (live at ``now``)."""
+        return Announcement.objects.published(now).order_by('-pinned', '-created_at')
+    
+    @staticmethod
+    def filter_announcements(queryset, pinned=None, is_draft=None):
+        """Narrow an announcement queryset by the AnnouncementFilters contract."""
+        if pinned is not None:
+            queryset = queryset.filter(pinned=pinned)
+        if is_draft is not None:
+            queryset = queryset.filter(is_draft=is_draft)
+        return queryset
     
     @staticmethod
     def get_pinned_announcements():
@@ -22,6 +38,41 @@ class AnnouncementService:
             pinned=True
         ).order_by('-created_at')
     
+    @staticmethod
+    def next_visibility_boundary(now=None):
+        """
+        The next publish_at or expires_at after ``now``, i.e. when the set of
+        published announcements changes without a write. Visibility follows
+        the clock even while run_announcement_schedule is behind.
+        """
+        now = now or timezone.now()
+        # Two MIN lookups, each answered from its partial due-work index
+        boundaries = [
+            Announcement.objects.filter(
+                is_draft=False, **{f'{field}__isnull': False, f'{field}__gt': now}
+            ).aggregate(boundary=Min(field))['boundary']
+            for field in ('publish_at', 'expires_at')
+        ]
+        upcoming = [b for b in boundaries if b is not None]
+        return min(upcoming) if upcoming else None
+    
+    @staticmethod
+    def seconds_until_next_boundary(now=None):
+        """Seconds until the next visibility boundary, or None if nothing is scheduled."""
+        now = now or timezone.now()
+        boundary = AnnouncementService.next_visibility_boundary(now)
+        return (boundary - now).total_seconds() if boundary else None
+    
+    @staticmethod
+    def get_data_version():
+        """
+        Cheap ``(token, last_modified)`` version of the announcements table
+        and the current visibility epoch (identified by the next boundary).
+        """
+        version = Announcement.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+        next_boundary = AnnouncementService.next_visibility_boundary()
+        return f"announcements:{version['count']}:{version['updated']}:{next_boundary}", version['updated']
+    
     @staticmethod
     def get_announcement_by_id(announcement_id):
         """Get a specific announcement by ID."""
@@ -30,31 +81,80 @@ class AnnouncementService:
         except Announcement.DoesNotExist:
             return None
     
+    @staticmethod
+    def get_published_announcement_by_id(announcement_id, now=None):
+        """Get a specific announcement by ID, if the public can see it at ``now``."""
+        return Announcement.objects.published(now).filter(id=announcement_id).first()
+    
     @staticmethod
     @transaction.atomic
     def create_announcement(announcement_data):
-        """Create a new announcement."""
+        """Create a new announcement (scheduled if ``publish_at`` is in the future)."""
+        now = timezone.now()
+        publish_at = announcement_data.get('publish_at')
+        content_html, excerpt = render_content(announcement_data['content'])
         announcement = Announcement.objects.create(
             content=announcement_data['content'],
+            content_html=content_html,
+            excerpt=excerpt,
             display_text=announcement_data.get('display_text'),
             pinned=announcement_data.get('pinned', False),
-            is_draft=announcement_data.get('is_draft', True)
+            is_draft=announcement_data.get('is_draft', True),
+            publish_at=publish_at if publish_at and publish_at > now else None,
+            expires_at=announcement_data.get('expires_at')
         )
+        if announcement.is_live(now):
+            AnnouncementService._announce(announcement)
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return announcement
     
     @staticmethod
     @transaction.atomic
     def update_announcement(announcement, announcement_data):
         """Update an existing announcement."""
-        allowed_fields = ['content', 'display_text', 'pinned', 'is_draft']
+        allowed_fields = ['content', 'display_text', 'pinned', 'is_draft', 'publish_at', 'expires_at']
+        now = timezone.now()
+        was_live = announcement.is_live(now)
+        was_pinned, old_content = announcement.pinned, announcement.content
         
         for field, value in announcement_data.items():
             if field in allowed_fields:
                 setattr(announcement, field, value)
+        if announcement.content != old_content:
+            announcement.content_html, announcement.excerpt = render_content(announcement.content)
+        if announcement.publish_at and announcement.publish_at <= now:
+            # Due already; publish now rather than leave it for the worker
+            announcement.publish_at = None
         
         announcement.save()
+        is_live = announcement.is_live(now)
+        if was_live and not is_live:
+            AnnouncementService._withdraw(announcement)
+        elif is_live and not was_live:
+            AnnouncementService._announce(announcement)
+        elif is_live:
+            # Only the content goes to Discord
+            if announcement.content != old_content:
+                DiscordOutboxService.queue_edit(announcement)
+            if announcement.pinned != was_pinned:
+                notify('announcement.pinned', {'id': announcement.id, 'pinned': announcement.pinned})
+            else:
+                notify('announcement.updated', {'id': announcement.id})
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return announcement
     
+    @staticmethod
+    def _announce(announcement):
+        """Side effects of an announcement going live: Discord and /api/stream/."""
+        DiscordOutboxService.queue_publish(announcement)
+        notify('announcement.published', {'id': announcement.id, 'pinned': announcement.pinned})
+    
+    @staticmethod
+    def _withdraw(announcement):
+        """Side effects of a live announcement going away (unpublished, expired or deleted)."""
+        DiscordOutboxService.queue_delete(announcement)
+        notify('announcement.removed', {'id': announcement.id})
+    
     @staticmethod
     @transaction.atomic
     def toggle_pin_status(announcement, display_text=None):
@@ -71,10 +171,75 @@ class AnnouncementService:
             announcement.display_text = None
             
         announcement.save()
+        if announcement.is_live():
+            notify('announcement.pinned', {'id': announcement.id, 'pinned': announcement.pinned})
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return announcement
     
     @staticmethod
     @transaction.atomic
     def delete_announcement(announcement):
         """Delete an announcement."""
-        announcement.delete() 
\ No newline at end of file
+        if announcement.is_live():
+            AnnouncementService._withdraw(announcement)
+        elif announcement.discord_message_id:
+            DiscordOutboxService.queue_delete(announcement)
+        announcement.delete()
+        transaction.on_commit(lambda: invalidate_responses('feed'))
+    
+    @staticmethod
+    def due_announcements(field, now=None):
+        """
+        Announcements whose ``field`` (publish_at or expires_at) is due, in
+        due order, served by that field's partial index. Locked FOR UPDATE
+        SKIP LOCKED where supported, so workers on several nodes claim
+        disjoint batches instead of queueing on each other; evaluate it
+        inside a transaction.
+        """
+        due = Announcement.objects.filter(
+            is_draft=False, **{f'{field}__isnull': False, f'{field}__lte': now or timezone.now()}
+        ).order_by(field, 'id')
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        return due
+    
+    @staticmethod
+    def run_schedule(now=None, batch_size=None):
+        """
+        Expire, then publish, every due announcement, one locked batch per
+        transaction. Expiry goes first so an announcement that is past both
+        times is never posted just to be taken down. Returns
+        ``(published, expired)``.
+        """
+        now = now or timezone.now()
+        batch_size = batch_size or settings.ANNOUNCEMENT_SCHEDULE_BATCH_SIZE
+        counts = {}
+        for field, handle in (('expires_at', AnnouncementService._expire),
+                              ('publish_at', AnnouncementService._publish_scheduled)):
+            counts[field] = 0
+            while True:
+                with transaction.atomic():
+                    batch = list(AnnouncementService.due_announcements(field, now)[:batch_size])
+                    for announcement in batch:
+                        handle(announcement)
+                    if batch:
+                        transaction.on_commit(lambda: invalidate_responses('feed'))
+                counts[field] += len(batch)
+                if len(batch) < batch_size:
+                    break
+        return counts['publish_at'], counts['expires_at']
+    
+    @staticmethod
+    def _publish_scheduled(announcement):
+        announcement.publish_at = None
+        announcement.save(update_fields=['publish_at', 'updated_at'])
+        AnnouncementService._announce(announcement)
+    
+    @staticmethod
+    def _expire(announcement):
+        # Back to a plain draft: an officer can republish it with new times
+        announcement.is_draft = True
+        announcement.publish_at = None
+        announcement.expires_at = None
+        announcement.save(update_fields=['is_draft', 'publish_at', 'expires_at', 'updated_at'])
+        AnnouncementService._withdraw(announcement)
@@ -0,0 +1,290 @@
+import logging
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.discord import DiscordError, DiscordRateLimited
+from api.models import Announcement, DiscordOutbox
+from api.response_cache import invalidate_responses
+
+
+logger = logging.getLogger(__name__)
+
+# Longest a failing row waits between retries
+RETRY_MAX_SECONDS = 15 * 60
+
+
+class DiscordOutboxService:
+    """
+    Transactional outbox for announcement messages on Discord.
+
+    AnnouncementService queues a row in the same transaction as each
+    published, edited or deleted announcement; the publish_discord worker
+    drains the queue with ``drain``. Nothing here calls Discord from a request.
+    """
+
+    @staticmethod
+    def is_enabled():
+        return bool(settings.DISCORD_WEBHOOK_URL)
+
+    @staticmethod
+    def _pending(announcement_id):
+        # Rows a worker has claimed (in flight, or locked while being claimed)
+        # are left out, so a change made mid-send gets its own row instead of
+        # being folded into one whose content has already been read
+        pending = DiscordOutbox.objects.filter(announcement_id=announcement_id, status=DiscordOutbox.STATUS_PENDING)
+        if connection.features.has_select_for_update_skip_locked:
+            pending = pending.select_for_update(skip_locked=True)
+        return list(pending)
+
+    @staticmethod
+    def _enqueue(announcement_id, action, message_id=None, delay=0):
+        return DiscordOutbox.objects.create(
+            announcement_id=announcement_id,
+            action=action,
+            message_id=message_id,
+            available_at=timezone.now() + timedelta(seconds=delay),
+        )
+
+    @staticmethod
+    def queue_publish(announcement):
+        """Queue posting a newly published announcement."""
+        if not DiscordOutboxService.is_enabled():
+            return None
+        pending = DiscordOutboxService._pending(announcement.id)
+        if any(row.action == DiscordOutbox.ACTION_PUBLISH for row in pending):
+            return None
+
+        deletes = [row for row in pending if row.action == DiscordOutbox.ACTION_DELETE]
+        if deletes:
+            # Unpublished and republished before the worker ran: the old
+            # message is still up, so keep it and bring it up to date
+            DiscordOutbox.objects.filter(id__in=[row.id for row in deletes]).delete()
+        if announcement.discord_message_id:
+            return DiscordOutboxService._enqueue(announcement.id, DiscordOutbox.ACTION_EDIT)
+        return DiscordOutboxService._enqueue(announcement.id, DiscordOutbox.ACTION_PUBLISH)
+
+    @staticmethod
+    def queue_edit(announcement):
+        """
+        Queue editing a published announcement's message. Rapid successive
+        edits coalesce: a queued publish or edit already sends whatever the
+        content is when it goes out, and a new edit waits
+        DISCORD_EDIT_DELAY_SECONDS for more changes to fold into it.
+        """
+        if not DiscordOutboxService.is_enabled():
+            return None
+        pending = DiscordOutboxService._pending(announcement.id)
+        if any(row.action in (DiscordOutbox.ACTION_PUBLISH, DiscordOutbox.ACTION_EDIT) for row in pending):
+            return None
+        return DiscordOutboxService._enqueue(
+            announcement.id, DiscordOutbox.ACTION_EDIT, delay=settings.DISCORD_EDIT_DELAY_SECONDS
+        )
+
+    @staticmethod
+    def queue_delete(announcement):
+        """Queue removing an announcement's message (on delete or unpublish)."""
+        if not DiscordOutboxService.is_enabled():
+            return None
+        pending = DiscordOutboxService._pending(announcement.id)
+        if any(row.action == DiscordOutbox.ACTION_DELETE for row in pending):
+            return None
+        DiscordOutbox.objects.filter(id__in=[row.id for row in pending]).delete()
+        if not announcement.discord_message_id and any(row.action == DiscordOutbox.ACTION_PUBLISH for row in pending):
+            # Never posted; dropping the publish is enough
+            return None
+        # Queued even without a message id: a publish may be in flight, and
+        # the worker looks the id up again when the delete goes out
+        return DiscordOutboxService._enqueue(
+            announcement.id, DiscordOutbox.ACTION_DELETE, message_id=announcement.discord_message_id
+        )
+
+    @staticmethod
+    def drain(client, batch_size=None, now=None):
+        """
+        Send up to ``batch_size`` due outbox rows. Returns a dict of counts,
+        plus ``retry_after`` (seconds) when Discord rate limited the batch.
+
+        Rows are leased in a short transaction of their own (see ``_claim``),
+        then sent outside any transaction, each outcome saved as soon as it
+        is known; a failure part way through never rolls back what was
+        already posted. Rows for the same announcement in one batch are
+        coalesced first: a delete absorbs everything before it, and a
+        publish absorbs edits.
+        """
+        batch_size = batch_size or settings.DISCORD_OUTBOX_BATCH_SIZE
+        result = {'sent': 0, 'coalesced': 0, 'retried': 0, 'failed': 0, 'retry_after': None}
+        rows = DiscordOutboxService._claim(batch_size, now or timezone.now())
+
+        by_announcement = {}
+        for row in sorted(rows, key=lambda row: row.id):
+            by_announcement.setdefault(row.announcement_id, []).append(row)
+        steps = [step for group in by_announcement.values() for step in DiscordOutboxService._coalesce(group)]
+
+        for index, (send, absorbed) in enumerate(steps):
+            retry_after = DiscordOutboxService._process(client, send, absorbed, result)
+            if retry_after is not None:
+                # Leave the rest of the batch for when the limit lifts
+                result['retry_after'] = retry_after
+                DiscordOutboxService._release(
+                    [row for send, absorbed in steps[index + 1:] for row in [send, *absorbed] if row is not None],
+                    timezone.now() + timedelta(seconds=retry_after),
+                )
+                return result
+        return result
+
+    @staticmethod
+    @transaction.atomic
+    def _claim(batch_size, now):
+        """
+        Lease up to ``batch_size`` due rows to this worker: ``in_flight``
+        until DISCORD_OUTBOX_LEASE_SECONDS from now. Pending rows and rows
+        whose lease ran out are both due. Claimed with SELECT ... FOR UPDATE
+        SKIP LOCKED where supported, so several workers can drain side by
+        side; queue_* calls only fold changes into pending rows, so nothing
+        is added to a row after it has been claimed.
+        """
+        due = DiscordOutbox.objects.filter(
+            status__in=[DiscordOutbox.STATUS_PENDING, DiscordOutbox.STATUS_IN_FLIGHT], available_at__lte=now
+        )
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        rows = list(due.order_by('available_at', 'id')[:batch_size])
+        if rows:
+            DiscordOutbox.objects.filter(id__in=[row.id for row in rows]).update(
+                status=DiscordOutbox.STATUS_IN_FLIGHT,
+                available_at=timezone.now() + timedelta(seconds=settings.DISCORD_OUTBOX_LEASE_SECONDS),
+            )
+        return rows
+
+    @staticmethod
+    def _release(rows, available_at):
+        """Hand leased rows back to the queue, due at ``available_at``."""
+        if rows:
+            DiscordOutbox.objects.filter(id__in=[row.id for row in rows]).update(
+                status=DiscordOutbox.STATUS_PENDING, available_at=available_at
+            )
+
+    @staticmethod
+    def _coalesce(group):
+        """
+        Reduce one announcement's rows (oldest first) to ``(row to send, rows
+        it absorbs)`` steps. Everything up to the last delete folds into that
+        delete; of the rest, a publish absorbs edits and the first edit
+        absorbs later ones, since every send uses the current content.
+        """
+        steps = []
+        deletes = [i for i, row in enumerate(group) if row.action == DiscordOutbox.ACTION_DELETE]
+        if deletes:
+            delete, earlier = group[deletes[-1]], group[:deletes[-1]]
+            if not delete.message_id and any(row.action == DiscordOutbox.ACTION_PUBLISH for row in earlier):
+                # Published and deleted before anything went out
+                steps.append((None, [*earlier, delete]))
+            else:
+                steps.append((delete, earlier))
+            group = group[deletes[-1] + 1:]
+        if group:
+            publishes = [row for row in group if row.action == DiscordOutbox.ACTION_PUBLISH]
+            send = publishes[0] if publishes else group[0]
+            steps.append((send, [row for row in group if row is not send]))
+        return steps
+
+    @staticmethod
+    def _process(client, send, absorbed, result):
+        """
+        Send one coalesced step and save its outcome in its own transaction;
+        returns Discord's retry-after if it was rate limited. Anything other
+        than a DiscordError leaves the step leased, to be retried when the
+        lease runs out.
+        """
+        error = None
+        if send is not None:
+            try:
+                DiscordOutboxService._send(client, send)
+            except DiscordRateLimited as e:
+                # Not the row's fault, so no attempt is counted
+                DiscordOutboxService._release([send, *absorbed], timezone.now() + timedelta(seconds=e.retry_after))
+                return e.retry_after
+            except DiscordError as e:
+                error = e
+
+        with transaction.atomic():
+            if send is not None:
+                if error is None:
+                    result['sent'] += 1
+                    DiscordOutboxService._mark_sent([send])
+                else:
+                    result['retried' if DiscordOutboxService._retry(send, error) else 'failed'] += 1
+            # Absorbed rows are done either way: a retried row sends the
+            # announcement as it is when it finally goes out
+            DiscordOutboxService._mark_sent(absorbed)
+        result['coalesced'] += len(absorbed)
+        return None
+
+    @staticmethod
+    def _send(client, row):
+        announcement = Announcement.objects.filter(id=row.announcement_id).first()
+
+        if row.action == DiscordOutbox.ACTION_DELETE:
+            message_id = row.message_id or (announcement and announcement.discord_message_id)
+            if message_id:
+                client.delete_message(message_id)
+                if announcement is not None:
+                    DiscordOutboxService._record_message_id(announcement.id, message_id, None)
+            return
+
+        if announcement is None or not announcement.is_live():
+            # Deleted, unpublished or expired since this was queued; its delete row covers it
+            return
+        if row.action == DiscordOutbox.ACTION_EDIT and not announcement.discord_message_id:
+            # Never posted (or its publish is still retrying); nothing to edit
+            return
+        if announcement.discord_message_id:
+            if client.edit_message(announcement.discord_message_id, announcement.content):
+                return
+            # Removed on the Discord side; post it again
+
+        message_id = client.create_message(announcement.content)
+        if not DiscordOutboxService._record_message_id(announcement.id, announcement.discord_message_id, message_id):
+            # The announcement was deleted while we were posting it
+            client.delete_message(message_id)
+
+    @staticmethod
+    def _record_message_id(announcement_id, previous, message_id):
+        """Swap the announcement's message id from ``previous``; False if the announcement is gone."""
+        updated = Announcement.objects.filter(id=announcement_id, discord_message_id=previous).update(
+            discord_message_id=message_id, updated_at=timezone.now()
+        )
+        if updated:
+            transaction.on_commit(lambda: invalidate_responses('feed'))
+            return True
+        return Announcement.objects.filter(id=announcement_id).exists()
+
+    @staticmethod
+    def _retry(row, error):
+        """Back off a failed row; returns False once it has been given up on."""
+        row.attempts += 1
+        row.last_error = str(error)
+        if error.retryable and row.attempts < settings.DISCORD_OUTBOX_MAX_ATTEMPTS:
+            delay = min(RETRY_MAX_SECONDS, 2 ** row.attempts)
+            row.status = DiscordOutbox.STATUS_PENDING
+            row.available_at = timezone.now() + timedelta(seconds=random.uniform(delay / 2, delay))
+            row.save(update_fields=['attempts', 'last_error', 'status', 'available_at'])
+            logger.warning("Discord %s for announcement %s failed (attempt %s): %s",
+                           row.action, row.announcement_id, row.attempts, error)
+            return True
+        row.status = DiscordOutbox.STATUS_FAILED
+        row.processed_at = timezone.now()
+        row.save(update_fields=['attempts', 'last_error', 'status', 'processed_at'])
+        logger.error("Giving up on Discord %s for announcement %s: %s", row.action, row.announcement_id, error)
+        return False
+
+    @staticmethod
+    def _mark_sent(rows):
+        if rows:
+            DiscordOutbox.objects.filter(id__in=[row.id for row in rows]).update(
+                status=DiscordOutbox.STATUS_SENT, processed_at=timezone.now()
+            )
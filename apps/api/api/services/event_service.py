@@ -1,7 +1,12 @@
 from django.db import transaction
+from django.db.models import Count, Max, Min, Prefetch
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from api.models import Event
+from api.models import Event, EventOccurrence, EventRSVP
+from api.calendar import CALENDAR_COLUMNS, CALENDAR_EXCEPTION_COLUMNS
+from api.live import notify
+from api.response_cache import ResponseCache
+from .occurrence_service import OccurrenceService
 
 
 class EventService:
@@ -11,38 +16,57 @@ class EventService:
     """
     
     @staticmethod
-    def get_all_events():
+    def get_all_events(now=None):
         """Get all events ordered by start time."""
-        return Event.objects.all().select_related('created_by').order_by('start_at')
+        return Event.objects.with_status(now).with_rsvp_counts().select_related('created_by').order_by('start_at')
     
     @staticmethod
-    def get_upcoming_events():
-        """Get all upcoming events."""
-        return Event.objects.filter(
-            start_at__gt=timezone.now()
+    def get_upcoming_events(now=None):
+        """Get all upcoming events (recurring ones with an instance still to come)."""
+        return Event.objects.with_status(now).with_rsvp_counts().filter(
+            computed_status='upcoming'
         ).select_related('created_by').order_by('start_at')
     
     @staticmethod
-    def get_ongoing_events():
+    def get_ongoing_events(now=None):
         """Get all ongoing events."""
-        now = timezone.now()
-        return Event.objects.filter(
-            start_at__lte=now,
-            end_at__gt=now
+        return Event.objects.with_status(now).with_rsvp_counts().filter(
+            computed_status='ongoing'
         ).select_related('created_by').order_by('start_at')
     
     @staticmethod
-    def get_past_events():
+    def get_past_events(now=None):
         """Get all past events."""
-        return Event.objects.filter(
-            end_at__lte=timezone.now()
+        return Event.objects.with_status(now).with_rsvp_counts().filter(
+            computed_status='past'
         ).select_related('created_by').order_by('-start_at')
     
+    @staticmethod
+    def filter_events(queryset, status=None, date_from=None, date_to=None,
+                      location=None, created_by=None):
+        """
+        Narrow an event queryset by the EventFilters contract.
+        ``status`` is a list of 'upcoming'/'ongoing'/'past' matched against
+        the queryset's ``computed_status`` (see Event.objects.with_status);
+        the date bounds apply to ``start_at``.
+        """
+        if status:
+            queryset = queryset.filter(computed_status__in=status)
+        if date_from:
+            queryset = queryset.filter(start_at__gte=date_from)
+        if date_to:
+            queryset = queryset.filter(start_at__lt=date_to)
+        if location:
+            queryset = queryset.filter(location__icontains=location)
+        if created_by:
+            queryset = queryset.filter(created_by_id=created_by)
+        return queryset
+    
     @staticmethod
     def get_event_by_id(event_id):
         """Get a specific event by ID."""
         try:
-            return Event.objects.select_related('created_by').get(id=event_id)
+            return Event.objects.with_status().with_rsvp_counts().select_related('created_by').get(id=event_id)
         except Event.DoesNotExist:
             return None
     
@@ -67,14 +91,22 @@ class EventService:
             meeting_link=event_data.get('meeting_link'),
             slides_url=event_data.get('slides_url'),
             recording_url=event_data.get('recording_url'),
+            recurrence_rule=event_data.get('recurrence_rule'),
             created_by=user
         )
+        OccurrenceService.sync_occurrences(event)
+        notify('event.created', {'id': event.id})
+        transaction.on_commit(event_response_cache.bump)
         return event
     
     @staticmethod
     @transaction.atomic
-    def create_event_without_user(event_data):
-        """Create a new event without user association (for officers hub)."""
+    def create_event_without_user(event_data, check_conflicts=False):
+        """
+        Create a new event without user association (for officers hub).
+        With ``check_conflicts``, ``event.conflicts`` lists occurrences of
+        other events double-booking its location.
+        """
         # Validate start_at is in the future
         if event_data['start_at'] <= timezone.now():
             raise ValidationError("Event start time must be in the future.")
@@ -92,14 +124,57 @@ class EventService:
             meeting_link=event_data.get('meeting_link'),
             slides_url=event_data.get('slides_url'),
             recording_url=event_data.get('recording_url'),
+            recurrence_rule=event_data.get('recurrence_rule'),
             created_by=None  # No user association for officers hub
         )
+        OccurrenceService.sync_occurrences(event)
+        if check_conflicts:
+            event.conflicts = OccurrenceService.find_conflicts(event)
+        notify('event.created', {'id': event.id})
+        transaction.on_commit(event_response_cache.bump)
         return event
     
     @staticmethod
     @transaction.atomic
-    def update_event(event, event_data):
-        """Update an existing event with status-based restrictions."""
+    def bulk_create_events(events_data, user=None):
+        """
+        Insert already-validated events (see api.event_import) with one
+        bulk_create, and their occurrences, in a single transaction.
+        """
+        events = Event.objects.bulk_create(
+            [
+                Event(
+                    title=event_data['title'],
+                    description=event_data.get('description'),
+                    location=event_data.get('location'),
+                    start_at=event_data['start_at'],
+                    end_at=event_data['end_at'],
+                    meeting_link=event_data.get('meeting_link'),
+                    slides_url=event_data.get('slides_url'),
+                    recording_url=event_data.get('recording_url'),
+                    recurrence_rule=event_data.get('recurrence_rule'),
+                    # bulk_create skips Event.save(), which keeps this in sync
+                    event_date=event_data['start_at'],
+                    created_by=user
+                )
+                for event_data in events_data
+            ],
+            batch_size=500
+        )
+        OccurrenceService.create_occurrences(events)
+        if events:
+            # One notice for the whole import rather than one per row
+            notify('event.imported', {'count': len(events)})
+            transaction.on_commit(event_response_cache.bump)
+        return events
+    
+    @staticmethod
+    @transaction.atomic
+    def update_event(event, event_data, check_conflicts=False):
+        """
+        Update an existing event with status-based restrictions.
+        ``check_conflicts`` works as in create_event_without_user.
+        """
         editable_fields = event.get_editable_fields()
         
         # Validate that only editable fields are being updated
@@ -123,10 +198,18 @@ class EventService:
         
         # Apply updates
         for field, value in event_data.items():
-            if field in editable_fields and value is not None:
+            if field in editable_fields and (value is not None or field == 'recurrence_rule'):
                 setattr(event, field, value)
         
         event.save()
+        moved = bool({'start_at', 'end_at', 'recurrence_rule'} & event_data.keys())
+        if moved:
+            # Regenerate only the occurrences the change affects
+            OccurrenceService.sync_occurrences(event)
+        if check_conflicts:
+            event.conflicts = OccurrenceService.find_conflicts(event)
+        notify('event.moved' if moved else 'event.updated', {'id': event.id})
+        transaction.on_commit(event_response_cache.bump)
         return event
     
     @staticmethod
@@ -136,16 +219,67 @@ class EventService:
         if event.status != 'upcoming':
             raise ValidationError("Only upcoming events can be deleted.")
         
+        notify('event.deleted', {'id': event.id})
         event.delete()
+        transaction.on_commit(event_response_cache.bump)
         return True
     
     @staticmethod
-    def get_events_with_rsvp_counts():
-        """Get all events with RSVP counts."""
-        from django.db.models import Count
-        return Event.objects.annotate(
-            rsvp_count=Count('rsvps')
-        ).select_related('created_by').order_by('start_at')
+    def get_events_with_rsvp_counts(now=None):
+        """Get all events with RSVP counts (maintained on the row, no join)."""
+        return Event.objects.with_status(now).with_rsvp_counts().select_related('created_by').order_by('start_at')
+    
+    @staticmethod
+    def get_calendar_events(now=None):
+        """Get events for the iCalendar feed, reading only the columns a VEVENT needs."""
+        exceptions = EventOccurrence.objects.filter(is_exception=True).only(*CALENDAR_EXCEPTION_COLUMNS)
+        return (
+            Event.objects.with_status(now).only(*CALENDAR_COLUMNS)
+            .prefetch_related(Prefetch('occurrences', queryset=exceptions, to_attr='exceptions'))
+            .order_by('start_at', 'id')
+        )
+    
+    @staticmethod
+    def next_status_boundary(now=None):
+        """
+        The next start_at or end_at after ``now``, i.e. when some event's or
+        occurrence's status changes. A recurring event's own times are only
+        its first instance, so the occurrences are checked as well.
+        """
+        now = now or timezone.now()
+        # MIN lookups, each answered from its start_at/end_at index
+        boundaries = [
+            model.objects.filter(**{f'{field}__gt': now}).aggregate(boundary=Min(field))['boundary']
+            for model in (Event, EventOccurrence)
+            for field in ('start_at', 'end_at')
+        ]
+        upcoming = [b for b in boundaries if b is not None]
+        return min(upcoming) if upcoming else None
+    
+    @staticmethod
+    def seconds_until_next_boundary(now=None):
+        """Seconds until the next status boundary, or None if no event will change status."""
+        now = now or timezone.now()
+        boundary = EventService.next_status_boundary(now)
+        return (boundary - now).total_seconds() if boundary else None
+    
+    @staticmethod
+    def get_data_version():
+        """
+        Cheap ``(token, last_modified)`` version of everything the public event
+        endpoints return: event rows, RSVP counts and the current status epoch
+        (identified by the next status boundary).
+        """
+        now = timezone.now()
+        events = Event.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+        rsvps = EventRSVP.objects.aggregate(count=Count('id'), last_id=Max('id'), created=Max('created_at'))
+        next_boundary = EventService.next_status_boundary(now)
+        last_modified = max(filter(None, [events['updated'], rsvps['created']]), default=None)
+        token = (
+            f"events:{events['count']}:{events['updated']}:"
+            f"{rsvps['count']}:{rsvps['last_id']}:{next_boundary}"
+        )
+        return token, last_modified
     
     @staticmethod
     def sync_rsvp_to_google_calendar(event):
@@ -156,4 +290,14 @@ class EventService:
         # TODO: Implement Google Calendar API integration
         # - Update event description with current RSVP count
         # - Optionally add RSVP'd attendees to calendar event
-        pass 
\ No newline at end of file
+        pass
+
+
+# Public event GET responses and their ETag version; they only change on
+# writes or at a status boundary
+event_response_cache = ResponseCache(
+    'events',
+    ttl=lambda: EventService.seconds_until_next_boundary() or float('inf'),
+    dependents=('feed',),
+    version=EventService.get_data_version,
+)
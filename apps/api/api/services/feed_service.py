@@ -0,0 +1,63 @@
+from django.utils import timezone
+from api.response_cache import ResponseCache
+from api.serializers import serialize_announcements, serialize_events, serialize_officers
+from .announcement_service import AnnouncementService
+from .event_service import EventService
+from .officer_service import OfficerService
+
+
+class FeedService:
+    """
+    Service layer for the public homepage feed: upcoming events, pinned and
+    latest announcements and the officer roster in a single document.
+    """
+    
+    DEFAULT_EVENT_LIMIT = 3
+    DEFAULT_ANNOUNCEMENT_LIMIT = 5
+    MAX_LIMIT = 20
+    
+    @staticmethod
+    def build_feed(event_limit=DEFAULT_EVENT_LIMIT, announcement_limit=DEFAULT_ANNOUNCEMENT_LIMIT):
+        """Build the feed document (already serialized)."""
+        now = timezone.now()
+        upcoming_events = EventService.get_upcoming_events(now)[:event_limit]
+        published = AnnouncementService.get_published_announcements()
+        pinned = published.filter(pinned=True).exclude(display_text__isnull=True).exclude(display_text='')
+        
+        return {
+            'upcoming_events': serialize_events(upcoming_events),
+            'pinned_announcements': serialize_announcements(pinned),
+            'announcements': serialize_announcements(published.order_by('-created_at')[:announcement_limit]),
+            'officers': serialize_officers(OfficerService.get_all_officers()),
+        }
+    
+    @staticmethod
+    def get_data_version():
+        """Combined ``(token, last_modified)`` of the three sources of the feed."""
+        versions = [
+            EventService.get_data_version(),
+            AnnouncementService.get_data_version(),
+            OfficerService.get_data_version(),
+        ]
+        token = '|'.join(token for token, _ in versions)
+        last_modified = max(filter(None, (modified for _, modified in versions)), default=None)
+        return f'feed:{token}', last_modified
+
+
+def _seconds_until_feed_changes():
+    now = timezone.now()
+    boundaries = [
+        EventService.seconds_until_next_boundary(now),
+        AnnouncementService.seconds_until_next_boundary(now),
+    ]
+    return min(filter(None, boundaries), default=float('inf'))
+
+
+# The rendered feed document and its ETag version; bumped by event, RSVP,
+# announcement, officer and linked-user writes, and expires when the next
+# event changes status or a scheduled announcement is published or expires
+feed_response_cache = ResponseCache(
+    'feed',
+    ttl=_seconds_until_feed_changes,
+    version=FeedService.get_data_version,
+)
@@ -0,0 +1,257 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from api.models import Event, EventOccurrence
+from api.live import notify
+from api.recurrence import RecurrenceError, expand, whole_seconds
+from api.response_cache import invalidate_responses
+from api.time_ranges import filter_overlapping, filter_overlapping_any
+
+
+# Most double-bookings reported for one event
+CONFLICT_LIMIT = 20
+
+
+class OccurrenceService:
+    """
+    Service layer for materialized event occurrences.
+    Range queries read the occurrences table; RRULEs are only expanded on write.
+    """
+
+    @staticmethod
+    def get_occurrences(now=None):
+        """Get all occurrences with their status and parent event."""
+        return EventOccurrence.objects.with_status(now).select_related('event').order_by('start_at', 'id')
+
+    @staticmethod
+    def filter_occurrences(queryset, status=None, date_from=None, date_to=None, location=None,
+                           created_by=None, event_id=None, include_cancelled=False):
+        """Narrow an occurrence queryset like EventService.filter_events narrows events."""
+        if status:
+            queryset = queryset.filter(computed_status__in=status)
+        if date_from and date_to:
+            queryset = filter_overlapping(queryset, date_from, date_to)
+        elif date_from:
+            queryset = queryset.filter(end_at__gt=date_from)
+        elif date_to:
+            queryset = queryset.filter(start_at__lt=date_to)
+        if location:
+            queryset = queryset.filter(event__location__icontains=location)
+        if created_by:
+            queryset = queryset.filter(event__created_by_id=created_by)
+        if event_id:
+            queryset = queryset.filter(event_id=event_id)
+        if not include_cancelled:
+            queryset = queryset.filter(is_cancelled=False)
+        return queryset
+
+    @staticmethod
+    def get_occurrence(event_id, occurrence_id):
+        """Get one occurrence of an event."""
+        return OccurrenceService.get_occurrences().filter(event_id=event_id, id=occurrence_id).first()
+
+    @staticmethod
+    def find_conflicts(event, now=None, limit=CONFLICT_LIMIT):
+        """
+        Occurrences of other events booked at ``event``'s location that
+        overlap any of its upcoming occurrences (online-only events, with no
+        location, never conflict).
+        """
+        location = (event.location or '').strip()
+        if not location:
+            return []
+        now = now or timezone.now()
+        ranges = list(
+            event.occurrences.filter(is_cancelled=False, end_at__gt=now).values_list('start_at', 'end_at')
+        )
+        candidates = (
+            OccurrenceService.get_occurrences(now)
+            .filter(event__location__iexact=location, is_cancelled=False)
+            .exclude(event_id=event.pk)
+        )
+        return list(filter_overlapping_any(candidates, ranges)[:limit])
+
+    @staticmethod
+    @transaction.atomic
+    def sync_occurrences(event, now=None):
+        """
+        Bring ``event``'s occurrences in line with its times and rule, touching
+        only the rows that differ. Instances that have already ended are
+        history and left alone; future instances whose slot disappeared are
+        moved onto new slots where possible, otherwise cancelled if they hold
+        RSVPs and deleted if not. Returns ``(created, updated, removed)``.
+        """
+        now = now or timezone.now()
+        duration = event.end_at - event.start_at
+        existing = {occurrence.original_start_at: occurrence for occurrence in event.occurrences.all()}
+
+        if not event.recurrence_rule:
+            return OccurrenceService._sync_single(event, existing, now)
+        # Instances are matched at whole-second precision, like expand() produces them
+        existing = {whole_seconds(start): occurrence for start, occurrence in existing.items()}
+
+        horizon = now + timedelta(days=settings.EVENT_OCCURRENCE_HORIZON_DAYS)
+        try:
+            starts = expand(event.recurrence_rule, event.start_at, horizon, settings.EVENT_OCCURRENCE_MAX)
+        except RecurrenceError as e:
+            raise ValidationError(str(e))
+        wanted = set(starts)
+
+        missing = [start for start in starts if start not in existing]
+        stale = sorted(
+            (occurrence for start, occurrence in existing.items() if start not in wanted and occurrence.end_at > now),
+            key=lambda occurrence: occurrence.original_start_at
+        )
+
+        # Rescheduling the series shifts every slot: move unmatched future
+        # instances onto the new slots in order, so their RSVPs follow
+        movable = [occurrence for occurrence in stale if not occurrence.is_exception]
+        new_slots = [start for start in missing if start + duration > now]
+        updated = []
+        for occurrence, start in zip(movable, new_slots):
+            occurrence.original_start_at, occurrence.start_at, occurrence.end_at = start, start, start + duration
+            updated.append(occurrence)
+        moved = {occurrence.pk for occurrence in updated}
+        rekeyed = {occurrence.original_start_at for occurrence in updated}
+        stale = [occurrence for occurrence in stale if occurrence.pk not in moved]
+
+        created = [
+            EventOccurrence(event=event, original_start_at=start, start_at=start, end_at=start + duration)
+            for start in missing if start not in rekeyed
+        ]
+        for start, occurrence in existing.items():
+            if start not in wanted or occurrence.is_exception or occurrence.end_at <= now:
+                continue
+            if occurrence.start_at != start or occurrence.end_at != start + duration:
+                occurrence.start_at, occurrence.end_at = start, start + duration
+                updated.append(occurrence)
+
+        keep = [occurrence.pk for occurrence in stale if occurrence.rsvp_count and not occurrence.is_cancelled]
+        removed = [occurrence.pk for occurrence in stale if not occurrence.rsvp_count]
+
+        EventOccurrence.objects.bulk_create(created)
+        EventOccurrence.objects.bulk_update(updated, ['original_start_at', 'start_at', 'end_at'])
+        EventOccurrence.objects.filter(pk__in=keep).update(is_cancelled=True, is_exception=True)
+        EventOccurrence.objects.filter(pk__in=removed).delete()
+
+        changes = (len(created), len(updated), len(keep) + len(removed))
+        if any(changes):
+            OccurrenceService._touch(event)
+        return changes
+
+    @staticmethod
+    def create_occurrences(events):
+        """
+        Materialize occurrences for newly created events: one bulk insert for
+        all one-off events, a sync per recurring one.
+        """
+        EventOccurrence.objects.bulk_create(
+            [
+                EventOccurrence(event=event, original_start_at=event.start_at, start_at=event.start_at, end_at=event.end_at)
+                for event in events if not event.recurrence_rule
+            ],
+            batch_size=500
+        )
+        for event in events:
+            if event.recurrence_rule:
+                OccurrenceService.sync_occurrences(event)
+
+    @staticmethod
+    def _sync_single(event, existing, now):
+        # A one-off event is its own single occurrence, moved in place so its
+        # RSVPs follow a reschedule
+        primary = existing.get(event.start_at)
+        if primary is None and len(existing) == 1:
+            primary = next(iter(existing.values()))
+        if primary is None:
+            primary = next((
+                occurrence for start, occurrence in sorted(existing.items())
+                if occurrence.end_at > now and not occurrence.is_cancelled
+            ), None)
+
+        created = updated = 0
+        if primary is None:
+            EventOccurrence.objects.create(
+                event=event, original_start_at=event.start_at, start_at=event.start_at, end_at=event.end_at
+            )
+            created = 1
+        elif (primary.original_start_at, primary.start_at, primary.end_at, primary.is_cancelled) != (
+            event.start_at, event.start_at, event.end_at, False
+        ):
+            EventOccurrence.objects.filter(pk=primary.pk).update(
+                original_start_at=event.start_at, start_at=event.start_at, end_at=event.end_at,
+                is_cancelled=False, is_exception=False,
+            )
+            updated = 1
+
+        # Left over from a removed recurrence rule
+        stale = [
+            occurrence for occurrence in existing.values()
+            if occurrence is not primary and occurrence.end_at > now
+        ]
+        keep = [occurrence.pk for occurrence in stale if occurrence.rsvp_count and not occurrence.is_cancelled]
+        removed = [occurrence.pk for occurrence in stale if not occurrence.rsvp_count]
+        EventOccurrence.objects.filter(pk__in=keep).update(is_cancelled=True, is_exception=True)
+        EventOccurrence.objects.filter(pk__in=removed).delete()
+
+        changes = (created, updated, len(keep) + len(removed))
+        if any(changes):
+            OccurrenceService._touch(event)
+        return changes
+
+    @staticmethod
+    def _touch(event):
+        # Occurrences are part of the event responses and their data version
+        Event.objects.filter(pk=event.pk).update(updated_at=timezone.now())
+        transaction.on_commit(lambda: invalidate_responses('events', 'feed'))
+
+    @staticmethod
+    @transaction.atomic
+    def update_occurrence(occurrence, occurrence_data):
+        """
+        Cancel, restore or move a single occurrence. Moved or cancelled
+        occurrences become exceptions that regeneration leaves alone.
+        """
+        if not occurrence.event.recurrence_rule:
+            raise ValidationError("Edit the event itself to change a one-off event.")
+        if occurrence.end_at <= timezone.now():
+            raise ValidationError("Past occurrences cannot be changed.")
+
+        start_at = occurrence_data.get('start_at', occurrence.start_at)
+        end_at = occurrence_data.get('end_at', occurrence.end_at)
+        if end_at <= start_at:
+            raise ValidationError("Occurrence end time must be after start time.")
+
+        occurrence.start_at, occurrence.end_at = start_at, end_at
+        if 'is_cancelled' in occurrence_data:
+            occurrence.is_cancelled = occurrence_data['is_cancelled']
+        duration = occurrence.event.end_at - occurrence.event.start_at
+        occurrence.is_exception = occurrence.is_cancelled or (
+            (start_at, end_at) != (occurrence.original_start_at, occurrence.original_start_at + duration)
+        )
+        occurrence.__dict__.pop('computed_status', None)
+        occurrence.save(update_fields=['start_at', 'end_at', 'is_cancelled', 'is_exception'])
+        OccurrenceService._touch(occurrence.event)
+        notify('event.moved', {
+            'id': occurrence.event_id,
+            'occurrence_id': occurrence.id,
+            'start_at': occurrence.start_at,
+            'end_at': occurrence.end_at,
+            'is_cancelled': occurrence.is_cancelled,
+        })
+        return occurrence
+
+    @staticmethod
+    def extend_horizon(now=None, event_ids=None):
+        """Materialize newly-in-horizon instances of every recurring event."""
+        events = Event.objects.exclude(recurrence_rule__isnull=True).exclude(recurrence_rule='')
+        if event_ids:
+            events = events.filter(id__in=event_ids)
+        totals = [0, 0, 0]
+        for event in events.order_by('id').iterator():
+            for index, count in enumerate(OccurrenceService.sync_occurrences(event, now)):
+                totals[index] += count
+        return tuple(totals)
@@ -1,5 +1,7 @@
 from django.db import transaction
+from django.db.models import Count, Max
 from api.models import Officer, User
+from api.response_cache import invalidate_responses
 
 
 class OfficerService:
@@ -13,6 +15,15 @@ class OfficerService:
         """Get all publicly displayed officers ordered by order_index."""
         return Officer.objects.all().select_related('user').order_by('order_index', 'position')
     
+    @staticmethod
+    def get_data_version():
+        """
+        Cheap ``(token, last_modified)`` version of the officers table.
+        Edits to a linked user's profile touch the officer row (see UserService).
+        """
+        version = Officer.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+        return f"officers:{version['count']}:{version['updated']}", version['updated']
+    
     @staticmethod
     def get_officer_by_id(officer_id):
         """Get a specific officer by ID."""
@@ -46,6 +57,7 @@ class OfficerService:
             image_url=officer_data.get('image_url'),
             order_index=officer_data.get('order_index', 0)
         )
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return officer
     
     @staticmethod
@@ -60,6 +72,7 @@ class OfficerService:
             image_url=officer_data.get('image_url'),
             order_index=officer_data.get('order_index', 0)
         )
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return officer
     
     @staticmethod
@@ -73,6 +86,7 @@ class OfficerService:
                 setattr(officer, field, value)
         
         officer.save()
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return officer
     
     @staticmethod
@@ -80,6 +94,7 @@ class OfficerService:
     def delete_officer_profile(officer):
         """Delete an officer profile (removes from public listing)."""
         officer.delete()
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return True
     
     @staticmethod
@@ -97,4 +112,5 @@ class OfficerService:
             except Officer.DoesNotExist:
                 continue
         
+        transaction.on_commit(lambda: invalidate_responses('feed'))
         return True 
\ No newline at end of file
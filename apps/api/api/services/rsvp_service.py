@@ -1,5 +1,13 @@
+import random
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import transaction, IntegrityError
-from api.models import EventRSVP, Event
+from django.db.models import F
+from django.db.models.functions import Greatest
+from api.live import notify
+from api.models import EventRSVP, Event, EventOccurrence, EventRSVPCounterShard
+from .event_service import event_response_cache
 
 
 class RSVPService:
@@ -9,9 +17,12 @@ class RSVPService:
     """
     
     @staticmethod
-    def get_rsvps_for_event(event):
-        """Get all RSVPs for a specific event."""
-        return EventRSVP.objects.filter(event=event).order_by('-created_at')
+    def get_rsvps_for_event(event, occurrence_id=None):
+        """Get all RSVPs for a specific event, or for one of its occurrences."""
+        rsvps = EventRSVP.objects.filter(event=event)
+        if occurrence_id:
+            rsvps = rsvps.filter(occurrence_id=occurrence_id)
+        return rsvps.order_by('-created_at')
     
     @staticmethod
     def get_rsvp_by_id(rsvp_id):
@@ -22,31 +33,101 @@ class RSVPService:
             return None
     
     @staticmethod
-    def check_existing_rsvp(event, email):
-        """Check if an RSVP already exists for this event and email."""
+    def check_existing_rsvp(event, email, occurrence=None):
+        """Check if an RSVP already exists for this event (or occurrence) and email."""
         try:
-            return EventRSVP.objects.get(event=event, email=email)
+            if occurrence is not None:
+                return EventRSVP.objects.get(occurrence=occurrence, email=email)
+            return EventRSVP.objects.get(event=event, email=email, occurrence__isnull=True)
         except EventRSVP.DoesNotExist:
             return None
     
     @staticmethod
+    def _resolve_occurrence(event, occurrence):
+        """
+        Return the occurrence an RSVP is for. Recurring events need one picked;
+        a one-off event's RSVPs go to its single occurrence.
+        """
+        if occurrence is None:
+            if event.recurrence_rule:
+                raise ValidationError("Choose which occurrence of this recurring event to RSVP to.")
+            return event.occurrences.order_by('original_start_at').first()
+        
+        if occurrence.event_id != event.pk:
+            raise ValidationError("Occurrence does not belong to this event.")
+        if not occurrence.can_rsvp:
+            raise ValidationError("RSVPs are closed for this occurrence.")
+        return occurrence
+    
+    @staticmethod
+    def _adjust_rsvp_count(event, delta):
+        """
+        Atomically add ``delta`` to the event's RSVP counter: directly on the
+        event row, or on a random counter shard when RSVP_COUNTER_SHARDS is set.
+        Decrements never take a counter below zero.
+        """
+        shards = settings.RSVP_COUNTER_SHARDS
+        if delta < 0:
+            if shards:
+                # Take it back from a shard still holding RSVPs; once they're
+                # all drained, the RSVP was already folded into the event row
+                shard = EventRSVPCounterShard.objects.filter(
+                    event_id=event.pk, count__gt=0
+                ).order_by('?').first()
+                if shard and EventRSVPCounterShard.objects.filter(pk=shard.pk, count__gt=0).update(
+                    count=Greatest(F('count') + delta, 0)
+                ):
+                    return
+            Event.objects.filter(pk=event.pk).update(rsvp_count=Greatest(F('rsvp_count') + delta, 0))
+            return
+        if not shards:
+            Event.objects.filter(pk=event.pk).update(rsvp_count=F('rsvp_count') + delta)
+            return
+        
+        index = random.randrange(shards)
+        shard = EventRSVPCounterShard.objects.filter(event_id=event.pk, shard=index)
+        if not shard.update(count=F('count') + delta):
+            # First use of this shard; another request may be creating it too
+            EventRSVPCounterShard.objects.bulk_create(
+                [EventRSVPCounterShard(event_id=event.pk, shard=index, count=0)],
+                ignore_conflicts=True
+            )
+            shard.update(count=F('count') + delta)
+    
+    @staticmethod
+    def _notify_count(event_id, occurrence_id, change):
+        # The counters were bumped with F() and their totals are not read
+        # back, so stream clients get the change rather than a count
+        notify('rsvp.count', {'event_id': event_id, 'occurrence_id': occurrence_id, 'change': change})
+    
+    @staticmethod
+    @transaction.atomic
     def create_rsvp(event, rsvp_data):
         """
-        Create a new RSVP for an event.
+        Create a new RSVP for an event (or one occurrence of it).
         Handles duplicate RSVP prevention.
         """
+        occurrence = RSVPService._resolve_occurrence(event, rsvp_data.get('occurrence'))
+        
         # First check if RSVP already exists
-        existing_rsvp = RSVPService.check_existing_rsvp(event, rsvp_data['email'])
+        existing_rsvp = RSVPService.check_existing_rsvp(event, rsvp_data['email'], occurrence)
         if existing_rsvp:
             return existing_rsvp, False  # Already exists
         
         # Create new RSVP
         rsvp = EventRSVP.objects.create(
             event=event,
+            occurrence=occurrence,
             name=rsvp_data.get('name'),
             email=rsvp_data['email'],
             comment=rsvp_data.get('comment')
         )
+        RSVPService._adjust_rsvp_count(event, 1)
+        if occurrence is not None:
+            EventOccurrence.objects.filter(pk=occurrence.pk).update(rsvp_count=F('rsvp_count') + 1)
+        RSVPService._notify_count(event.pk, occurrence.pk if occurrence else None, 1)
+        # RSVP counts are part of the cached event responses
+        transaction.on_commit(event_response_cache.bump)
         return rsvp, True  # Created successfully
     
     @staticmethod
@@ -67,6 +148,13 @@ class RSVPService:
     def delete_rsvp(rsvp):
         """Delete an RSVP."""
         rsvp.delete()
+        RSVPService._adjust_rsvp_count(rsvp.event, -1)
+        if rsvp.occurrence_id:
+            EventOccurrence.objects.filter(pk=rsvp.occurrence_id).update(
+                rsvp_count=Greatest(F('rsvp_count') - 1, 0)
+            )
+        RSVPService._notify_count(rsvp.event_id, rsvp.occurrence_id, -1)
+        transaction.on_commit(event_response_cache.bump)
         return True
     
     @staticmethod
@@ -0,0 +1,172 @@
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.text import Truncator
+from api.models import Announcement, Event, Officer
+
+
+# Text search configuration used by the search_vector columns (migration 0014)
+SEARCH_CONFIG = 'english'
+EXCERPT_LENGTH = 160
+
+
+class SearchService:
+    """
+    Service layer for ranked search across events, announcements and officers.
+
+    On PostgreSQL, matches use each table's generated ``search_vector``
+    column (GIN-indexed) plus a trigram match on the title column, so small
+    typos in titles and names still match. Elsewhere (SQLite for local runs)
+    a simple ``icontains`` scan is ranked in Python with the same weights.
+    """
+
+    # resource -> public queryset, searched fields with their ts_rank weights
+    # (A=1.0, B=0.4, C=0.2), title column and excerpt column
+    RESOURCES = {
+        'event': {
+            'queryset': lambda: Event.objects.all(),
+            'fields': {'title': 1.0, 'location': 0.4, 'description': 0.2},
+            'title': 'title',
+            'excerpt': 'description',
+        },
+        'announcement': {
+            'queryset': lambda: Announcement.objects.published(),
+            'fields': {'display_text': 1.0, 'content': 0.4},
+            'title': 'display_text',
+            'excerpt': 'excerpt',
+        },
+        'officer': {
+            'queryset': lambda: Officer.objects.all(),
+            'fields': {'name': 1.0, 'position': 0.4, 'bio': 0.2},
+            'title': 'name',
+            'excerpt': 'position',
+        },
+    }
+
+    @staticmethod
+    def uses_postgres():
+        return connection.vendor == 'postgresql'
+
+    @staticmethod
+    def filter_queryset(queryset, resource, query):
+        """Restrict ``queryset`` to rows matching ``query``, best match first on PostgreSQL."""
+        spec = SearchService.RESOURCES[resource]
+        if SearchService.uses_postgres():
+            return SearchService._postgres_match(queryset, spec, query).order_by('-search_rank', 'pk')
+        return SearchService._fallback_match(queryset, spec, query)
+
+    @staticmethod
+    def search(query, resources=None, limit=20):
+        """Return up to ``limit`` ranked results across ``resources`` (default: all)."""
+        results = []
+        for resource in resources or SearchService.RESOURCES:
+            spec = SearchService.RESOURCES[resource]
+            queryset = spec['queryset']().only(*SearchService._columns(spec))
+            if SearchService.uses_postgres():
+                matches = SearchService._postgres_match(queryset, spec, query).order_by('-search_rank', 'pk')[:limit]
+            else:
+                matches = SearchService._fallback_rank(SearchService._fallback_match(queryset, spec, query), spec, query)[:limit]
+            results.extend(SearchService._result(resource, spec, row) for row in matches)
+
+        results.sort(key=lambda result: -result['rank'])
+        return results[:limit]
+
+    @staticmethod
+    def autocomplete(query, resources=None, limit=10):
+        """Return up to ``limit`` titles that start with, or closely resemble, ``query``."""
+        suggestions = []
+        for resource in resources or SearchService.RESOURCES:
+            spec = SearchService.RESOURCES[resource]
+            title = spec['title']
+            queryset = spec['queryset']().filter(**{f'{title}__isnull': False}).only('pk', title)
+            if SearchService.uses_postgres():
+                column = SearchService._column_sql(queryset, title)
+                # Both ILIKE 'prefix%' and %> are served by the trigram index
+                prefix = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                queryset = queryset.annotate(
+                    search_match=RawSQL(
+                        f'({column} ILIKE %s OR {column} %%> %s)', (prefix, query), output_field=BooleanField()
+                    ),
+                    search_rank=RawSQL(f'word_similarity(%s, {column})', (query,), output_field=FloatField()),
+                ).filter(search_match=True)
+                rows = [(row, row.search_rank) for row in queryset.order_by('-search_rank', 'pk')[:limit]]
+            else:
+                queryset = queryset.filter(**{f'{title}__icontains': query})
+                rows = [
+                    (row, 1.0 if getattr(row, title).lower().startswith(query.lower()) else 0.5)
+                    for row in queryset[:limit]
+                ]
+            suggestions.extend(
+                {'type': resource, 'id': row.pk, 'title': getattr(row, title), 'rank': round(rank, 4)}
+                for row, rank in rows
+            )
+
+        suggestions.sort(key=lambda suggestion: -suggestion['rank'])
+        return suggestions[:limit]
+
+    @staticmethod
+    def _columns(spec):
+        return {'pk', spec['title'], spec['excerpt'], *spec['fields']}
+
+    @staticmethod
+    def _column_sql(queryset, column):
+        return f'"{queryset.model._meta.db_table}"."{column}"'
+
+    @staticmethod
+    def _postgres_match(queryset, spec, query):
+        vector = SearchService._column_sql(queryset, 'search_vector')
+        title = SearchService._column_sql(queryset, spec['title'])
+        tsquery = 'websearch_to_tsquery(%s::regconfig, %s)'
+        return queryset.annotate(
+            search_match=RawSQL(
+                f'({vector} @@ {tsquery} OR {title} %%> %s)',
+                (SEARCH_CONFIG, query, query),
+                output_field=BooleanField(),
+            ),
+            search_rank=RawSQL(
+                f"(ts_rank_cd({vector}, {tsquery}) + word_similarity(%s, coalesce({title}, '')))",
+                (SEARCH_CONFIG, query, query),
+                output_field=FloatField(),
+            ),
+        ).filter(search_match=True)
+
+    @staticmethod
+    def _fallback_match(queryset, spec, query):
+        for term in query.split():
+            queryset = queryset.filter(
+                reduce(or_, (Q(**{f'{field}__icontains': term}) for field in spec['fields']))
+            )
+        return queryset
+
+    @staticmethod
+    def _fallback_rank(rows, spec, query):
+        terms = query.lower().split()
+        ranked = []
+        for row in rows:
+            row.search_rank = sum(
+                weight
+                for field, weight in spec['fields'].items()
+                for term in terms
+                if term in (getattr(row, field) or '').lower()
+            )
+            ranked.append(row)
+        ranked.sort(key=lambda row: (-row.search_rank, row.pk))
+        return ranked
+
+    @staticmethod
+    def _result(resource, spec, row):
+        title = getattr(row, spec['title'])
+        excerpt = getattr(row, spec['excerpt']) or ''
+        if not title:
+            # Unpinned announcements have no display text; lead with the content
+            title = Truncator(excerpt).chars(80)
+        return {
+            'type': resource,
+            'id': row.pk,
+            'title': title,
+            'excerpt': Truncator(excerpt).chars(EXCERPT_LENGTH),
+            'rank': round(row.search_rank, 4),
+        }
@@ -1,5 +1,9 @@
 from django.db import transaction
-from api.models import User
+from django.utils import timezone
+from api.models import Event, Officer, User
+from api.middleware.clerk_auth import invalidate_cached_user
+from api.response_cache import invalidate_responses
+from .event_service import event_response_cache
 
 
 class UserService:
@@ -43,7 +47,9 @@ class UserService:
             user.email = user_data.get('email', user.email)
             user.full_name = user_data.get('full_name', user.full_name)
             user.save()
-            
+            UserService.touch_public_listings(user)
+        
+        transaction.on_commit(lambda: invalidate_cached_user(clerk_user_id))
         return user
     
     @staticmethod
@@ -57,4 +63,18 @@ class UserService:
                 setattr(user, field, value)
         
         user.save()
-        return user 
\ No newline at end of file
+        UserService.touch_public_listings(user)
+        transaction.on_commit(lambda: invalidate_cached_user(user.clerk_user_id))
+        return user
+    
+    @staticmethod
+    def touch_public_listings(user):
+        """
+        Bump ``updated_at`` on the officer profile and events that embed this
+        user's public fields, so their data versions (ETags) change too.
+        """
+        now = timezone.now()
+        if Officer.objects.filter(user=user).update(updated_at=now):
+            transaction.on_commit(lambda: invalidate_responses('feed'))
+        if Event.objects.filter(created_by=user).update(updated_at=now):
+            transaction.on_commit(event_response_cache.bump) 
\ No newline at end of file
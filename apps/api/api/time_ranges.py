@@ -0,0 +1,39 @@
+"""
+Time-range overlap queries on event occurrences.
+
+On PostgreSQL, ``event_occurrences`` carries a generated
+``time_range = tstzrange(start_at, end_at, '[)')`` column with a GiST index
+(migration 0016), so "overlaps [start, end)" is a single index probe rather
+than two B-tree range scans on start_at and end_at whose results have to be
+intersected. Other databases compare the columns directly.
+"""
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+
+def uses_range_index():
+    return connection.vendor == 'postgresql'
+
+
+def overlap_condition(queryset, start, end):
+    """A filter() condition for rows of ``queryset`` overlapping ``[start, end)``."""
+    if uses_range_index():
+        table = queryset.model._meta.db_table
+        return Q(RawSQL(
+            f'"{table}"."time_range" && tstzrange(%s, %s, \'[)\')', (start, end), output_field=BooleanField()
+        ))
+    return Q(start_at__lt=end, end_at__gt=start)
+
+
+def filter_overlapping(queryset, start, end):
+    """Restrict ``queryset`` to rows overlapping ``[start, end)``."""
+    return queryset.filter(overlap_condition(queryset, start, end))
+
+
+def filter_overlapping_any(queryset, ranges):
+    """Restrict ``queryset`` to rows overlapping any of ``ranges`` ((start, end) pairs)."""
+    condition = Q()
+    for start, end in ranges:
+        condition |= overlap_condition(queryset, start, end)
+    return queryset.filter(condition) if condition else queryset.none()
@@ -6,4 +6,7 @@ urlpatterns = [
     path('announcements/', include('api.urls.announcement_urls')),
     path('officers/', include('api.urls.officer_urls')),
     path('rsvps/', include('api.urls.rsvp_urls')),
+    path('feed/', include('api.urls.feed_urls')),
+    path('search/', include('api.urls.search_urls')),
+    path('stream/', include('api.urls.stream_urls')),
 ] 
\ No newline at end of file
@@ -1,12 +1,31 @@
+from django.conf import settings
 from django.urls import path
 from api.views import announcement_views
+from api.middleware.route_policies import PUBLIC_READ, PUBLIC_WRITE
+
+# Async variant of the public list view when served under ASGI (core/asgi.py)
+get_announcements = announcement_views.get_announcements_async if settings.ASYNC_PUBLIC_VIEWS else announcement_views.get_announcements
 
 urlpatterns = [
-    path('', announcement_views.get_announcements, name='get_announcements'),  # Public - published only
+    path('', get_announcements, name='get_announcements'),  # Public - published only
     path('admin/', announcement_views.get_all_announcements_admin, name='get_all_announcements_admin'),  # Officers hub - all
     path('create/', announcement_views.create_announcement, name='create_announcement'),
-    path('<int:announcement_id>/', announcement_views.get_announcement_by_id, name='get_announcement_by_id'),
+    path('<int:announcement_id>/', announcement_views.get_announcement_by_id, name='get_announcement_by_id'),  # Public - published only
+    path('admin/<int:announcement_id>/', announcement_views.get_announcement_by_id_admin, name='get_announcement_by_id_admin'),  # Officers hub - any
     path('<int:announcement_id>/pin/', announcement_views.toggle_announcement_pin, name='toggle_announcement_pin'),
     path('<int:announcement_id>/update/', announcement_views.update_announcement, name='update_announcement'),
     path('<int:announcement_id>/delete/', announcement_views.delete_announcement, name='delete_announcement'),
-] 
\ No newline at end of file
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'get_announcements': PUBLIC_READ,
+    # Officers hub - Clerk auth handled at frontend
+    'get_all_announcements_admin': PUBLIC_READ,
+    'create_announcement': PUBLIC_WRITE,
+    'get_announcement_by_id': PUBLIC_READ,
+    'get_announcement_by_id_admin': PUBLIC_READ,
+    'toggle_announcement_pin': PUBLIC_WRITE,
+    'update_announcement': PUBLIC_WRITE,
+    'delete_announcement': PUBLIC_WRITE,
+}
@@ -1,19 +1,58 @@
+from django.conf import settings
 from django.urls import path
 from api.views import event_views, rsvp_views
+from api.middleware.route_policies import PUBLIC_READ, PUBLIC_WRITE, OFFICER_ONLY
+
+# Async variant of the public list view when served under ASGI (core/asgi.py)
+get_events = event_views.get_events_async if settings.ASYNC_PUBLIC_VIEWS else event_views.get_events
 
 urlpatterns = [
     # Event management
-    path('', event_views.get_events, name='get_events'),
+    path('', get_events, name='get_events'),
     path('upcoming/', event_views.get_upcoming_events, name='get_upcoming_events'),
     path('ongoing/', event_views.get_ongoing_events, name='get_ongoing_events'),
     path('past/', event_views.get_past_events, name='get_past_events'),
+    path('calendar.ics', event_views.get_events_calendar, name='get_events_calendar'),
+    path('occurrences/', event_views.get_occurrences, name='get_occurrences'),
+    path('range/', event_views.get_event_range, name='get_event_range'),
     
     path('create/', event_views.create_event, name='create_event'),
+    path('import/', event_views.import_events, name='import_events'),
     path('<int:event_id>/', event_views.get_event_detail, name='get_event_detail'),
+    path('<int:event_id>/calendar.ics', event_views.get_event_calendar, name='get_event_calendar'),
     path('<int:event_id>/update/', event_views.update_event, name='update_event'),
     path('<int:event_id>/delete/', event_views.delete_event, name='delete_event'),
     
+    # Occurrences of recurring events
+    path('<int:event_id>/occurrences/', event_views.get_event_occurrences, name='get_event_occurrences'),
+    path(
+        '<int:event_id>/occurrences/<int:occurrence_id>/update/',
+        event_views.update_occurrence,
+        name='update_occurrence'
+    ),
+    
     # RSVP endpoints
     path('<int:event_id>/rsvp/', rsvp_views.create_event_rsvp, name='create_event_rsvp'),
     path('<int:event_id>/rsvps/', rsvp_views.get_event_rsvps, name='get_event_rsvps'),
-] 
\ No newline at end of file
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'get_events': PUBLIC_READ,
+    'get_upcoming_events': PUBLIC_READ,
+    'get_ongoing_events': PUBLIC_READ,
+    'get_past_events': PUBLIC_READ,
+    'get_event_detail': PUBLIC_READ,
+    'get_events_calendar': PUBLIC_READ,
+    'get_event_calendar': PUBLIC_READ,
+    'get_occurrences': PUBLIC_READ,
+    'get_event_range': PUBLIC_READ,
+    'get_event_occurrences': PUBLIC_READ,
+    'update_occurrence': OFFICER_ONLY,
+    'create_event': PUBLIC_WRITE,  # Officers hub - Clerk auth handled at frontend
+    'import_events': OFFICER_ONLY,
+    'update_event': OFFICER_ONLY,
+    'delete_event': OFFICER_ONLY,
+    'create_event_rsvp': PUBLIC_WRITE,
+    'get_event_rsvps': OFFICER_ONLY,
+}
@@ -0,0 +1,12 @@
+from django.urls import path
+from api.views import feed_views
+from api.middleware.route_policies import PUBLIC_READ
+
+urlpatterns = [
+    path('', feed_views.get_feed, name='get_feed'),  # Public - homepage feed
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'get_feed': PUBLIC_READ,
+}
@@ -1,8 +1,16 @@
 from django.urls import path
 from api.views import rsvp_views
+from api.middleware.route_policies import OFFICER_ONLY
 
 urlpatterns = [
     path('stats/', rsvp_views.get_rsvp_stats, name='get_rsvp_stats'),
     path('<int:rsvp_id>/', rsvp_views.get_rsvp_detail, name='get_rsvp_detail'),
     path('<int:rsvp_id>/delete/', rsvp_views.delete_rsvp, name='delete_rsvp'),
-] 
\ No newline at end of file
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'get_rsvp_stats': OFFICER_ONLY,
+    'get_rsvp_detail': OFFICER_ONLY,
+    'delete_rsvp': OFFICER_ONLY,
+}
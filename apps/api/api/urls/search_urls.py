@@ -0,0 +1,14 @@
+from django.urls import path
+from api.views import search_views
+from api.middleware.route_policies import PUBLIC_READ
+
+urlpatterns = [
+    path('', search_views.search, name='search'),  # Public - ranked search
+    path('autocomplete/', search_views.search_autocomplete, name='search_autocomplete'),  # Public - suggestions
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'search': PUBLIC_READ,
+    'search_autocomplete': PUBLIC_READ,
+}
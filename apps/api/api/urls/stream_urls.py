@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.urls import path
+from api.views import stream_views
+from api.middleware.route_policies import PUBLIC_READ
+
+# Streams need the ASGI server (core/asgi.py); under WSGI the route answers 503
+stream = stream_views.stream if settings.ASYNC_PUBLIC_VIEWS else stream_views.stream_unavailable
+
+urlpatterns = [
+    path('', stream, name='stream'),  # Public - live change notifications (SSE)
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'stream': PUBLIC_READ,
+}
@@ -1,8 +1,16 @@
 from django.urls import path
 from api.views import user_views
+from api.middleware.route_policies import OFFICER_ONLY
 
 urlpatterns = [
     path('me/', user_views.get_current_user, name='get_current_user'),
     path('me/update/', user_views.update_current_user, name='update_current_user'),
     path('officers/', user_views.get_all_officers, name='get_all_officers'),
-] 
\ No newline at end of file
+]
+
+# Auth policy per route, enforced by ClerkAuthMiddleware
+auth_policies = {
+    'get_current_user': OFFICER_ONLY,
+    'update_current_user': OFFICER_ONLY,
+    'get_all_officers': OFFICER_ONLY,
+}
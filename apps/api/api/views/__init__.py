@@ -3,6 +3,9 @@ from .event_views import *
 from .announcement_views import *
 from .officer_views import *
 from .rsvp_views import *
+from .feed_views import *
+from .search_views import *
+from .stream_views import *
 
 __all__ = [
     # User views
@@ -11,18 +14,28 @@ __all__ = [
     'get_all_officers',
     # Event views
     'get_events',
+    'get_events_async',
     'get_event_detail',
+    'get_events_calendar',
+    'get_event_calendar',
+    'get_occurrences',
+    'get_event_range',
+    'get_event_occurrences',
+    'update_occurrence',
     'create_event',
+    'import_events',
     'update_event',
     'delete_event',
     # Announcement views
     'get_announcements',
+    'get_announcements_async',
     'create_announcement',
     'toggle_announcement_pin',
     'update_announcement',
     'delete_announcement',
     # Officer views
     'get_officers',
+    'get_officers_async',
     'create_officer_profile',
     'update_officer_profile',
     'delete_officer_profile',
@@ -34,4 +47,12 @@ __all__ = [
     'get_rsvp_detail',
     'delete_rsvp',
     'get_rsvp_stats',
+    # Feed views
+    'get_feed',
+    # Search views
+    'search',
+    'search_autocomplete',
+    # Stream views
+    'stream',
+    'stream_unavailable',
 ] 
\ No newline at end of file
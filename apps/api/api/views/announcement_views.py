@@ -1,31 +1,113 @@
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from api.services import AnnouncementService
-from api.serializers import AnnouncementSerializer, AnnouncementCreateSerializer, AnnouncementUpdateSerializer
+from django.core.exceptions import ValidationError
+from api.services import AnnouncementService, SearchService
+from api.serializers import (
+    AnnouncementSerializer,
+    AnnouncementCreateSerializer,
+    AnnouncementUpdateSerializer,
+    serialize_announcements,
+    ANNOUNCEMENT_FIELDSET
+)
+from api.conditional import conditional
+from api.fieldsets import FieldsetError
+from api.pagination import CursorError, KeysetPagination, set_pagination_headers
+from .async_helpers import async_api_view, async_json_response
 
 
+# Keyset on the list order, served by idx_announcements_published (public)
+# and idx_announcements_admin (officers hub)
+announcement_pagination = KeysetPagination(('-pinned', '-created_at', '-id'))
+
+
+def search_announcements(request, announcements):
+    """Apply the AnnouncementFilters ``search`` param, if given."""
+    query = ' '.join(request.GET.get('search', '').split())
+    if not query:
+        return announcements
+    return SearchService.filter_queryset(announcements, 'announcement', query)
+
+
+def _parse_flag(name, value):
+    if value.lower() in ('true', '1'):
+        return True
+    if value.lower() in ('false', '0'):
+        return False
+    raise ValidationError(f"{name} must be true or false.")
+
+
+def list_announcements(request, announcements, selection):
+    """
+    Apply the AnnouncementFilters params (pinned, is_draft, search) and the
+    fieldset (``?fields=`` or ``?view=compact``) to ``announcements``, ready
+    for announcement_pagination. A search filters the list and keeps its
+    order; /api/search/ ranks.
+    """
+    filters = {
+        name: _parse_flag(name, request.GET[name])
+        for name in ('pinned', 'is_draft') if request.GET.get(name)
+    }
+    announcements = search_announcements(
+        request, AnnouncementService.filter_announcements(announcements, **filters)
+    )
+    announcements = ANNOUNCEMENT_FIELDSET.project(announcements, selection, keep=announcement_pagination.fields)
+    if selection is not None and 'content_length' in selection.fields:
+        announcements = announcements.with_content_length()
+    return announcements
+
+@conditional(AnnouncementService.get_data_version)
 @api_view(['GET'])
 def get_announcements(request):
-    """Get published announcements (public endpoint)."""
+    """Get published announcements, filtered and cursor-paginated (public endpoint)."""
     try:
-        announcements = AnnouncementService.get_published_announcements()  # Changed this line
-        serializer = AnnouncementSerializer(announcements, many=True)
-        return Response(serializer.data)
+        selection = ANNOUNCEMENT_FIELDSET.parse(request)
+        announcements = list_announcements(request, AnnouncementService.get_published_announcements(), selection)
+        announcements, next_cursor = announcement_pagination.paginate(announcements, request)
+        return set_pagination_headers(
+            Response(serialize_announcements(announcements, selection)), request, next_cursor
+        )
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch announcements: {str(e)}'}, 
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@conditional(AnnouncementService.get_data_version)
+@async_api_view(['GET'])
+async def get_announcements_async(request):
+    """Get published announcements, filtered and cursor-paginated (async variant served under ASGI)."""
+    try:
+        selection = ANNOUNCEMENT_FIELDSET.parse(request)
+        announcements = list_announcements(request, AnnouncementService.get_published_announcements(), selection)
+        announcements, next_cursor = await announcement_pagination.apaginate(announcements, request)
+        return set_pagination_headers(
+            async_json_response(serialize_announcements(announcements, selection)), request, next_cursor
+        )
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return async_json_response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return async_json_response(
+            {'error': f'Failed to fetch announcements: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
 # Add a new endpoint for officers hub
+@conditional(AnnouncementService.get_data_version)
 @api_view(['GET'])
 def get_all_announcements_admin(request):
-    """Get all announcements including drafts (officers hub endpoint)."""
+    """Get all announcements including drafts, filtered and cursor-paginated (officers hub endpoint)."""
     try:
-        announcements = AnnouncementService.get_all_announcements()
-        serializer = AnnouncementSerializer(announcements, many=True)
-        return Response(serializer.data)
+        selection = ANNOUNCEMENT_FIELDSET.parse(request)
+        announcements = list_announcements(request, AnnouncementService.get_all_announcements(), selection)
+        announcements, next_cursor = announcement_pagination.paginate(announcements, request)
+        return set_pagination_headers(
+            Response(serialize_announcements(announcements, selection)), request, next_cursor
+        )
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch announcements: {str(e)}'}, 
@@ -33,16 +115,20 @@ def get_all_announcements_admin(request):
         )
 
 
-@api_view(['GET'])
-def get_announcement_by_id(request, announcement_id):
-    """Get a single announcement by ID."""
+def announcement_detail(request, get_announcement, announcement_id):
+    """Respond with the announcement ``get_announcement`` finds, in the requested fieldset."""
     try:
-        announcement = AnnouncementService.get_announcement_by_id(announcement_id)
+        selection = ANNOUNCEMENT_FIELDSET.parse(request)
+        announcement = get_announcement(announcement_id)
         if not announcement:
             return Response({'error': 'Announcement not found'}, status=status.HTTP_404_NOT_FOUND)
         
+        if selection is not None:
+            return Response(serialize_announcements([announcement], selection)[0])
         serializer = AnnouncementSerializer(announcement)
         return Response(serializer.data)
+    except FieldsetError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch announcement: {str(e)}'}, 
@@ -50,6 +136,20 @@ def get_announcement_by_id(request, announcement_id):
         )
 
 
+@conditional(AnnouncementService.get_data_version)
+@api_view(['GET'])
+def get_announcement_by_id(request, announcement_id):
+    """Get a single published announcement by ID (public endpoint; drafts, scheduled and expired ones are 404)."""
+    return announcement_detail(request, AnnouncementService.get_published_announcement_by_id, announcement_id)
+
+
+@conditional(AnnouncementService.get_data_version)
+@api_view(['GET'])
+def get_announcement_by_id_admin(request, announcement_id):
+    """Get any announcement by ID, including drafts (officers hub endpoint)."""
+    return announcement_detail(request, AnnouncementService.get_announcement_by_id, announcement_id)
+
+
 @api_view(['POST'])
 def create_announcement(request):
     """Create a new announcement (officers hub - no auth required)."""
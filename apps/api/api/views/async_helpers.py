@@ -0,0 +1,34 @@
+from functools import wraps
+
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+
+def async_json_response(data, status=200):
+    """Render ``data`` exactly like the DRF views do (same JSONRenderer output)."""
+    return HttpResponse(
+        JSONRenderer().render(data),
+        status=status,
+        content_type='application/json',
+    )
+
+
+def async_api_view(methods):
+    """
+    Minimal async counterpart of DRF's ``@api_view`` for read-only views.
+    DRF views are sync-only, so async views are plain Django views that
+    check the method and render JSON themselves.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in methods:
+                response = async_json_response(
+                    {'detail': f'Method "{request.method}" not allowed.'},
+                    status=405,
+                )
+                response['Allow'] = ', '.join(methods)
+                return response
+            return await view(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,18 +1,94 @@
+from datetime import datetime, time, timedelta
+
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from api.services import EventService
-from api.serializers import EventSerializer, EventCreateSerializer, EventUpdateSerializer
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_safe
+from django.utils.dateparse import parse_date, parse_datetime
+from api.services import EventService, OccurrenceService
+from api.services.event_service import event_response_cache
+from api.serializers import (
+    EventSerializer, EventCreateSerializer, EventUpdateSerializer, serialize_events, EVENT_FIELDSET,
+    EventOccurrenceSerializer, OccurrenceUpdateSerializer, serialize_occurrences
+)
+from api.calendar import stream_calendar
+from api.event_import import EventImportError, IMPORT_FORMATS, detect_format, parse_rows, validate_rows
+from api.conditional import conditional
+from api.fieldsets import FieldsetError
+from api.pagination import CursorError, KeysetPagination, set_pagination_headers
+from .async_helpers import async_api_view, async_json_response
+
+
+# Keyset on (start_at, id), served by idx_events_start_at
+event_pagination = KeysetPagination(('start_at', 'id'))
+past_event_pagination = KeysetPagination(('-start_at', '-id'))
+
+EVENT_STATUSES = ('upcoming', 'ongoing', 'past')
+
+
+def _parse_bound(name, value, end=False):
+    """Parse a date or datetime query param; a bare ``date_to`` date includes that whole day."""
+    try:
+        day = parse_date(value)
+        parsed = datetime.combine(day + timedelta(days=1) if end else day, time.min) if day else parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError(f"{name} must be an ISO 8601 date or datetime.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
 
+def parse_event_filters(request):
+    """Translate EventFilters query params into EventService.filter_events kwargs."""
+    params = request.GET
+    filters = {}
 
+    statuses = [s for value in params.getlist('status') for s in value.split(',') if s]
+    if params.get('upcoming', '').lower() == 'true':
+        statuses.append('upcoming')
+    invalid = [s for s in statuses if s not in EVENT_STATUSES]
+    if invalid:
+        raise ValidationError(f"Invalid status '{invalid[0]}'. Expected one of: {', '.join(EVENT_STATUSES)}")
+    if statuses:
+        filters['status'] = statuses
+
+    if params.get('date_from'):
+        filters['date_from'] = _parse_bound('date_from', params['date_from'])
+    if params.get('date_to'):
+        filters['date_to'] = _parse_bound('date_to', params['date_to'], end=True)
+    if params.get('location'):
+        filters['location'] = params['location']
+    if params.get('created_by'):
+        try:
+            filters['created_by'] = int(params['created_by'])
+        except ValueError:
+            raise ValidationError("created_by must be an integer.")
+    return filters
+
+
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
 @api_view(['GET'])
 def get_events(request):
-    """Get all events (public endpoint)."""
+    """Get events, filtered and cursor-paginated (public endpoint)."""
     try:
-        events = EventService.get_events_with_rsvp_counts()
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data)
+        selection = EVENT_FIELDSET.parse(request)
+        now = timezone.now()
+        events = EventService.filter_events(
+            EventService.get_events_with_rsvp_counts(now), **parse_event_filters(request)
+        )
+        events = EVENT_FIELDSET.project(events, selection, keep=event_pagination.fields)
+        events, next_cursor = event_pagination.paginate(events, request)
+        return set_pagination_headers(Response(serialize_events(events, selection)), request, next_cursor)
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch events: {str(e)}'}, 
@@ -20,13 +96,45 @@ def get_events(request):
         )
 
 
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
+@async_api_view(['GET'])
+async def get_events_async(request):
+    """Get events, filtered and cursor-paginated (async variant served under ASGI)."""
+    try:
+        selection = EVENT_FIELDSET.parse(request)
+        now = timezone.now()
+        events = EventService.filter_events(
+            EventService.get_events_with_rsvp_counts(now), **parse_event_filters(request)
+        )
+        events = EVENT_FIELDSET.project(events, selection, keep=event_pagination.fields)
+        events, next_cursor = await event_pagination.apaginate(events, request)
+        return set_pagination_headers(async_json_response(serialize_events(events, selection)), request, next_cursor)
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return async_json_response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return async_json_response(
+            {'error': f'Failed to fetch events: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
 @api_view(['GET'])
 def get_upcoming_events(request):
     """Get upcoming events (public endpoint)."""
     try:
-        events = EventService.get_upcoming_events()
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data)
+        selection = EVENT_FIELDSET.parse(request)
+        now = timezone.now()
+        events = EventService.filter_events(
+            EventService.get_upcoming_events(now), **parse_event_filters(request)
+        )
+        events = EVENT_FIELDSET.project(events, selection, keep=event_pagination.fields)
+        events, next_cursor = event_pagination.paginate(events, request)
+        return set_pagination_headers(Response(serialize_events(events, selection)), request, next_cursor)
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch upcoming events: {str(e)}'}, 
@@ -34,13 +142,22 @@ def get_upcoming_events(request):
         )
 
 
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
 @api_view(['GET'])
 def get_ongoing_events(request):
     """Get ongoing events (public endpoint)."""
     try:
-        events = EventService.get_ongoing_events()
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data)
+        selection = EVENT_FIELDSET.parse(request)
+        now = timezone.now()
+        events = EventService.filter_events(
+            EventService.get_ongoing_events(now), **parse_event_filters(request)
+        )
+        events = EVENT_FIELDSET.project(events, selection, keep=event_pagination.fields)
+        events, next_cursor = event_pagination.paginate(events, request)
+        return set_pagination_headers(Response(serialize_events(events, selection)), request, next_cursor)
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch ongoing events: {str(e)}'}, 
@@ -48,13 +165,22 @@ def get_ongoing_events(request):
         )
 
 
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
 @api_view(['GET'])
 def get_past_events(request):
     """Get past events (public endpoint)."""
     try:
-        events = EventService.get_past_events()
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data)
+        selection = EVENT_FIELDSET.parse(request)
+        now = timezone.now()
+        events = EventService.filter_events(
+            EventService.get_past_events(now), **parse_event_filters(request)
+        )
+        events = EVENT_FIELDSET.project(events, selection, keep=past_event_pagination.fields)
+        events, next_cursor = past_event_pagination.paginate(events, request)
+        return set_pagination_headers(Response(serialize_events(events, selection)), request, next_cursor)
+    except (ValidationError, CursorError, FieldsetError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch past events: {str(e)}'}, 
@@ -62,16 +188,23 @@ def get_past_events(request):
         )
 
 
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
 @api_view(['GET'])
 def get_event_detail(request, event_id):
     """Get event detail by ID (public endpoint)."""
     try:
+        selection = EVENT_FIELDSET.parse(request)
         event = EventService.get_event_by_id(event_id)
         if not event:
             return Response({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
         
+        if selection is not None:
+            return Response(serialize_events([event], selection)[0])
         serializer = EventSerializer(event)
         return Response(serializer.data)
+    except FieldsetError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch event: {str(e)}'}, 
@@ -79,15 +212,172 @@ def get_event_detail(request, event_id):
         )
 
 
+def parse_range(request):
+    """
+    The ``[start, end)`` window of a range request: ``?month=YYYY-MM``,
+    ``?week=YYYY-Www`` (ISO week) or explicit ``?start=`` and ``?end=``.
+    """
+    params = request.GET
+    try:
+        if params.get('month'):
+            start = datetime.strptime(params['month'], '%Y-%m')
+            end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+        elif params.get('week'):
+            start = datetime.strptime(f"{params['week']}-1", '%G-W%V-%u')
+            end = start + timedelta(weeks=1)
+        else:
+            start = end = None
+    except ValueError:
+        raise ValidationError("month must be YYYY-MM and week must be an ISO week like 2025-W07.")
+
+    if start is not None:
+        start, end = timezone.make_aware(start), timezone.make_aware(end)
+    elif params.get('start') and params.get('end'):
+        start = _parse_bound('start', params['start'])
+        end = _parse_bound('end', params['end'], end=True)
+    else:
+        raise ValidationError("Give month, week, or both start and end.")
+
+    if end <= start:
+        raise ValidationError("end must be after start.")
+    if end - start > timedelta(days=settings.EVENT_RANGE_MAX_DAYS):
+        raise ValidationError(f"Ranges are limited to {settings.EVENT_RANGE_MAX_DAYS} days.")
+    return start, end
+
+
+def _with_conflicts(data, event):
+    # Double-bookings are reported only when asked for (?check_conflicts=true)
+    if hasattr(event, 'conflicts'):
+        data = {**data, 'conflicts': serialize_occurrences(event.conflicts)}
+    return data
+
+
+def _check_conflicts(request):
+    return request.GET.get('check_conflicts', '').lower() == 'true'
+
+
+def _list_occurrences(request, event_id=None):
+    now = timezone.now()
+    occurrences = OccurrenceService.filter_occurrences(
+        OccurrenceService.get_occurrences(now),
+        event_id=event_id,
+        include_cancelled=request.GET.get('include_cancelled', '').lower() == 'true',
+        **parse_event_filters(request)
+    )
+    occurrences, next_cursor = event_pagination.paginate(occurrences, request)
+    return set_pagination_headers(Response(serialize_occurrences(occurrences)), request, next_cursor)
+
+
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
+@api_view(['GET'])
+def get_occurrences(request):
+    """Get event occurrences in time order, filtered like the event list (public endpoint)."""
+    try:
+        return _list_occurrences(request)
+    except (ValidationError, CursorError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch occurrences: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
+@api_view(['GET'])
+def get_event_range(request):
+    """Get all occurrences overlapping a month, week or start/end window, in time order (public endpoint)."""
+    try:
+        start, end = parse_range(request)
+        filters = parse_event_filters(request)
+        filters.update(date_from=start, date_to=end)
+        occurrences = OccurrenceService.filter_occurrences(
+            OccurrenceService.get_occurrences(),
+            include_cancelled=request.GET.get('include_cancelled', '').lower() == 'true',
+            **filters
+        )
+        return Response(serialize_occurrences(occurrences))
+    except ValidationError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch events in range: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
+@api_view(['GET'])
+def get_event_occurrences(request, event_id):
+    """Get the occurrences of one event (public endpoint)."""
+    try:
+        if not EventService.get_event_by_id(event_id):
+            return Response({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
+        return _list_occurrences(request, event_id)
+    except (ValidationError, CursorError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch occurrences: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def _calendar_uid_domain(request):
+    return settings.CALENDAR_UID_DOMAIN or request.get_host().split(':')[0]
+
+
+# Plain Django views: calendar clients send Accept headers DRF would reject
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
+@require_safe
+def get_events_calendar(request):
+    """Stream an iCalendar feed of events, filtered like the event list (public endpoint)."""
+    try:
+        now = timezone.now()
+        events = EventService.filter_events(
+            EventService.get_calendar_events(now), **parse_event_filters(request)
+        )
+    except ValidationError as e:
+        return JsonResponse({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    response = StreamingHttpResponse(
+        stream_calendar(events.iterator(chunk_size=500), _calendar_uid_domain(request)),
+        content_type='text/calendar; charset=utf-8',
+    )
+    response['Content-Disposition'] = 'inline; filename="events.ics"'
+    return response
+
+
+@conditional(event_response_cache.data_version)
+@event_response_cache.cached
+@require_safe
+def get_event_calendar(request, event_id):
+    """Get a single event as an .ics file (public endpoint)."""
+    event = EventService.get_calendar_events().filter(id=event_id).first()
+    if not event:
+        return JsonResponse({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
+
+    calendar = stream_calendar([event], _calendar_uid_domain(request), name=event.title)
+    response = HttpResponse(b''.join(calendar), content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="event-{event.id}.ics"'
+    return response
+
+
 @api_view(['POST'])
 def create_event(request):
     """Create a new event (officers hub - no auth required)."""
     serializer = EventCreateSerializer(data=request.data)
     if serializer.is_valid():
         try:
-            event = EventService.create_event_without_user(serializer.validated_data)
+            event = EventService.create_event_without_user(
+                serializer.validated_data, check_conflicts=_check_conflicts(request)
+            )
             response_serializer = EventSerializer(event)
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+            return Response(_with_conflicts(response_serializer.data, event), status=status.HTTP_201_CREATED)
         except ValidationError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
@@ -99,6 +389,57 @@ def create_event(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@parser_classes([MultiPartParser])  # Raw CSV/NDJSON bodies are read from request.body
+def import_events(request):
+    """
+    Bulk-create events from a CSV or NDJSON upload (officer-only): a
+    multipart ``file`` or the raw request body. Valid rows are created and
+    invalid ones reported per row; ``?dry_run=true`` only validates.
+    """
+    if not request.user:
+        return Response({'error': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
+    
+    try:
+        if request.content_type.startswith('multipart/form-data'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                return Response({'error': 'file is required.'}, status=status.HTTP_400_BAD_REQUEST)
+            content, fmt = upload.read(), detect_format(upload.name, upload.content_type)
+        else:
+            content, fmt = request.body, detect_format(content_type=request.content_type)
+        # Not ?format=, which DRF reserves for response content negotiation
+        fmt = request.GET.get('file_format') or fmt
+        if fmt is None:
+            raise EventImportError(f"Could not tell the file format; pass ?file_format= ({', '.join(IMPORT_FORMATS)}).")
+        
+        rows = parse_rows(content, fmt)
+        if len(rows) > settings.EVENT_IMPORT_MAX_ROWS:
+            raise EventImportError(f"Imports are limited to {settings.EVENT_IMPORT_MAX_ROWS} rows.")
+        
+        valid, errors = validate_rows(rows)
+        dry_run = request.GET.get('dry_run', '').lower() == 'true'
+        created = [] if dry_run else EventService.bulk_create_events(valid)
+        return Response(
+            {
+                'dry_run': dry_run,
+                'rows': len(rows),
+                'valid': len(valid),
+                'created': len(created),
+                'ids': [event.id for event in created],
+                'errors': errors,
+            },
+            status=status.HTTP_200_OK if dry_run or not created else status.HTTP_201_CREATED
+        )
+    except (EventImportError, ValidationError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to import events: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['PUT', 'PATCH'])
 def update_event(request, event_id):
     """Update an existing event (officer-only) with status-based restrictions."""
@@ -115,9 +456,11 @@ def update_event(request, event_id):
         serializer = EventUpdateSerializer(event, data=request.data, partial=partial)
         
         if serializer.is_valid():
-            updated_event = EventService.update_event(event, serializer.validated_data)
+            updated_event = EventService.update_event(
+                event, serializer.validated_data, check_conflicts=_check_conflicts(request)
+            )
             response_serializer = EventSerializer(updated_event)
-            return Response(response_serializer.data)
+            return Response(_with_conflicts(response_serializer.data, updated_event))
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     except ValidationError as e:
@@ -148,4 +491,30 @@ def delete_event(request, event_id):
         return Response(
             {'error': f'Failed to delete event: {str(e)}'}, 
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+
+@api_view(['PATCH'])
+def update_occurrence(request, event_id, occurrence_id):
+    """Move, cancel or restore one occurrence of a recurring event (officer-only)."""
+    if not request.user:
+        return Response({'error': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
+    
+    try:
+        occurrence = OccurrenceService.get_occurrence(event_id, occurrence_id)
+        if not occurrence:
+            return Response({'error': 'Occurrence not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        serializer = OccurrenceUpdateSerializer(occurrence, data=request.data, partial=True)
+        if serializer.is_valid():
+            updated_occurrence = OccurrenceService.update_occurrence(occurrence, serializer.validated_data)
+            return Response(EventOccurrenceSerializer(updated_occurrence).data)
+        
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    except ValidationError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to update occurrence: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -0,0 +1,40 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from django.core.exceptions import ValidationError
+from api.services import FeedService
+from api.services.feed_service import feed_response_cache
+from api.conditional import conditional
+
+
+def _parse_limit(request, name, default):
+    value = request.GET.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValidationError(f"{name} must be an integer.")
+    if limit < 0:
+        raise ValidationError(f"{name} must not be negative.")
+    return min(limit, FeedService.MAX_LIMIT)
+
+
+@conditional(feed_response_cache.data_version)
+@feed_response_cache.cached
+@api_view(['GET'])
+def get_feed(request):
+    """Get the homepage feed in one response (public endpoint)."""
+    try:
+        feed = FeedService.build_feed(
+            event_limit=_parse_limit(request, 'events', FeedService.DEFAULT_EVENT_LIMIT),
+            announcement_limit=_parse_limit(request, 'announcements', FeedService.DEFAULT_ANNOUNCEMENT_LIMIT),
+        )
+        return Response(feed)
+    except ValidationError as e:
+        return Response({'error': e.message}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch feed: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
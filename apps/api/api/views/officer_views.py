@@ -6,17 +6,25 @@ from api.serializers import (
     OfficerSerializer, 
     OfficerCreateSerializer, 
     OfficerUpdateSerializer,
-    OfficerReorderSerializer
+    OfficerReorderSerializer,
+    serialize_officers,
+    OFFICER_FIELDSET
 )
+from api.conditional import conditional
+from api.fieldsets import FieldsetError
+from .async_helpers import async_api_view, async_json_response
 
 
+@conditional(OfficerService.get_data_version)
 @api_view(['GET'])
 def get_officers(request):
     """Get all publicly displayed officers (public endpoint)."""
     try:
-        officers = OfficerService.get_all_officers()
-        serializer = OfficerSerializer(officers, many=True)
-        return Response(serializer.data)
+        selection = OFFICER_FIELDSET.parse(request)
+        officers = OFFICER_FIELDSET.project(OfficerService.get_all_officers(), selection)
+        return Response(serialize_officers(officers, selection))
+    except FieldsetError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch officers: {str(e)}'}, 
@@ -24,16 +32,41 @@ def get_officers(request):
         )
 
 
+@conditional(OfficerService.get_data_version)
+@async_api_view(['GET'])
+async def get_officers_async(request):
+    """Get all publicly displayed officers (public endpoint, async variant served under ASGI)."""
+    try:
+        selection = OFFICER_FIELDSET.parse(request)
+        officers = [
+            officer async for officer in OFFICER_FIELDSET.project(OfficerService.get_all_officers(), selection)
+        ]
+        return async_json_response(serialize_officers(officers, selection))
+    except FieldsetError as e:
+        return async_json_response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return async_json_response(
+            {'error': f'Failed to fetch officers: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@conditional(OfficerService.get_data_version)
 @api_view(['GET'])
 def get_officer_by_id(request, officer_id):
     """Get a single officer by ID."""
     try:
+        selection = OFFICER_FIELDSET.parse(request)
         officer = OfficerService.get_officer_by_id(officer_id)
         if not officer:
             return Response({'error': 'Officer not found'}, status=status.HTTP_404_NOT_FOUND)
         
+        if selection is not None:
+            return Response(serialize_officers([officer], selection)[0])
         serializer = OfficerSerializer(officer)
         return Response(serializer.data)
+    except FieldsetError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch officer: {str(e)}'}, 
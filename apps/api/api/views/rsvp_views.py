@@ -1,6 +1,7 @@
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from django.core.exceptions import ValidationError
 from api.services import RSVPService, EventService
 from api.serializers import RSVPSerializer, RSVPCreateSerializer
 
@@ -41,6 +42,8 @@ def create_event_rsvp(request, event_id):
                     )
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    except ValidationError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {'error': f'Failed to create RSVP: {str(e)}'}, 
@@ -59,7 +62,7 @@ def get_event_rsvps(request, event_id):
         if not event:
             return Response({'error': 'Event not found'}, status=status.HTTP_404_NOT_FOUND)
         
-        rsvps = RSVPService.get_rsvps_for_event(event)
+        rsvps = RSVPService.get_rsvps_for_event(event, request.GET.get('occurrence'))
         serializer = RSVPSerializer(rsvps, many=True)
         
         # Include RSVP count in response
@@ -0,0 +1,67 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from django.core.exceptions import ValidationError
+from api.services import SearchService
+
+
+MAX_QUERY_LENGTH = 200
+
+
+def parse_search_params(request, default_limit, max_limit):
+    """Return ``(query, resources, limit)`` from the ``q``, ``type`` and ``limit`` params."""
+    params = request.GET
+    query = ' '.join(params.get('q', '').split())
+    if not query:
+        raise ValidationError("q is required.")
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValidationError(f"q must be at most {MAX_QUERY_LENGTH} characters.")
+
+    resources = [t for value in params.getlist('type') for t in value.split(',') if t]
+    invalid = [t for t in resources if t not in SearchService.RESOURCES]
+    if invalid:
+        raise ValidationError(
+            f"Invalid type '{invalid[0]}'. Expected one of: {', '.join(SearchService.RESOURCES)}"
+        )
+
+    limit = params.get('limit')
+    if limit in (None, ''):
+        limit = default_limit
+    else:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError("limit must be an integer.")
+        if limit < 1:
+            raise ValidationError("limit must be positive.")
+    return query, resources or None, min(limit, max_limit)
+
+
+@api_view(['GET'])
+def search(request):
+    """Ranked search across events, announcements and officers (public endpoint)."""
+    try:
+        query, resources, limit = parse_search_params(request, default_limit=20, max_limit=50)
+        return Response(SearchService.search(query, resources=resources, limit=limit))
+    except ValidationError as e:
+        return Response({'error': e.message}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to search: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+def search_autocomplete(request):
+    """Typo-tolerant title suggestions for a search box (public endpoint)."""
+    try:
+        query, resources, limit = parse_search_params(request, default_limit=10, max_limit=20)
+        return Response(SearchService.autocomplete(query, resources=resources, limit=limit))
+    except ValidationError as e:
+        return Response({'error': e.message}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch suggestions: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
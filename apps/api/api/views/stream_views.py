@@ -0,0 +1,83 @@
+import asyncio
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from api.live import broadcaster, parse_topics
+from .async_helpers import async_api_view, async_json_response
+
+
+# Reconnect delay EventSource clients are told to use, in milliseconds
+RETRY_MS = 3000
+
+
+async def _event_stream(subscription, replay, reset):
+    try:
+        yield f'retry: {RETRY_MS}\n\n'
+        if reset:
+            # Carries the current id, so resuming from here works
+            yield f'id: {broadcaster.last_id}\nevent: reset\ndata: {{}}\n\n'
+        for message in replay:
+            yield message.payload
+
+        loop = asyncio.get_running_loop()
+        # Streams end after STREAM_MAX_SECONDS and the client reconnects with
+        # Last-Event-ID, so a stream whose client vanished cannot linger
+        deadline = loop.time() + settings.STREAM_MAX_SECONDS
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                message = await asyncio.wait_for(
+                    subscription.queue.get(), min(settings.STREAM_HEARTBEAT_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'
+                continue
+            if message is None:
+                # Fell too far behind; the reconnect replays from the buffer
+                return
+            yield message.payload
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@async_api_view(['GET'])
+async def stream(request):
+    """
+    Server-Sent Events stream of announcement, event and RSVP changes
+    (public endpoint, async; see api.live). ``?topics=`` narrows it to any
+    of announcements, events, rsvps.
+    """
+    try:
+        topics = parse_topics(request.GET.get('topics'))
+    except ValueError as e:
+        return async_json_response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    subscription, replay, reset = broadcaster.subscribe(last_event_id, topics)
+    response = StreamingHttpResponse(
+        _event_stream(subscription, replay, reset),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx-style proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api_view(['GET'])
+def stream_unavailable(request):
+    """
+    Stands in for ``stream`` under WSGI, where a response is only sent once
+    its whole body has been generated and every open stream would hold a
+    worker for STREAM_MAX_SECONDS. Clients fall back to polling.
+    """
+    return Response(
+        {'error': 'Live updates are only available when the API is served over ASGI.'},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
@@ -5,6 +5,8 @@ Django settings for CS Club API project.
 import os
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -54,6 +56,12 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'core.wsgi.application'
+ASGI_APPLICATION = 'core.asgi.application'
+
+# Serve the async variants of the read-only public views and the /api/stream/
+# SSE endpoint. core/asgi.py turns this on; under WSGI the sync DRF views are
+# used and /api/stream/ answers 503.
+ASYNC_PUBLIC_VIEWS = os.getenv('DJANGO_ASYNC_VIEWS', 'False').lower() == 'true'
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -85,11 +93,122 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # CORS settings - will be overridden in environment-specific settings
 CORS_ALLOW_CREDENTIALS = True
+# Let browsers read the pagination and validator headers on list responses,
+# and send If-None-Match for conditional GETs
+CORS_EXPOSE_HEADERS = ['X-Next-Cursor', 'Link', 'ETag', 'Last-Modified']
+CORS_ALLOW_HEADERS = (*default_headers, 'if-none-match')
 
 # Clerk authentication settings
 CLERK_PUBLISHABLE_KEY = os.getenv('CLERK_PUBLISHABLE_KEY')
 CLERK_SECRET_KEY = os.getenv('CLERK_SECRET_KEY')
 
+# Session JWTs are verified locally. Keys come from CLERK_JWT_KEY (PEM public
+# key, networkless) if set, otherwise from the JWKS at CLERK_JWKS_URL
+# (defaults to the Backend API JWKS, authenticated with CLERK_SECRET_KEY).
+CLERK_JWT_KEY = os.getenv('CLERK_JWT_KEY')
+CLERK_JWKS_URL = os.getenv('CLERK_JWKS_URL')
+CLERK_JWKS_CACHE_SECONDS = int(os.getenv('CLERK_JWKS_CACHE_SECONDS', '3600'))
+CLERK_ISSUER = os.getenv('CLERK_ISSUER')
+CLERK_AUTHORIZED_PARTIES = [p for p in os.getenv('CLERK_AUTHORIZED_PARTIES', '').split(',') if p]
+CLERK_JWT_LEEWAY_SECONDS = int(os.getenv('CLERK_JWT_LEEWAY_SECONDS', '5'))
+
+# Auth middleware caches. Session entries never outlive the token's `exp`.
+# Set CLERK_AUTH_CACHE_ALIAS to a shared cache (e.g. Redis) in CACHES so all
+# workers share verified sessions and profiles.
+CLERK_SESSION_CACHE_SIZE = int(os.getenv('CLERK_SESSION_CACHE_SIZE', '2048'))
+CLERK_SESSION_CACHE_TTL = int(os.getenv('CLERK_SESSION_CACHE_TTL', '300'))
+CLERK_PROFILE_CACHE_SIZE = int(os.getenv('CLERK_PROFILE_CACHE_SIZE', '1024'))
+CLERK_PROFILE_CACHE_TTL = int(os.getenv('CLERK_PROFILE_CACHE_TTL', '900'))
+CLERK_AUTH_CACHE_ALIAS = os.getenv('CLERK_AUTH_CACHE_ALIAS')
+CLERK_USER_CACHE_SIZE = int(os.getenv('CLERK_USER_CACHE_SIZE', '512'))
+CLERK_USER_CACHE_TTL = int(os.getenv('CLERK_USER_CACHE_TTL', '30'))
+
+# Outbound Clerk HTTP client (pooled session, retries and circuit breaker)
+CLERK_HTTP_CONNECT_TIMEOUT = float(os.getenv('CLERK_HTTP_CONNECT_TIMEOUT', '2'))
+CLERK_HTTP_READ_TIMEOUT = float(os.getenv('CLERK_HTTP_READ_TIMEOUT', '3'))
+CLERK_HTTP_RETRIES = int(os.getenv('CLERK_HTTP_RETRIES', '2'))
+CLERK_HTTP_POOL_SIZE = int(os.getenv('CLERK_HTTP_POOL_SIZE', '10'))
+CLERK_BREAKER_ERROR_RATE = float(os.getenv('CLERK_BREAKER_ERROR_RATE', '0.5'))
+CLERK_BREAKER_MIN_CALLS = int(os.getenv('CLERK_BREAKER_MIN_CALLS', '5'))
+CLERK_BREAKER_WINDOW_SECONDS = int(os.getenv('CLERK_BREAKER_WINDOW_SECONDS', '30'))
+CLERK_BREAKER_OPEN_SECONDS = int(os.getenv('CLERK_BREAKER_OPEN_SECONDS', '30'))
+
+# Caches. Set REDIS_URL to share the cache (and response invalidation)
+# between workers; otherwise each process has its own local memory cache.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Cached public GET responses (api/response_cache.py). A process-local cache
+# cannot see invalidations from other workers, so its TTL is kept short.
+RESPONSE_CACHE_ALIAS = os.getenv('RESPONSE_CACHE_ALIAS', 'default')
+RESPONSE_CACHE_MAX_TTL = int(os.getenv('RESPONSE_CACHE_MAX_TTL', '300'))
+RESPONSE_CACHE_LOCAL_MAX_TTL = int(os.getenv('RESPONSE_CACHE_LOCAL_MAX_TTL', '5'))
+RESPONSE_CACHE_LOCK_SECONDS = int(os.getenv('RESPONSE_CACHE_LOCK_SECONDS', '10'))
+RESPONSE_CACHE_WAIT_SECONDS = float(os.getenv('RESPONSE_CACHE_WAIT_SECONDS', '2'))
+# Streamed responses (e.g. the .ics feed) larger than this are not cached
+RESPONSE_CACHE_MAX_STREAM_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_STREAM_BYTES', str(2 * 1024 * 1024)))
+
+# Name shown by calendar apps subscribed to /api/events/calendar.ics
+CALENDAR_NAME = os.getenv('CALENDAR_NAME', 'CS Club Events')
+# Domain part of VEVENT UIDs; keep it fixed so UIDs survive host changes
+# (defaults to the request host)
+CALENDAR_UID_DOMAIN = os.getenv('CALENDAR_UID_DOMAIN', '')
+
+# Recurring events are materialized this many days ahead (extended daily by
+# the extend_occurrences command), capped at this many occurrences per event
+EVENT_OCCURRENCE_HORIZON_DAYS = int(os.getenv('EVENT_OCCURRENCE_HORIZON_DAYS', '365'))
+EVENT_OCCURRENCE_MAX = int(os.getenv('EVENT_OCCURRENCE_MAX', '520'))
+# Widest window /api/events/range/ serves in one response
+EVENT_RANGE_MAX_DAYS = int(os.getenv('EVENT_RANGE_MAX_DAYS', '92'))
+# Most rows accepted by one POST /api/events/import/
+EVENT_IMPORT_MAX_ROWS = int(os.getenv('EVENT_IMPORT_MAX_ROWS', '5000'))
+
+# Announcements are posted to this Discord webhook by the publish_discord
+# worker (unset = Discord publishing off and nothing is queued). Edits wait
+# DISCORD_EDIT_DELAY_SECONDS so rapid successive saves go out as one edit.
+DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL', '')
+DISCORD_EDIT_DELAY_SECONDS = int(os.getenv('DISCORD_EDIT_DELAY_SECONDS', '10'))
+DISCORD_OUTBOX_BATCH_SIZE = int(os.getenv('DISCORD_OUTBOX_BATCH_SIZE', '20'))
+DISCORD_OUTBOX_MAX_ATTEMPTS = int(os.getenv('DISCORD_OUTBOX_MAX_ATTEMPTS', '8'))
+# Rows a worker claims stay leased to it this long; longer than a batch can
+# take (rate-limit waits included), so only a dead worker's rows are retaken
+DISCORD_OUTBOX_LEASE_SECONDS = int(os.getenv('DISCORD_OUTBOX_LEASE_SECONDS', '900'))
+DISCORD_HTTP_CONNECT_TIMEOUT = float(os.getenv('DISCORD_HTTP_CONNECT_TIMEOUT', '3'))
+DISCORD_HTTP_READ_TIMEOUT = float(os.getenv('DISCORD_HTTP_READ_TIMEOUT', '10'))
+
+# Announcements published or expired per transaction by the
+# run_announcement_schedule worker
+ANNOUNCEMENT_SCHEDULE_BATCH_SIZE = int(os.getenv('ANNOUNCEMENT_SCHEDULE_BATCH_SIZE', '100'))
+
+# /api/stream/ (Server-Sent Events): messages kept for Last-Event-ID replay,
+# how far a stream may fall behind before it is closed, keep-alive interval
+# and how long a stream stays open before the client is made to reconnect
+STREAM_BUFFER_SIZE = int(os.getenv('STREAM_BUFFER_SIZE', '1000'))
+STREAM_MAX_PENDING = int(os.getenv('STREAM_MAX_PENDING', '256'))
+STREAM_HEARTBEAT_SECONDS = int(os.getenv('STREAM_HEARTBEAT_SECONDS', '15'))
+STREAM_MAX_SECONDS = int(os.getenv('STREAM_MAX_SECONDS', '300'))
+
+# Spread RSVP counter updates over this many shard rows per event to avoid
+# hot-row lock contention (0 = update Event.rsvp_count directly)
+RSVP_COUNTER_SHARDS = int(os.getenv('RSVP_COUNTER_SHARDS', '0'))
+
+# Cursor pagination on list endpoints, opted into with ?limit= or ?cursor=
+# (?limit= is capped at the max; a bare ?cursor= pages by the default)
+API_PAGE_SIZE_DEFAULT = int(os.getenv('API_PAGE_SIZE_DEFAULT', '100'))
+API_PAGE_SIZE_MAX = int(os.getenv('API_PAGE_SIZE_MAX', '500'))
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
@@ -4,6 +4,7 @@ URL Configuration for CS Club backend.
 from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
+from api.middleware.route_policies import SYSTEM
 
 def health_check(request):
     return JsonResponse({'status': 'ok', 'message': 'CS Club API is running'})
@@ -13,4 +14,10 @@ urlpatterns = [
     path('health/', health_check, name='health_check'),
     path('health', health_check, name='health_check'),
     path('api/', include('api.urls')),
-] 
\ No newline at end of file
+]
+
+# Auth policy per route (or include namespace), enforced by ClerkAuthMiddleware
+auth_policies = {
+    'health_check': SYSTEM,
+    'admin': SYSTEM,
+}
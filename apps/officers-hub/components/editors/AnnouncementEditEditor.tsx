@@ -116,7 +116,7 @@ export default function AnnouncementEditEditor() {
   const loadAnnouncement = async (id: number) => {
     try {
       setIsLoading(true);
-      const announcement = await api.announcements.getById(id.toString());
+      const announcement = await api.announcements.getByIdAdmin(id.toString());
       
       setContent(announcement.content);
       setDisplayText(announcement.displayText || "");
@@ -6,16 +6,22 @@ import { HttpTransport } from './transport/http-transport';
 import { EventsResource } from './resources/events';
 import { AnnouncementsResource } from './resources/announcements';
 import { OfficersResource } from './resources/officers';
+import { FeedResource } from './resources/feed';
+import { SearchResource } from './resources/search';
 
 export class ClubApiClient {
     readonly events: EventsResource;
     readonly announcements: AnnouncementsResource;
     readonly officers: OfficersResource;
+    readonly feed: FeedResource;
+    readonly search: SearchResource;
 
     constructor(private transport: HttpTransport) {
         this.events = new EventsResource(transport);
         this.announcements = new AnnouncementsResource(transport);
         this.officers = new OfficersResource(transport);
+        this.feed = new FeedResource(transport);
+        this.search = new SearchResource(transport);
     }
 }
 
@@ -57,7 +63,13 @@ export type {
     EventFilters,
     AnnouncementFilters,
     OfficerFilters,
-    PaginationParams
+    PaginationParams,
+    CursorPage,
+    FeedParams,
+    SearchParams
 } from '@club-website/api-contracts';
 
+export type { Feed } from './resources/feed';
+export type { SearchResult, SearchSuggestion } from './resources/search';
+
 export { ApiError } from '@club-website/api-contracts';
\ No newline at end of file
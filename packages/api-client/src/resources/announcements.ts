@@ -4,7 +4,8 @@ import type {
     UpdateAnnouncementRequest,
     PinAnnouncementRequest,
     AnnouncementResponse,
-    AnnouncementFilters
+    AnnouncementFilters,
+    CursorPage
 } from '@club-website/api-contracts';
 import type { HttpTransport } from '../transport/http-transport';
 import { transformAnnouncementResponse } from '../transforms/announcements';
@@ -25,6 +26,14 @@ export class AnnouncementsResource {
         return response.map(transformAnnouncementResponse);
     }
 
+    /**
+     * Get one page of published announcements; pass `limit`, then the
+     * returned `nextCursor` as `cursor` until it is null
+     */
+    async getPage(filters?: AnnouncementFilters): Promise<CursorPage<Announcement>> {
+        return this.fetchPage('/announcements/', filters);
+    }
+
     /**
      * Get all announcements including drafts (for officers hub)
      */
@@ -36,13 +45,29 @@ export class AnnouncementsResource {
     }
 
     /**
-     * Get a single announcement by ID
+     * Get one page of announcements including drafts (for officers hub);
+     * follow `nextCursor` as with getPage
+     */
+    async getPageAdmin(filters?: AnnouncementFilters): Promise<CursorPage<Announcement>> {
+        return this.fetchPage('/announcements/admin/', filters);
+    }
+
+    /**
+     * Get a single published announcement by ID
      */
     async getById(id: string): Promise<Announcement> {
         const response = await this.transport.get<AnnouncementResponse>(`/announcements/${id}/`);
         return transformAnnouncementResponse(response);
     }
 
+    /**
+     * Get a single announcement by ID, including drafts (for officers hub)
+     */
+    async getByIdAdmin(id: string): Promise<Announcement> {
+        const response = await this.transport.get<AnnouncementResponse>(`/announcements/admin/${id}/`);
+        return transformAnnouncementResponse(response);
+    }
+
     /**
      * Create a new announcement
      */
@@ -86,4 +111,11 @@ export class AnnouncementsResource {
         });
         return transformAnnouncementResponse(response);
     }
+
+    private async fetchPage(path: string, filters?: AnnouncementFilters): Promise<CursorPage<Announcement>> {
+        const page = await this.transport.getPage<AnnouncementResponse>(path, {
+            params: filters
+        });
+        return { items: page.items.map(transformAnnouncementResponse), nextCursor: page.nextCursor };
+    }
 }
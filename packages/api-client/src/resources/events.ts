@@ -2,10 +2,16 @@ import type { Event, RSVP } from '@club-website/domain-types';
 import type {
     CreateEventRequest,
     UpdateEventRequest,
+    UpdateOccurrenceRequest,
     CreateRSVPRequest,
     EventResponse,
+    EventOccurrenceResponse,
+    EventImportResponse,
     RSVPResponse,
-    EventFilters
+    EventFilters,
+    OccurrenceFilters,
+    EventRangeParams,
+    CursorPage
 } from '@club-website/api-contracts';
 import type { HttpTransport } from '../transport/http-transport';
 import { transformEventResponse, transformRSVPResponse } from '../transforms/events';
@@ -23,6 +29,17 @@ export class EventsResource {
         return response.map(transformEventResponse);
     }
 
+    /**
+     * Get one page of events; pass `limit`, then the returned `nextCursor`
+     * as `cursor` until it is null
+     */
+    async getPage(filters?: EventFilters): Promise<CursorPage<Event>> {
+        const page = await this.transport.getPage<EventResponse>('/events/', {
+            params: filters
+        });
+        return { items: page.items.map(transformEventResponse), nextCursor: page.nextCursor };
+    }
+
     /**
      * Get upcoming events
      */
@@ -71,6 +88,20 @@ export class EventsResource {
         return transformEventResponse(response);
     }
 
+    /**
+     * Bulk-create events from CSV or NDJSON text; invalid rows are reported, not created
+     */
+    async importEvents(
+        content: string,
+        format: 'csv' | 'ndjson',
+        options: { dryRun?: boolean } = {}
+    ): Promise<EventImportResponse> {
+        return this.transport.post<EventImportResponse>('/events/import/', content, {
+            params: { file_format: format, dry_run: options.dryRun || undefined },
+            headers: { 'Content-Type': format === 'csv' ? 'text/csv' : 'application/x-ndjson' }
+        });
+    }
+
     /**
      * Delete an event
      */
@@ -78,6 +109,56 @@ export class EventsResource {
         await this.transport.delete(`/events/${id}/delete/`);
     }
 
+    /**
+     * Get event occurrences (instances of recurring events included) in time order
+     */
+    async getOccurrences(filters?: OccurrenceFilters): Promise<EventOccurrenceResponse[]> {
+        return this.transport.get<EventOccurrenceResponse[]>('/events/occurrences/', {
+            params: filters
+        });
+    }
+
+    /**
+     * Get one page of event occurrences; follow `nextCursor` as with getPage
+     */
+    async getOccurrencesPage(filters?: OccurrenceFilters): Promise<CursorPage<EventOccurrenceResponse>> {
+        return this.transport.getPage<EventOccurrenceResponse>('/events/occurrences/', {
+            params: filters
+        });
+    }
+
+    /**
+     * Get every occurrence overlapping a month, week or start/end window
+     */
+    async getRange(params: EventRangeParams): Promise<EventOccurrenceResponse[]> {
+        return this.transport.get<EventOccurrenceResponse[]>('/events/range/', {
+            params
+        });
+    }
+
+    /**
+     * Get the occurrences of one event
+     */
+    async getEventOccurrences(eventId: string, filters?: OccurrenceFilters): Promise<EventOccurrenceResponse[]> {
+        return this.transport.get<EventOccurrenceResponse[]>(`/events/${eventId}/occurrences/`, {
+            params: filters
+        });
+    }
+
+    /**
+     * Move, cancel or restore one occurrence of a recurring event
+     */
+    async updateOccurrence(
+        eventId: string,
+        occurrenceId: number,
+        request: UpdateOccurrenceRequest
+    ): Promise<EventOccurrenceResponse> {
+        return this.transport.patch<EventOccurrenceResponse>(
+            `/events/${eventId}/occurrences/${occurrenceId}/update/`,
+            request
+        );
+    }
+
     /**
      * Create an RSVP for an event
      */
@@ -0,0 +1,32 @@
+import type { Event, Announcement, Officer } from '@club-website/domain-types';
+import type { FeedResponse, FeedParams } from '@club-website/api-contracts';
+import type { HttpTransport } from '../transport/http-transport';
+import { transformEventResponse } from '../transforms/events';
+import { transformAnnouncementResponse } from '../transforms/announcements';
+import { transformOfficerResponse } from '../transforms/officers';
+
+export interface Feed {
+    upcomingEvents: Event[];
+    pinnedAnnouncements: Announcement[];
+    announcements: Announcement[];
+    officers: Officer[];
+}
+
+export class FeedResource {
+    constructor(private transport: HttpTransport) {}
+
+    /**
+     * Get the homepage feed (upcoming events, announcements and officers) in one request
+     */
+    async get(params?: FeedParams): Promise<Feed> {
+        const response = await this.transport.get<FeedResponse>('/feed/', {
+            params
+        });
+        return {
+            upcomingEvents: response.upcoming_events.map(transformEventResponse),
+            pinnedAnnouncements: response.pinned_announcements.map(transformAnnouncementResponse),
+            announcements: response.announcements.map(transformAnnouncementResponse),
+            officers: response.officers.map(transformOfficerResponse)
+        };
+    }
+}
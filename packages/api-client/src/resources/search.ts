@@ -0,0 +1,40 @@
+import type {
+    SearchParams,
+    SearchResultResponse,
+    SearchSuggestionResponse
+} from '@club-website/api-contracts';
+import type { HttpTransport } from '../transport/http-transport';
+
+export interface SearchResult {
+    type: SearchResultResponse['type'];
+    id: string;
+    title: string;
+    excerpt: string;
+    rank: number;
+}
+
+export type SearchSuggestion = Omit<SearchResult, 'excerpt'>;
+
+export class SearchResource {
+    constructor(private transport: HttpTransport) {}
+
+    /**
+     * Ranked search across events, announcements and officers
+     */
+    async query(q: string, params?: SearchParams): Promise<SearchResult[]> {
+        const response = await this.transport.get<SearchResultResponse[]>('/search/', {
+            params: { q, ...params }
+        });
+        return response.map(result => ({ ...result, id: result.id.toString() }));
+    }
+
+    /**
+     * Typo-tolerant title suggestions for a search box
+     */
+    async autocomplete(q: string, params?: SearchParams): Promise<SearchSuggestion[]> {
+        const response = await this.transport.get<SearchSuggestionResponse[]>('/search/autocomplete/', {
+            params: { q, ...params }
+        });
+        return response.map(suggestion => ({ ...suggestion, id: suggestion.id.toString() }));
+    }
+}
@@ -8,9 +8,13 @@ export function transformAnnouncementResponse(response: AnnouncementResponse): A
     return {
         id: response.id.toString(),
         content: response.content,
+        contentHtml: response.content_html,
+        excerpt: response.excerpt,
         displayText: response.display_text || undefined,
         isPinned: response.pinned,
         isDraft: response.is_draft,
+        publishAt: response.publish_at ? new Date(response.publish_at) : undefined,
+        expiresAt: response.expires_at ? new Date(response.expires_at) : undefined,
         discordMessageId: response.discord_message_id || undefined,
         createdAt: new Date(response.created_at),
         updatedAt: new Date(response.updated_at)
@@ -1,4 +1,4 @@
-import { ApiError, type ApiErrorResponse } from '@club-website/api-contracts';
+import { ApiError, type ApiErrorResponse, type CursorPage } from '@club-website/api-contracts';
 
 export interface TransportOptions {
     baseUrl?: string;
@@ -14,11 +14,25 @@ export interface RequestOptions {
     retries?: number;
 }
 
+interface TransportResponse<T> {
+    body: T;
+    // X-Next-Cursor of a cursor-paginated list response
+    nextCursor: string | null;
+}
+
+interface CachedResponse extends TransportResponse<unknown> {
+    etag: string;
+}
+
+// Max GET responses kept for conditional requests (If-None-Match)
+const ETAG_CACHE_SIZE = 100;
+
 export class HttpTransport {
     private baseUrl: string;
     private defaultTimeout: number;
     private defaultRetries: number;
     private getToken?: () => Promise<string | null>;
+    private etagCache = new Map<string, CachedResponse>();
 
     constructor(options: TransportOptions = {}) {
         this.baseUrl = (options.baseUrl || 'http://localhost:8000/api').replace(/\/$/, '');
@@ -31,6 +45,15 @@ export class HttpTransport {
         return this.request<T>('GET', path, undefined, options);
     }
 
+    /**
+     * GET one page of a cursor-paginated list; pass `limit` and/or `cursor`
+     * in `options.params` (without either the server returns the whole list)
+     */
+    async getPage<T>(path: string, options?: RequestOptions): Promise<CursorPage<T>> {
+        const { body, nextCursor } = await this.send<T[]>('GET', path, undefined, options);
+        return { items: body, nextCursor };
+    }
+
     async post<T>(path: string, body?: any, options?: RequestOptions): Promise<T> {
         return this.request<T>('POST', path, body, options);
     }
@@ -51,8 +74,17 @@ export class HttpTransport {
         method: string,
         path: string,
         body?: any,
-        options: RequestOptions = {}
+        options?: RequestOptions
     ): Promise<T> {
+        return (await this.send<T>(method, path, body, options)).body;
+    }
+
+    private async send<T>(
+        method: string,
+        path: string,
+        body?: any,
+        options: RequestOptions = {}
+    ): Promise<TransportResponse<T>> {
         const url = this.buildUrl(path, options.params);
         const token = this.getToken ? await this.getToken() : null;
         
@@ -62,6 +94,11 @@ export class HttpTransport {
             ...options.headers
         };
 
+        const cached = method === 'GET' ? this.etagCache.get(url) : undefined;
+        if (cached) {
+            headers['If-None-Match'] = cached.etag;
+        }
+
         const timeout = options.timeout || this.defaultTimeout;
         const retries = options.retries ?? this.defaultRetries;
 
@@ -75,18 +112,31 @@ export class HttpTransport {
                 const response = await fetch(url, {
                     method,
                     headers,
-                    body: body ? JSON.stringify(body) : undefined,
+                    // Strings are sent as-is (e.g. CSV uploads, with a Content-Type header)
+                    body: typeof body === 'string' ? body : body ? JSON.stringify(body) : undefined,
                     signal: controller.signal
                 });
 
                 clearTimeout(timeoutId);
 
+                // Unchanged since the cached copy: the server skipped the query
+                if (response.status === 304 && cached) {
+                    return cached as TransportResponse<T>;
+                }
+
                 if (!response.ok) {
                     const errorData = await this.parseErrorResponse(response);
                     throw ApiError.fromResponse(errorData, response.status);
                 }
 
-                return await this.parseResponse<T>(response);
+                const result: TransportResponse<T> = {
+                    body: await this.parseResponse<T>(response),
+                    nextCursor: response.headers.get('x-next-cursor')
+                };
+                if (method === 'GET') {
+                    this.rememberResponse(url, response.headers.get('etag'), result);
+                }
+                return result;
             } catch (error) {
                 lastError = error as Error;
 
@@ -106,6 +156,17 @@ export class HttpTransport {
         throw lastError || new ApiError('Network error', 0, 'NETWORK_ERROR');
     }
 
+    private rememberResponse(url: string, etag: string | null, result: TransportResponse<unknown>): void {
+        this.etagCache.delete(url);
+        if (!etag) return;
+
+        this.etagCache.set(url, { ...result, etag });
+        if (this.etagCache.size > ETAG_CACHE_SIZE) {
+            const oldest = this.etagCache.keys().next().value;
+            if (oldest !== undefined) this.etagCache.delete(oldest);
+        }
+    }
+
     private buildUrl(path: string, params?: Record<string, any>): string {
         const url = `${this.baseUrl}${path}`;
         if (!params) return url;
@@ -10,7 +10,21 @@ export interface EventFilters {
     date_to?: string;
     location?: string;
     page?: number;
+    /** Page size; with `cursor`, opts into cursor pagination (see CursorPage) */
     limit?: number;
+    cursor?: string;
+}
+
+export interface OccurrenceFilters extends EventFilters {
+    include_cancelled?: boolean;
+}
+
+export interface EventRangeParams extends OccurrenceFilters {
+    // One of: month, week, or start + end (at most EVENT_RANGE_MAX_DAYS apart)
+    month?: string; // YYYY-MM
+    week?: string; // ISO week, e.g. 2025-W07
+    start?: string;
+    end?: string;
 }
 
 export interface AnnouncementFilters {
@@ -18,7 +32,9 @@ export interface AnnouncementFilters {
     is_draft?: boolean;
     search?: string;
     page?: number;
+    /** Page size; with `cursor`, opts into cursor pagination (see CursorPage) */
     limit?: number;
+    cursor?: string;
 }
 
 export interface OfficerFilters {
@@ -27,6 +43,30 @@ export interface OfficerFilters {
     limit?: number;
 }
 
+export interface FeedParams {
+    /** Number of upcoming events (default 3, max 20) */
+    events?: number;
+    /** Number of latest announcements (default 5, max 20) */
+    announcements?: number;
+}
+
+export interface SearchParams {
+    type?: Array<'event' | 'announcement' | 'officer'>;
+    limit?: number;
+}
+
+/**
+ * Sparse fieldsets for read endpoints: only the listed response fields are
+ * returned; relations listed in `expand` are nested objects instead of ids.
+ * `view` picks a preset field list instead of `fields` (announcements:
+ * `compact`, see AnnouncementCompactResponse).
+ */
+export interface FieldsetParams {
+    fields?: string[];
+    expand?: string[];
+    view?: string;
+}
+
 export interface PaginationParams {
     page?: number;
     limit?: number;
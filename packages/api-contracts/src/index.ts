@@ -6,6 +6,7 @@
 export type {
     CreateEventRequest,
     UpdateEventRequest,
+    UpdateOccurrenceRequest,
     CreateRSVPRequest
 } from './requests/events';
 
@@ -24,11 +25,14 @@ export type {
 export type {
     EventResponse,
     EventListResponse,
+    EventOccurrenceResponse,
+    EventImportResponse,
     RSVPResponse
 } from './responses/events';
 
 export type {
     AnnouncementResponse,
+    AnnouncementCompactResponse,
     AnnouncementListResponse
 } from './responses/announcements';
 
@@ -37,11 +41,32 @@ export type {
     OfficerListResponse
 } from './responses/officers';
 
+export type { FeedResponse } from './responses/feed';
+
+export type { CursorPage } from './responses/pagination';
+
+export type {
+    SearchResultType,
+    SearchResultResponse,
+    SearchSuggestionResponse
+} from './responses/search';
+
+export type {
+    StreamTopic,
+    StreamEventMap,
+    StreamEventName
+} from './responses/stream';
+
 // Filters
 export type {
     EventFilters,
+    OccurrenceFilters,
+    EventRangeParams,
     AnnouncementFilters,
     OfficerFilters,
+    FeedParams,
+    SearchParams,
+    FieldsetParams,
     PaginationParams
 } from './filters';
 
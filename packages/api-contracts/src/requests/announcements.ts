@@ -7,6 +7,8 @@ export interface CreateAnnouncementRequest {
     display_text?: string;
     pinned?: boolean;
     is_draft?: boolean;
+    publish_at?: string | null;
+    expires_at?: string | null;
 }
 
 export interface UpdateAnnouncementRequest {
@@ -14,6 +16,8 @@ export interface UpdateAnnouncementRequest {
     display_text?: string;
     pinned?: boolean;
     is_draft?: boolean;
+    publish_at?: string | null;
+    expires_at?: string | null;
 }
 
 export interface PinAnnouncementRequest {
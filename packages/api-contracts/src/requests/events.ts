@@ -11,6 +11,7 @@ export interface CreateEventRequest {
     meeting_link?: string;
     slides_url?: string;
     recording_url?: string;
+    recurrence_rule?: string;
 }
 
 export interface UpdateEventRequest {
@@ -22,10 +23,18 @@ export interface UpdateEventRequest {
     meeting_link?: string;
     slides_url?: string;
     recording_url?: string;
+    recurrence_rule?: string | null;
+}
+
+export interface UpdateOccurrenceRequest {
+    start_at?: string;
+    end_at?: string;
+    is_cancelled?: boolean;
 }
 
 export interface CreateRSVPRequest {
     name: string;
     email: string;
     comment?: string;
+    occurrence?: number; // Required for recurring events
 }
@@ -5,14 +5,27 @@
 export interface AnnouncementResponse {
     id: number;
     content: string;
+    // Rendered from `content` at write time: sanitized HTML and a plain-text excerpt
+    content_html: string;
+    excerpt: string;
     display_text: string | null;
     pinned: boolean;
     is_draft: boolean;
+    // Scheduled go-live and take-down times (ISO 8601); publish_at is cleared once published
+    publish_at: string | null;
+    expires_at: string | null;
     discord_message_id: string | null;
     created_at: string;
     updated_at: string;
 }
 
+// ?view=compact on the list endpoints: no content or content_html, which
+// only GET /announcements/<id>/ returns
+export interface AnnouncementCompactResponse extends Pick<AnnouncementResponse,
+    'id' | 'excerpt' | 'display_text' | 'pinned' | 'is_draft' | 'publish_at' | 'expires_at' | 'created_at' | 'updated_at'> {
+    content_length: number;
+}
+
 export interface AnnouncementListResponse {
     announcements: AnnouncementResponse[];
     total: number;
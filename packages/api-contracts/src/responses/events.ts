@@ -34,6 +34,12 @@ export interface EventResponse {
     rsvp_count: number;
     editable_fields: string[];
     
+    // RFC 5545 RRULE value (e.g. "FREQ=WEEKLY;COUNT=10"); null for one-off events
+    recurrence_rule: string | null;
+    
+    // Other events double-booking this location; only on create/update with ?check_conflicts=true
+    conflicts?: EventOccurrenceResponse[];
+    
     // Legacy field for backward compatibility
     event_date: string;
 }
@@ -45,9 +51,40 @@ export interface EventListResponse {
     limit: number;
 }
 
+export interface EventOccurrenceResponse {
+    id: number;
+    event: number;
+    title: string;
+    description: string | null;
+    location: string | null;
+    meeting_link: string | null;
+    start_at: string;
+    end_at: string;
+    original_start_at: string;
+    status: 'upcoming' | 'ongoing' | 'past';
+    is_upcoming: boolean;
+    is_ongoing: boolean;
+    is_past: boolean;
+    can_rsvp: boolean;
+    is_cancelled: boolean;
+    is_exception: boolean;
+    rsvp_count: number;
+}
+
+export interface EventImportResponse {
+    dry_run: boolean;
+    rows: number;
+    valid: number;
+    created: number;
+    ids: number[];
+    // Row numbers count from 1, not counting a CSV header
+    errors: { row: number; errors: Record<string, string[]> }[];
+}
+
 export interface RSVPResponse {
     id: number;
     event: number;
+    occurrence: number | null;
     event_title: string;
     event_date: string;
     name: string;
@@ -0,0 +1,14 @@
+/**
+ * API response contract for the homepage feed
+ */
+
+import type { EventResponse } from './events';
+import type { AnnouncementResponse } from './announcements';
+import type { OfficerResponse } from './officers';
+
+export interface FeedResponse {
+    upcoming_events: EventResponse[];
+    pinned_announcements: AnnouncementResponse[];
+    announcements: AnnouncementResponse[];
+    officers: OfficerResponse[];
+}
@@ -0,0 +1,13 @@
+/**
+ * Cursor-paginated list contract
+ */
+
+/**
+ * One page of a list endpoint fetched with `limit` and/or `cursor`. The
+ * response body is the plain item array; the next page's cursor comes from
+ * the `X-Next-Cursor` header and is null on the last page.
+ */
+export interface CursorPage<T> {
+    items: T[];
+    nextCursor: string | null;
+}
@@ -0,0 +1,20 @@
+/**
+ * API response contracts for search
+ */
+
+export type SearchResultType = 'event' | 'announcement' | 'officer';
+
+export interface SearchResultResponse {
+    type: SearchResultType;
+    id: number;
+    title: string;
+    excerpt: string;
+    rank: number;
+}
+
+export interface SearchSuggestionResponse {
+    type: SearchResultType;
+    id: number;
+    title: string;
+    rank: number;
+}
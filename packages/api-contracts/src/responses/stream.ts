@@ -0,0 +1,31 @@
+/**
+ * API response contracts for the live change stream (GET /api/stream/, Server-Sent Events)
+ * Only served when the API runs under ASGI; otherwise the endpoint answers 503.
+ */
+
+export type StreamTopic = 'announcements' | 'events' | 'rsvps';
+
+// Message `event` names with their `data` payloads. Notices only; refetch what you show.
+export interface StreamEventMap {
+    'announcement.published': { id: number; pinned: boolean };
+    'announcement.pinned': { id: number; pinned: boolean };
+    'announcement.updated': { id: number };
+    'announcement.removed': { id: number };
+    'event.created': { id: number };
+    'event.updated': { id: number };
+    // Whole event rescheduled, or a single occurrence (with occurrence_id) moved or cancelled
+    'event.moved': {
+        id: number;
+        occurrence_id?: number;
+        start_at?: string;
+        end_at?: string;
+        is_cancelled?: boolean;
+    };
+    'event.deleted': { id: number };
+    'event.imported': { count: number };
+    'rsvp.count': { event_id: number; occurrence_id: number | null; change: number };
+    // Missed messages are no longer available (or the server restarted): refetch everything
+    'reset': Record<string, never>;
+}
+
+export type StreamEventName = keyof StreamEventMap;
@@ -1,9 +1,13 @@
 export interface Announcement {
     readonly id: string;
     readonly content: string;
+    readonly contentHtml: string;
+    readonly excerpt: string;
     readonly displayText?: string;
     readonly isPinned: boolean;
     readonly isDraft: boolean;
+    readonly publishAt?: Date;
+    readonly expiresAt?: Date;
     readonly discordMessageId?: string;
     readonly createdAt: Date;
     readonly updatedAt: Date;